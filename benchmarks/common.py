@@ -0,0 +1,137 @@
+"""
+벤치마크 공통 도구
+
+- load_kisti_mcp(): 임시 캐시 디렉터리·더미 자격증명으로 kisti_mcp를 임포트
+  (사용자 캐시/토큰/쿼터 파일을 건드리지 않고, 모듈 수준 클라이언트의 파서를 그대로 사용)
+- *_page(): 실제 응답 구조를 본뜬 합성 응답 본문 (bytes)
+- timed(): 평균 실행 시간(ms)과 1회 실행 최대 할당량(KiB)
+"""
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+DUMMY_CREDENTIALS = {
+    "SCIENCEON_API_KEY": "0123456789abcdef",
+    "SCIENCEON_CLIENT_ID": "bench",
+    "SCIENCEON_MAC_ADDRESS": "00-00-00-00-00-00",
+    "NTIS_API_KEY": "bench",
+    "DataON_ResearchData_API_KEY": "bench",
+    "DataON_ResearchDataMetadata_API_KEY": "bench",
+}
+
+
+def load_kisti_mcp(log_level: int = logging.WARNING):
+    """격리된 환경에서 kisti_mcp 임포트 (로그 레코드는 log_level로 만들되 출력은 버림)"""
+    os.environ["KISTI_MCP_CACHE_DIR"] = tempfile.mkdtemp(prefix="kisti-mcp-bench-")
+    os.environ.setdefault("KISTI_DETAIL_CACHE", "off")
+    for key, value in DUMMY_CREDENTIALS.items():
+        os.environ.setdefault(key, value)
+    # 모듈의 basicConfig보다 먼저 루트 로거를 잡아 둔다 (로그 포맷 비용은 그대로, 출력만 버림)
+    logging.basicConfig(level=log_level, stream=open(os.devnull, "w"))
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    import kisti_mcp
+    return kisti_mcp
+
+
+def timed(func, repeat: int = 50) -> tuple:
+    """(평균 ms, 최대 할당 KiB)"""
+    func()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    elapsed = (time.perf_counter() - started) / repeat * 1000
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak / 1024
+
+
+SCIENCEON_FIELDS = ("Publisher", "VolNo", "Issue", "Pages", "ISSN", "ISBN", "DOI", "Language",
+                    "FulltextFlag", "FulltextURL", "MobileURL", "PubDate", "Affiliation")
+
+
+def scienceon_page(records: int = 100, target: str = "ARTI") -> bytes:
+    """ScienceON openapicall.do 검색 응답 (레코드당 20여 개 metaCode, 긴 초록)"""
+    items = "".join(
+        f'<record rownum="{i}">'
+        f'<item metaCode="CN">CN{i:08d}</item>'
+        f'<item metaCode="Title"><![CDATA[{target} 합성 레코드 {i} 제목]]></item>'
+        f'<item metaCode="Author"><![CDATA[홍길동;김철수;이영희]]></item>'
+        f'<item metaCode="Pubyear">2024</item>'
+        f'<item metaCode="JournalName"><![CDATA[한국정보과학회논문지]]></item>'
+        f'<item metaCode="Abstract"><![CDATA[{"연구 초록 문장입니다. " * 60}]]></item>'
+        f'<item metaCode="Keyword"><![CDATA[인공지능;데이터;검색]]></item>'
+        f'<item metaCode="ContentURL">https://scienceon.kisti.re.kr/{i}</item>'
+        + "".join(f'<item metaCode="{code}">{code}-{i}</item>' for code in SCIENCEON_FIELDS)
+        + '</record>'
+        for i in range(records))
+    return (f'<?xml version="1.0" encoding="UTF-8"?><MetaData><resultSummary>'
+            f'<statusCode>200</statusCode></resultSummary><recordList>'
+            f'<TotalCount>{records * 10}</TotalCount>{items}</recordList></MetaData>').encode()
+
+
+def ntis_project_hit(i: int) -> str:
+    """NTIS 과제검색(public_project/projectAllSearch) HIT 하나"""
+    return (
+        f"<HIT><ProjectNumber>{1711000000 + i}</ProjectNumber>"
+        f"<ProjectTitle><Korean>과제 {i} &amp; 인공지능 기반 연구</Korean>"
+        f"<English>Project {i}</English></ProjectTitle>"
+        f"<Manager><Name>홍길동</Name></Manager>"
+        f"<Researchers><Name>김철수;이영희</Name><ManCount>3</ManCount><WomanCount>1</WomanCount></Researchers>"
+        f"<ResearchAgency><Name>한국과학기술정보연구원</Name></ResearchAgency>"
+        f"<OrderAgency><Name>과학기술정보통신부</Name></OrderAgency>"
+        f"<BudgetProject><Name>기초연구사업</Name></BudgetProject><Ministry><Name>과기정통부</Name></Ministry>"
+        f"<ProjectYear>2024</ProjectYear>"
+        f"<ProjectPeriod><Start>20240101</Start><End>20241231</End>"
+        f"<TotalStart>20230101</TotalStart><TotalEnd>20261231</TotalEnd></ProjectPeriod>"
+        f"<GovernmentFunds>{i * 1000000}</GovernmentFunds><TotalFunds>{i * 1200000}</TotalFunds>"
+        f"<Goal><Full>{'연구 목표 문장입니다. ' * 60}</Full><Teaser>목표 요약</Teaser></Goal>"
+        f"<Abstract><Full>{'연구 내용 문장입니다. ' * 150}</Full><Teaser>초록 요약</Teaser></Abstract>"
+        f"<Effect><Full>{'기대 효과 문장입니다. ' * 60}</Full><Teaser>효과 요약</Teaser></Effect>"
+        f"<Keyword><Korean>인공지능,검색</Korean><English>AI,search</English></Keyword>"
+        f'<ScienceClass type="new" sequence="1"><Large>정보/통신</Large><Medium>소프트웨어</Medium></ScienceClass>'
+        f'<ScienceClass type="old" sequence="1"><Large>정보</Large></ScienceClass>'
+        f"</HIT>")
+
+
+def ntis_project_page(hits: int = 100) -> bytes:
+    body = "".join(ntis_project_hit(i) for i in range(hits))
+    return (f'<?xml version="1.0" encoding="UTF-8"?><RESULT><TOTALHITS>{hits * 10}</TOTALHITS>'
+            f'<RESULTSET>{body}</RESULTSET></RESULT>').encode()
+
+
+def ntis_outcome_page(hits: int = 100) -> bytes:
+    """NTIS 성과검색(논문) 응답 (HIT는 평면 필드 + 한/영 중첩)"""
+    body = "".join(
+        f"<HIT><ResultNumber>{2024000000 + i}</ResultNumber><ProjectNumber>{1711000000 + i}</ProjectNumber>"
+        f"<ResultTitle><Korean>성과 {i} 논문 제목</Korean><English>Outcome {i}</English></ResultTitle>"
+        f"<ResultType>논문</ResultType><PublicationYear>2024</PublicationYear>"
+        f"<Author>홍길동;김철수</Author><JournalName>한국정보과학회논문지</JournalName>"
+        f"<ResearchAgency><Name>한국과학기술정보연구원</Name></ResearchAgency>"
+        f"<Abstract><Full>{'성과 요약 문장입니다. ' * 40}</Full></Abstract>"
+        f"<SCI>Y</SCI><DOI>10.0000/bench.{i}</DOI></HIT>"
+        for i in range(hits))
+    return (f'<?xml version="1.0" encoding="UTF-8"?><RESULT><TOTALHITS>{hits * 10}</TOTALHITS>'
+            f'<RESULTSET>{body}</RESULTSET></RESULT>').encode()
+
+
+def dataon_page(records: int = 100) -> bytes:
+    """DataON 연구데이터 검색 응답 (JSON)"""
+    rows = [{
+        "svc_id": f"SVC{i:08d}",
+        "dataset_title_kor": f"합성 연구데이터 {i}",
+        "dataset_creator_kor": ["홍길동", "김철수"],
+        "dataset_pblshr": ["KISTI"],
+        "dataset_expl_kor": "연구데이터 설명 문장입니다. " * 100,
+        "dataset_kywd_kor": "인공지능,데이터",
+        "file_frmt_pc": ["csv", "json"],
+        "dataset_pub_dt_pc": "2024-01-01",
+    } for i in range(records)]
+    return json.dumps({"response": {"total count": records * 10}, "records": rows},
+                      ensure_ascii=False).encode()
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+HTTP/1.1 vs HTTP/2 처리량 벤치마크 ({PLATFORM}_HTTP2)
+
+로컬 TLS 테스트 서버(ALPN h2/http/1.1, 응답마다 --delay 지연)를 띄우고
+BaseAPIClient의 공유 커넥션 풀(_get_http_client)로 팬아웃 요청을 보내
+두 모드의 처리량·지연·TCP 연결 수를 비교한다.
+
+필요: h2 패키지, openssl CLI (자체 서명 인증서 생성)
+
+    uv run --with h2 python benchmarks/http2_throughput.py
+    uv run --with h2 python benchmarks/http2_throughput.py --requests 1000 --concurrency 100
+"""
+import argparse
+import asyncio
+import os
+import ssl
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import h2.config
+import h2.connection
+import h2.events
+import h2.settings
+
+# 벤치마크가 사용자 캐시 디렉터리(상세 캐시·토큰·쿼터 파일)를 건드리지 않도록 격리
+_WORKDIR = tempfile.mkdtemp(prefix="kisti-mcp-bench-")
+os.environ["KISTI_MCP_CACHE_DIR"] = _WORKDIR
+os.environ.setdefault("KISTI_DETAIL_CACHE", "off")
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import kisti_mcp  # noqa: E402
+
+H2_PREFACE_SETTINGS = {h2.settings.SettingCodes.MAX_CONCURRENT_STREAMS: 1000}
+
+
+class BenchClient(kisti_mcp.BaseAPIClient):
+    """커넥션 풀만 쓰는 벤치마크용 클라이언트 (BENCH_HTTP2로 모드 전환)"""
+
+    PLATFORM = "BENCH"
+
+    async def get_token(self) -> bool:
+        return True
+
+    async def search(self, query: str, target: str, max_results: int = 10):
+        return {}
+
+
+class TestServer:
+    """ALPN으로 h2/http/1.1을 고르는 TLS 테스트 서버 (고정 XML 본문, 응답마다 지연)"""
+
+    def __init__(self, body: bytes, delay: float):
+        self.body = body
+        self.delay = delay
+        self.connections = {"h2": 0, "http/1.1": 0}
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        protocol = writer.get_extra_info("ssl_object").selected_alpn_protocol() or "http/1.1"
+        self.connections[protocol] += 1
+        try:
+            if protocol == "h2":
+                await self._serve_h2(reader, writer)
+            else:
+                await self._serve_h1(reader, writer)
+        except (ConnectionError, asyncio.IncompleteReadError, ssl.SSLError):
+            pass
+        finally:
+            writer.close()
+
+    async def _serve_h1(self, reader, writer):
+        head = (f"HTTP/1.1 200 OK\r\nContent-Type: application/xml\r\n"
+                f"Content-Length: {len(self.body)}\r\n\r\n").encode()
+        while True:
+            request = await reader.readuntil(b"\r\n\r\n")
+            if not request:
+                return
+            await asyncio.sleep(self.delay)
+            writer.write(head + self.body)
+            await writer.drain()
+
+    async def _serve_h2(self, reader, writer):
+        conn = h2.connection.H2Connection(h2.config.H2Configuration(client_side=False))
+        conn.local_settings.update(H2_PREFACE_SETTINGS)
+        conn.initiate_connection()
+        writer.write(conn.data_to_send())
+        window_open = asyncio.Event()
+        tasks = set()
+
+        async def respond(stream_id: int):
+            await asyncio.sleep(self.delay)
+            conn.send_headers(stream_id, [(":status", "200"),
+                                          ("content-type", "application/xml"),
+                                          ("content-length", str(len(self.body)))])
+            data = self.body
+            while data:
+                window = min(conn.local_flow_control_window(stream_id),
+                             conn.max_outbound_frame_size)
+                if window <= 0:
+                    window_open.clear()
+                    await window_open.wait()
+                    continue
+                chunk, data = data[:window], data[window:]
+                conn.send_data(stream_id, chunk, end_stream=not data)
+                writer.write(conn.data_to_send())
+            await writer.drain()
+
+        while True:
+            data = await reader.read(65536)
+            if not data:
+                return
+            for event in conn.receive_data(data):
+                if isinstance(event, h2.events.RequestReceived):
+                    task = asyncio.ensure_future(respond(event.stream_id))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+                elif isinstance(event, h2.events.WindowUpdated):
+                    window_open.set()
+                elif isinstance(event, h2.events.ConnectionTerminated):
+                    return
+            writer.write(conn.data_to_send())
+            await writer.drain()
+
+
+def make_certificate(workdir: str) -> tuple:
+    """localhost용 자체 서명 인증서 생성 (openssl CLI)"""
+    cert, key = os.path.join(workdir, "cert.pem"), os.path.join(workdir, "key.pem")
+    subprocess.run(["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes",
+                    "-keyout", key, "-out", cert, "-days", "1", "-subj", "/CN=localhost",
+                    "-addext", "subjectAltName=DNS:localhost"],
+                   check=True, capture_output=True)
+    return cert, key
+
+
+def make_body(records: int) -> bytes:
+    """ScienceON 검색 응답과 비슷한 크기의 XML 본문"""
+    items = "".join(
+        f'<record rownum="{i}"><item metaCode="CN">CN{i:08d}</item>'
+        f'<item metaCode="Title"><![CDATA[HTTP/2 다중화 벤치마크 레코드 {i}]]></item>'
+        f'<item metaCode="Abstract"><![CDATA[{"초록 " * 40}]]></item></record>'
+        for i in range(records))
+    return (f'<?xml version="1.0" encoding="UTF-8"?><MaxonData><recordList>{items}'
+            f'</recordList></MaxonData>').encode()
+
+
+async def run_mode(http2: bool, url: str, requests: int, concurrency: int) -> dict:
+    """한 모드로 requests건을 concurrency만큼 동시에 보내고 처리량·지연 측정"""
+    os.environ["BENCH_HTTP2"] = "1" if http2 else "0"
+    client = BenchClient(url)
+    pool = client._get_http_client()
+    latencies, versions = [], {}
+    queue = asyncio.Queue()
+    for i in range(requests):
+        queue.put_nowait(i)
+
+    async def worker():
+        while not queue.empty():
+            queue.get_nowait()
+            started = time.perf_counter()
+            response = await pool.get(url)
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - started)
+            versions[response.http_version] = versions.get(response.http_version, 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    await kisti_mcp.BaseAPIClient.close_all()
+    latencies.sort()
+    return {
+        "elapsed": elapsed,
+        "throughput": requests / elapsed,
+        "p50": statistics.median(latencies),
+        "p95": latencies[int(len(latencies) * 0.95) - 1],
+        "versions": versions,
+    }
+
+
+async def main(args):
+    cert, key = make_certificate(_WORKDIR)
+    os.environ["SSL_CERT_FILE"] = cert
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    context.load_cert_chain(cert, key)
+    context.set_alpn_protocols(["h2", "http/1.1"])
+
+    server = TestServer(make_body(args.records), args.delay)
+    listener = await asyncio.start_server(server.handle, "localhost", 0, ssl=context)
+    port = listener.sockets[0].getsockname()[1]
+    url = f"https://localhost:{port}/openapicall.do"
+
+    print(f"요청 {args.requests}건, 동시 {args.concurrency}, 서버 지연 {args.delay * 1000:.0f}ms, "
+          f"본문 {len(server.body) / 1024:.1f}KiB, "
+          f"KISTI_HTTP_MAX_CONNECTIONS={kisti_mcp.get_env_int('KISTI_HTTP_MAX_CONNECTIONS', 20)}")
+    async with listener:
+        for http2 in (False, True):
+            before = dict(server.connections)
+            result = await run_mode(http2, url, args.requests, args.concurrency)
+            opened = sum(server.connections.values()) - sum(before.values())
+            print(f"{'HTTP/2  ' if http2 else 'HTTP/1.1'}: {result['throughput']:8.1f} req/s  "
+                  f"p50 {result['p50'] * 1000:6.1f}ms  p95 {result['p95'] * 1000:6.1f}ms  "
+                  f"TCP 연결 {opened}개  응답 버전 {result['versions']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=50,
+                        help="동시 요청 수 (기본 50, 일괄 상세조회·통합 검색 팬아웃 규모)")
+    parser.add_argument("--delay", type=float, default=0.05, help="서버 응답 지연(초)")
+    parser.add_argument("--records", type=int, default=10, help="응답 XML 레코드 수")
+    asyncio.run(main(parser.parse_args()))
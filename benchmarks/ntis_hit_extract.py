@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+NTIS 과제 HIT 추출 벤치마크 (100건 응답, 필드마다 hit.find vs ElementPathTable 한 번 순회)
+
+이전 구현(reference_parse_project_hit)은 tests/test_ntis_hit_extract.py에 보존된 것을 쓴다.
+
+    python benchmarks/ntis_hit_extract.py
+    python benchmarks/ntis_hit_extract.py --hits 500 --repeat 100
+"""
+import argparse
+import sys
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+from common import load_kisti_mcp, ntis_project_page, timed
+
+kisti_mcp = load_kisti_mcp()
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tests"))
+from test_ntis_hit_extract import reference_parse_project_hit  # noqa: E402
+
+
+def main(args):
+    body = ntis_project_page(args.hits)
+    hits = ET.fromstring(body).find("RESULTSET").findall("HIT")
+    client = kisti_mcp.ntis_client
+    assert [client._parse_project_hit(h) for h in hits] == [reference_parse_project_hit(h) for h in hits]
+
+    print(f"HIT {args.hits}건 ({len(body) / 1024:.0f}KiB), 반복 {args.repeat}회")
+    for label, func in (
+        ("hit.find (이전)", lambda: [reference_parse_project_hit(h) for h in hits]),
+        ("ElementPathTable (현재)", lambda: [client._parse_project_hit(h) for h in hits]),
+        ("_parse_xml_response (응답 전체)", lambda: client._parse_xml_response(body, "PROJECT")),
+    ):
+        elapsed, peak = timed(func, args.repeat)
+        print(f"  {label:<32} {elapsed:7.2f}ms  최대 할당 {peak:6.0f}KiB")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--hits", type=int, default=100, help="응답당 HIT 수")
+    parser.add_argument("--repeat", type=int, default=200)
+    main(parser.parse_args())
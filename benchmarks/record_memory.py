@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+검색 결과 레코드 메모리 벤치마크 (CompactRecord 계열 vs 일반 dict)
+
+레코드 계열마다 --pages개 응답(응답당 --records건)을 실제 파서로 읽어 결과를 들고 있을 때
+남는 메모리(tracemalloc)를 비교한다. dict 쪽은 파싱 직후 to_dict()로 바꿔 CompactRecord를
+버리므로, 레코드를 dict로 담던 이전 표현과 같은 구성(값 문자열 + 중첩 dict)이 남는다.
+절감량은 레코드당 키 구성에 비례하므로 비율은 값(초록 등 본문) 길이에 따라 달라진다.
+
+    python benchmarks/record_memory.py
+    python benchmarks/record_memory.py --pages 50 --records 100
+"""
+import argparse
+import gc
+import tracemalloc
+
+from common import dataon_page, load_kisti_mcp, ntis_outcome_page, ntis_project_page, scienceon_page
+
+kisti_mcp = load_kisti_mcp()
+
+
+def families(records: int) -> list:
+    """(계열 이름, 응답 본문, 파서)"""
+    scienceon, ntis, dataon = kisti_mcp.scienceon_client, kisti_mcp.ntis_client, kisti_mcp.dataon_client
+    return [
+        ("PaperRecord (ScienceON 논문)", scienceon_page(records, "ARTI"),
+         lambda body: scienceon._parse_xml_response(body, "ARTI")),
+        ("PatentRecord (ScienceON 특허)", scienceon_page(records, "PATENT"),
+         lambda body: scienceon._parse_xml_response(body, "PATENT")),
+        ("ReportRecord (ScienceON 보고서)", scienceon_page(records, "REPORT"),
+         lambda body: scienceon._parse_xml_response(body, "REPORT")),
+        ("ProjectRecord (NTIS 과제)", ntis_project_page(records),
+         lambda body: ntis._parse_xml_response(body, "PROJECT")),
+        ("OutcomeRecord (NTIS 성과)", ntis_outcome_page(records),
+         lambda body: ntis._parse_xml_response(body, "OUTCOME")),
+        ("DatasetRecord (DataON)", dataon_page(records),
+         lambda body: dataon._parse_json_response(body, "RESEARCH_DATA")),
+    ]
+
+
+def as_dicts(result: dict) -> dict:
+    """결과 안의 레코드 리스트를 dict 리스트로 (같은 리스트를 가리키는 키는 계속 공유)"""
+    converted = {}
+    for key, value in result.items():
+        if isinstance(value, list) and value and isinstance(value[0], kisti_mcp.CompactRecord):
+            if id(value) not in converted:
+                converted[id(value)] = [record.to_dict() for record in value]
+            result[key] = converted[id(value)]
+    return result
+
+
+def retained(build) -> int:
+    """build()가 돌려준 객체가 붙잡고 있는 메모리 (바이트)"""
+    gc.collect()
+    tracemalloc.start()
+    kept = build()
+    gc.collect()
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return current
+
+
+def main(args):
+    print(f"계열마다 응답 {args.pages}개 × {args.records}건")
+    total_dict = total_compact = 0
+    for name, body, parse in families(args.records):
+        assert not parse(body).get("error"), f"{name} 파싱 실패"
+        as_dict = retained(lambda: [as_dicts(parse(body)) for _ in range(args.pages)])
+        compact = retained(lambda: [parse(body) for _ in range(args.pages)])
+        total_dict += as_dict
+        total_compact += compact
+        saved = (as_dict - compact) / (args.pages * args.records)
+        print(f"  {name:<30} dict {as_dict / 2**20:6.2f}MiB → compact {compact / 2**20:6.2f}MiB "
+              f"({(compact - as_dict) / as_dict:+.0%}, 레코드당 {saved:5.0f}B 절감)")
+    print(f"  {'합계':<30} dict {total_dict / 2**20:6.2f}MiB → compact {total_compact / 2**20:6.2f}MiB "
+          f"({(total_compact - total_dict) / total_dict:+.0%})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, default=10, help="계열마다 들고 있을 응답 수")
+    parser.add_argument("--records", type=int, default=100, help="응답당 레코드 수")
+    main(parser.parse_args())
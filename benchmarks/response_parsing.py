@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+응답 본문 파싱 벤치마크 (100건 응답, response.text 경로 vs response.content 경로)
+
+이전 경로: response.text 디코딩 + INFO 본문 미리보기(f-string이 로그 레벨과 무관하게 생성) + 문자열 파싱
+현재 경로: log_body()(DEBUG일 때만 디코딩) + 바이트 그대로 파싱
+응답마다 새 httpx.Response를 만든다 (.text는 객체에 캐시되므로).
+
+    python benchmarks/response_parsing.py
+    python benchmarks/response_parsing.py --records 500 --repeat 100
+"""
+import argparse
+import logging
+
+import httpx
+
+from common import dataon_page, load_kisti_mcp, ntis_project_page, timed
+
+kisti_mcp = load_kisti_mcp(logging.INFO)
+logger = kisti_mcp.logger
+
+
+def fresh(content: bytes, content_type: str) -> httpx.Response:
+    return httpx.Response(200, content=content, headers={"content-type": content_type})
+
+
+def cases(records: int) -> list:
+    """(이름, 본문, Content-Type, 이전 경로, 현재 경로)"""
+    ntis, dataon = kisti_mcp.ntis_client, kisti_mcp.dataon_client
+
+    def ntis_before(response):
+        logger.info(f"NTIS 응답 내용: {response.text[:500]}...")
+        return ntis._parse_xml_response(response.content, "PROJECT")
+
+    def ntis_after(response):
+        kisti_mcp.log_body("NTIS 응답 내용", response.content)
+        return ntis._parse_xml_response(response.content, "PROJECT")
+
+    def dataon_before(response):
+        logger.info(f"DataON 응답 내용: {response.text[:500]}...")
+        return dataon._parse_json_response(response.text, "RESEARCH_DATA")
+
+    def dataon_after(response):
+        kisti_mcp.log_body("DataON 응답 내용", response.content)
+        return dataon._parse_json_response(response.content, "RESEARCH_DATA")
+
+    return [
+        ("NTIS 과제 XML", ntis_project_page(records), "text/xml;charset=UTF-8", ntis_before, ntis_after),
+        ("DataON JSON", dataon_page(records), "application/json", dataon_before, dataon_after),
+    ]
+
+
+def main(args):
+    print(f"레코드 {args.records}건, 반복 {args.repeat}회, 로그 레벨 INFO")
+    for name, body, content_type, before, after in cases(args.records):
+        results = {}
+        for label, parse in (("이전", before), ("현재", after)):
+            assert not parse(fresh(body, content_type)).get("error"), f"{name} 파싱 실패"
+            results[label] = timed(lambda: parse(fresh(body, content_type)), args.repeat)
+        print(f"{name} ({len(body) / 1024:.0f}KiB)")
+        for label, (elapsed, peak) in results.items():
+            print(f"  {label}: {elapsed:7.2f}ms/응답  최대 할당 {peak:7.0f}KiB")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--records", type=int, default=100, help="응답당 레코드 수")
+    parser.add_argument("--repeat", type=int, default=200)
+    main(parser.parse_args())
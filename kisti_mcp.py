@@ -6,9 +6,11 @@ KISTI가 서비스하는 다양한 플랫폼의 OpenAPI를 활용할 수 있습
 KISTI-MCP Server
 v0.3.12 - ScienceON + NTIS + DataON 통합 검색 서비스 (DataON 연구데이터 검색 추가)
 """
+import asyncio
+import functools
 import logging
 import os
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
 from datetime import datetime, timedelta
 import httpx
 from fastmcp import FastMCP
@@ -16,11 +18,26 @@ import json
 import re
 import html
 import base64
+import hashlib
+import random
+import time
+import sqlite3
+import tempfile
+import zlib
+from collections import OrderedDict, deque
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from Crypto.Cipher import AES
+try:
+    import h2  # noqa: F401  (httpx HTTP/2 전송용 선택 의존성)
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
 from urllib.parse import quote
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -32,8 +49,21 @@ try:
 except Exception:
     __version__ = "0.0.0"
 USER_AGENT = f"kisti-mcp/{__version__}"
+
+
+@asynccontextmanager
+async def _server_lifespan(server):
+    """서버 수명주기: 종료 시 업스트림 커넥션 풀 정리"""
+    try:
+        yield {}
+    finally:
+        await BaseAPIClient.close_all()
+        await detail_store.close()
+        await quota_ledger.flush()
+
+
 # MCP 서버 초기화
-mcp = FastMCP("KISTI-MCP Server")
+mcp = FastMCP("KISTI-MCP Server", lifespan=_server_lifespan)
 # 환경변수 캐시 (중복 로딩 방지)
 _env_cache = None
 _env_loaded = False
@@ -98,6 +128,58 @@ def get_env(key: str, default: str = "") -> str:
     return env_vars.get(key, default)
 
 
+def get_env_int(key: str, default: int) -> int:
+    """정수형 환경변수 조회 (값이 없거나 잘못되면 기본값)"""
+    try:
+        return int(get_env(key, str(default)))
+    except ValueError:
+        logger.warning(f"환경변수 {key} 값이 정수가 아닙니다. 기본값 {default} 사용")
+        return default
+
+
+def get_cache_dir() -> Path:
+    """로컬 캐시 디렉터리 (KISTI_MCP_CACHE_DIR, 기본 ~/.cache/kisti-mcp)"""
+    path = Path(get_env("KISTI_MCP_CACHE_DIR") or Path.home() / ".cache" / "kisti-mcp")
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def write_file_atomic(path: Path, data: str):
+    """같은 디렉터리의 고유 임시 파일에 쓴 뒤 원자적으로 교체
+
+    임시 파일은 처음부터 0600 권한으로 만들어지고 이름이 호출마다 달라서,
+    여러 프로세스가 같은 파일을 동시에 저장해도 서로의 임시 파일을 덮어쓰지 않는다.
+    """
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def get_env_bool(key: str, default: bool = False) -> bool:
+    """불리언 환경변수 조회 (1/true/yes/on 이면 True)"""
+    value = get_env(key, "")
+    if not value:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def get_env_float(key: str, default: float) -> float:
+    """실수형 환경변수 조회 (값이 없거나 잘못되면 기본값)"""
+    try:
+        return float(get_env(key, str(default)))
+    except ValueError:
+        logger.warning(f"환경변수 {key} 값이 숫자가 아닙니다. 기본값 {default} 사용")
+        return default
+
+
 def clean_text(text, max_len: int = 300) -> str:
     """HTML 태그/엔티티를 제거하고 LLM 가독성 좋게 정리한다.
 
@@ -140,14 +222,1371 @@ class AESTestClass:
         encrypted_bytes = cipher.encrypt(padded_txt.encode('utf-8'))
         encrypted_str = base64.urlsafe_b64encode(encrypted_bytes).decode("utf-8")
         return quote(encrypted_str)
+
+
+# ── 응답 캐시 ──────────────────────────────────────────────
+def normalize_query(query) -> Any:
+    """캐시 키용 검색어 정규화 (공백 정리 + 대소문자 무시, 튜플/dict는 원소별)"""
+    if isinstance(query, str):
+        return re.sub(r'\s+', ' ', query).strip().casefold()
+    if isinstance(query, (tuple, list)):
+        return tuple(normalize_query(q) for q in query)
+    if isinstance(query, dict):
+        return tuple(sorted((k, normalize_query(v)) for k, v in query.items()))
+    return query
+
+
+def make_cache_key(platform: str, target: str, query, query_field: str = "",
+                   paging: tuple = (), max_results: int = 0, projection: str = "") -> tuple:
+    """(플랫폼, target, 정규화 검색어, query_field, 페이징, max_results, 필드 투영) 캐시 키
+
+    projection: 일부 필드만 파싱한 응답이면 그 이름 (예: "list"), 전체 응답은 ""
+    """
+    return (platform, target, normalize_query(query), query_field, paging, max_results, projection)
+
+
+def json_default(obj):
+    """캐시 직렬화용 json default (압축 레코드 등 Mapping은 dict로, 그 외는 문자열로)"""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    return str(obj)
+
+
+class ResponseCache:
+    """검색 응답 메모리 캐시 (target별 TTL + LRU, 바이트 상한)
+
+    성공 응답만 저장한다. 크기는 JSON 직렬화 바이트 수로 추정하며,
+    총량이 max_bytes를 넘으면 가장 오래 쓰이지 않은 항목부터 제거한다.
+    만료된 항목도 stale_ttl초 동안은 남겨 두어, 호출 한도 임박·초과 시
+    get(allow_stale=True)로 재사용할 수 있게 한다. 만료된 항목을 돌려줄 때는
+    응답 복사본에 stale_age(저장 후 경과 초)를 붙여 포맷터가 안내할 수 있게 한다.
+    """
+
+    # target별 기본 TTL(초). 자주 바뀌지 않는 사전/코드/칼럼류는 길게
+    DEFAULT_TTLS = {
+        "TERMINOLOGY": 86400, "CLASS_CODE": 86400, "SCENT": 86400,
+        "TREND": 86400, "RESEARCHER": 21600, "ORGAN": 21600,
+        "SNEWS": 21600, "ISSUE": 1800,
+    }
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024, default_ttl: float = 600,
+                 ttls: Optional[Dict[str, float]] = None, stale_ttl: float = 86400):
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.stale_ttl = stale_ttl
+        self.ttls = dict(self.DEFAULT_TTLS)
+        self.ttls.update(ttls or {})
+        # key → (만료시각, 크기, 값, 저장시각). 순서가 곧 LRU 순서
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.stale_hits = 0
+
+    @classmethod
+    def from_env(cls) -> "ResponseCache":
+        """KISTI_CACHE_* 환경변수로 생성 (KISTI_CACHE_TTL_<TARGET>로 target별 TTL 지정)"""
+        prefix = "KISTI_CACHE_TTL_"
+        targets = set(cls.DEFAULT_TTLS) | {k[len(prefix):] for k in os.environ if k.startswith(prefix)}
+        ttls = {}
+        for target in targets:
+            if get_env(prefix + target):
+                ttls[target] = get_env_float(prefix + target, cls.DEFAULT_TTLS.get(target, 0))
+        return cls(max_bytes=get_env_int("KISTI_CACHE_MAX_BYTES", 32 * 1024 * 1024),
+                   default_ttl=get_env_float("KISTI_CACHE_TTL", 600),
+                   ttls=ttls,
+                   stale_ttl=get_env_float("KISTI_CACHE_STALE_TTL", 86400))
+
+    def ttl_for(self, target: str) -> float:
+        return self.ttls.get(target, self.default_ttl)
+
+    def get(self, key: tuple, allow_stale: bool = False) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, size, value, stored_at = entry
+        now = time.monotonic()
+        if expires_at <= now:
+            if now >= expires_at + self.stale_ttl:
+                self._remove(key)
+                self.expirations += 1
+            elif allow_stale:
+                self._entries.move_to_end(key)
+                self.stale_hits += 1
+                return dict(value, stale_age=now - stored_at)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: tuple, target: str, value: Dict[str, Any]):
+        ttl = self.ttl_for(target)
+        if ttl <= 0 or self.max_bytes <= 0:
+            return
+        size = len(json.dumps(value, ensure_ascii=False, default=json_default).encode('utf-8'))
+        if size > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        now = time.monotonic()
+        self._entries[key] = (now + ttl, size, value, now)
+        self.total_bytes += size
+        while self.total_bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def _remove(self, key: tuple):
+        _, size, _, _ = self._entries.pop(key)
+        self.total_bytes -= size
+
+    def clear(self):
+        self._entries.clear()
+        self.total_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.total_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "stale_hits": self.stale_hits,
+        }
+
+
+response_cache = ResponseCache.from_env()
+
+
+async def cached_fetch(key: tuple, target: str, fetch) -> Dict[str, Any]:
+    """응답 캐시 조회 후 미스면 fetch()로 업스트림 호출 (성공 응답만 저장)
+
+    key[0]은 플랫폼명. 해당 플랫폼의 일일 호출 한도가 임박하면 만료된 캐시도 먼저 쓰고,
+    호출 속도/일일 한도 초과(RateLimitedError)로 호출하지 못하면 만료된 캐시가 있을 때
+    그것을 대신 반환한다. 만료된 캐시 응답에는 stale_age가 붙는다 (stale_notice 참고).
+    그 밖의 오류(잘못된 파라미터, 인증 실패, 5xx 등)는 그대로 돌려준다.
+    """
+    cached = response_cache.get(key, allow_stale=quota_near_limit(key[0]))
+    if cached is not None:
+        return cached
+    try:
+        result = await fetch()
+    except RateLimitedError:
+        stale = response_cache.get(key, allow_stale=True)
+        if stale is None:
+            raise
+        logger.info(f"호출 한도 초과로 만료된 캐시 응답 사용: {key[:2]}")
+        return stale
+    if result.get("success"):
+        response_cache.put(key, target, result)
+    return result
+
+
+class DetailStore:
+    """상세 레코드 영구 캐시 (SQLite + zlib, target별 TTL, 용량 상한 LRU 정리)
+
+    CN / pjtId / svcId로 조회한 파싱 결과를 디스크에 저장해 재시작 후에도 재사용한다.
+    SQLite 호출과 압축/직렬화는 전용 스레드 하나에서 실행해 이벤트 루프를 막지 않는다
+    (여러 프로세스가 DB를 공유해 잠금을 기다려도 진행 중인 다른 요청은 계속 처리됨).
+    DB를 열 수 없으면 경고만 남기고 캐시 없이 동작한다.
+    """
+
+    # target별 기본 TTL(초). 특허는 상태(공개→등록)가 바뀌므로 짧게
+    DEFAULT_TTLS = {
+        "ARTI": 30 * 86400, "REPORT": 30 * 86400, "PATENT": 7 * 86400,
+        "DATAON_DETAIL": 7 * 86400, "RELATED_CONTENT": 86400,
+    }
+    # 다른 프로세스가 쓰기 잠금을 잡고 있을 때 기다리는 최대 시간(초)
+    BUSY_TIMEOUT = 5.0
+    # 적중 시 accessed_at 갱신 최소 간격(초). LRU 정리 순서에는 이 정도 정밀도면 충분
+    ACCESS_UPDATE_INTERVAL = 600
+
+    def __init__(self, path: Optional[Path], max_bytes: int = 64 * 1024 * 1024,
+                 default_ttl: float = 7 * 86400, ttls: Optional[Dict[str, float]] = None):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.ttls = dict(self.DEFAULT_TTLS)
+        self.ttls.update(ttls or {})
+        self._conn: Optional[sqlite3.Connection] = None
+        self._disabled = path is None
+        # DB 연결은 이 스레드에서만 사용 (sqlite3 연결은 만든 스레드 전용)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="kisti-detail-cache")
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def from_env(cls) -> "DetailStore":
+        """KISTI_DETAIL_CACHE_* 환경변수로 생성 (KISTI_DETAIL_CACHE=off 이면 비활성)"""
+        setting = get_env("KISTI_DETAIL_CACHE")
+        if setting.lower() in ("0", "off", "false", "no"):
+            path = None
+        else:
+            path = Path(setting or "details.sqlite3").expanduser()
+        prefix = "KISTI_DETAIL_CACHE_TTL_"
+        ttls = {k[len(prefix):]: get_env_float(k, 0) for k in os.environ if k.startswith(prefix)}
+        return cls(path,
+                   max_bytes=get_env_int("KISTI_DETAIL_CACHE_MAX_BYTES", 64 * 1024 * 1024),
+                   default_ttl=get_env_float("KISTI_DETAIL_CACHE_TTL", 7 * 86400),
+                   ttls=ttls)
+
+    async def _run(self, func, *args):
+        """DB 전용 스레드에서 func(*args) 실행"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args))
+
+    def _db(self) -> Optional[sqlite3.Connection]:
+        """DB 연결 (최초 사용 시 열고 스키마 생성, DB 스레드에서만 호출)"""
+        if self._conn is not None or self._disabled:
+            return self._conn
+        try:
+            path = self.path if self.path.is_absolute() else get_cache_dir() / self.path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(path), isolation_level=None, timeout=self.BUSY_TIMEOUT)
+            conn.execute(f"PRAGMA busy_timeout={int(self.BUSY_TIMEOUT * 1000)}")
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""CREATE TABLE IF NOT EXISTS details (
+                                key TEXT PRIMARY KEY,
+                                target TEXT NOT NULL,
+                                payload BLOB NOT NULL,
+                                size INTEGER NOT NULL,
+                                stored_at REAL NOT NULL,
+                                accessed_at REAL NOT NULL)""")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_details_accessed ON details(accessed_at)")
+            self.total_bytes = conn.execute("SELECT COALESCE(SUM(size), 0) FROM details").fetchone()[0]
+            self._conn = conn
+            logger.info(f"상세 캐시 DB: {path}")
+        except Exception as e:
+            logger.warning(f"상세 캐시 DB를 열 수 없어 비활성화합니다: {str(e)}")
+            self._disabled = True
+        return self._conn
+
+    @staticmethod
+    def _key(platform: str, target: str, identifier: str) -> str:
+        return f"{platform}:{target}:{identifier}"
+
+    def ttl_for(self, target: str) -> float:
+        return self.ttls.get(target, self.default_ttl)
+
+    async def get(self, platform: str, target: str, identifier: str,
+                  allow_stale: bool = False) -> Optional[Dict[str, Any]]:
+        if self._disabled:
+            return None
+        return await self._run(self._get, platform, target, identifier, allow_stale)
+
+    def _get(self, platform: str, target: str, identifier: str,
+             allow_stale: bool) -> Optional[Dict[str, Any]]:
+        conn = self._db()
+        if conn is None:
+            return None
+        key = self._key(platform, target, identifier)
+        try:
+            row = conn.execute("SELECT payload, stored_at, accessed_at FROM details WHERE key = ?",
+                               (key,)).fetchone()
+            now = time.time()
+            if row is None or (row[1] + self.ttl_for(target) <= now and not allow_stale):
+                self.misses += 1
+                return None
+            if now - row[2] >= self.ACCESS_UPDATE_INTERVAL:
+                conn.execute("UPDATE details SET accessed_at = ? WHERE key = ?", (now, key))
+            value = json.loads(zlib.decompress(row[0]))
+            if row[1] + self.ttl_for(target) <= now:
+                value["stale_age"] = now - row[1]
+        except Exception as e:
+            logger.warning(f"상세 캐시 조회 오류 ({key}): {str(e)}")
+            self.misses += 1
+            return None
+        self.hits += 1
+        # ScienceON 레거시 키 복원 (papers와 records는 같은 목록)
+        if "records" in value and "papers" not in value:
+            value["papers"] = value["records"]
+        return value
+
+    async def put(self, platform: str, target: str, identifier: str, value: Dict[str, Any]):
+        if self._disabled or self.ttl_for(target) <= 0:
+            return
+        await self._run(self._put, platform, target, identifier, value)
+
+    def _put(self, platform: str, target: str, identifier: str, value: Dict[str, Any]):
+        conn = self._db()
+        if conn is None:
+            return
+        key = self._key(platform, target, identifier)
+        stored = {k: v for k, v in value.items() if not (k == "papers" and "records" in value)}
+        try:
+            payload = zlib.compress(json.dumps(stored, ensure_ascii=False, default=json_default).encode('utf-8'))
+            size = len(payload)
+            if size > self.max_bytes:
+                return
+            old = conn.execute("SELECT size FROM details WHERE key = ?", (key,)).fetchone()
+            now = time.time()
+            conn.execute("INSERT OR REPLACE INTO details VALUES (?, ?, ?, ?, ?, ?)",
+                         (key, target, payload, size, now, now))
+            self.total_bytes += size - (old[0] if old else 0)
+            if self.total_bytes > self.max_bytes:
+                self._prune(conn)
+        except Exception as e:
+            logger.warning(f"상세 캐시 저장 오류 ({key}): {str(e)}")
+
+    def _prune(self, conn: sqlite3.Connection):
+        """용량 상한의 90%까지 오래 안 쓰인 항목부터 삭제"""
+        goal = int(self.max_bytes * 0.9)
+        rows = conn.execute("SELECT key, size FROM details ORDER BY accessed_at").fetchall()
+        victims = []
+        for key, size in rows:
+            if self.total_bytes <= goal:
+                break
+            victims.append((key,))
+            self.total_bytes -= size
+        conn.executemany("DELETE FROM details WHERE key = ?", victims)
+        self.evictions += len(victims)
+
+    async def close(self):
+        await self._run(self._close)
+        self._executor.shutdown(wait=False)
+
+    def _close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    async def stats(self) -> Dict[str, Any]:
+        return await self._run(self._stats)
+
+    def _stats(self) -> Dict[str, Any]:
+        conn = self._db()
+        entries = conn.execute("SELECT COUNT(*) FROM details").fetchone()[0] if conn else 0
+        return {
+            "enabled": conn is not None,
+            "entries": entries,
+            "bytes": self.total_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+detail_store = DetailStore.from_env()
+
+
+async def cached_detail(platform: str, target: str, identifier: str, fetch) -> Dict[str, Any]:
+    """상세 캐시 조회 후 미스면 fetch()로 업스트림 호출 (성공 응답만 저장)
+
+    호출 한도 임박 시에는 TTL이 지난 항목도 먼저 사용하고, 호출 한도 초과(RateLimitedError)로
+    호출하지 못하면 TTL이 지난 항목을 대신 반환한다 (cached_fetch와 같음, stale_age 포함).
+    """
+    cached = await detail_store.get(platform, target, identifier,
+                                    allow_stale=quota_near_limit(platform))
+    if cached is not None:
+        return cached
+    try:
+        result = await fetch()
+    except RateLimitedError:
+        stale = await detail_store.get(platform, target, identifier, allow_stale=True)
+        if stale is None:
+            raise
+        logger.info(f"호출 한도 초과로 만료된 상세 캐시 사용: {platform}/{target}/{identifier}")
+        return stale
+    if result.get("success"):
+        await detail_store.put(platform, target, identifier, result)
+    return result
+
+
+class SingleFlight:
+    """동일 요청 병합 (single-flight)
+
+    같은 키의 요청이 이미 진행 중이면 새 업스트림 호출 없이 그 결과를 함께 기다린다.
+    결과/예외는 모든 대기자에게 전달되고, 완료 즉시 키가 제거되므로 아무것도 캐시하지 않는다.
+    대기자가 모두 취소되면 업스트림 호출도 취소한다.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Any, List[Any]] = {}  # key → [task, 대기자 수]
+        self.leaders = 0
+        self.coalesced = 0
+
+    async def do(self, key, factory):
+        entry = self._calls.get(key)
+        if entry is None:
+            task = asyncio.ensure_future(factory())
+            entry = self._calls[key] = [task, 0]
+            task.add_done_callback(functools.partial(self._forget, key, entry))
+            self.leaders += 1
+        else:
+            self.coalesced += 1
+        entry[1] += 1
+        try:
+            return await asyncio.shield(entry[0])
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0 and not entry[0].done():
+                entry[0].cancel()
+
+    def _forget(self, key, entry, _task):
+        if self._calls.get(key) is entry:
+            del self._calls[key]
+
+    def stats(self) -> Dict[str, Any]:
+        return {"in_flight": len(self._calls), "leaders": self.leaders, "coalesced": self.coalesced}
+
+
+def single_flight(method):
+    """클라이언트 메서드 호출을 인자 기준으로 병합하는 데코레이터 (self._inflight 사용)"""
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        key = (method.__name__, repr(args), repr(sorted(kwargs.items())))
+        return await self._inflight.do(key, lambda: method(self, *args, **kwargs))
+    return wrapper
+
+
+class RetryBudget:
+    """프로세스 전체 재시도 예산 (요청 수 대비 비율로 적립, 재시도마다 1 차감)
+
+    업스트림 장애 시 재시도가 부하를 증폭시키지 않도록 재시도량을 요청량의 ratio 이내로 제한한다.
+    """
+
+    def __init__(self, ratio: float = 0.1, reserve: float = 10.0):
+        self.ratio = ratio
+        self.reserve = reserve
+        self._tokens = reserve
+        self.retries = 0
+        self.denied = 0
+
+    def on_request(self):
+        self._tokens = min(self.reserve, self._tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        if self._tokens < 1:
+            self.denied += 1
+            return False
+        self._tokens -= 1
+        self.retries += 1
+        return True
+
+    def refund(self):
+        """try_spend()로 받았지만 쓰지 않은 1회분 반환"""
+        self._tokens = min(self.reserve, self._tokens + 1)
+        self.retries -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {"available": round(self._tokens, 1), "retries": self.retries, "denied": self.denied}
+
+
+retry_budget = RetryBudget(get_env_float("KISTI_RETRY_BUDGET_RATIO", 0.1),
+                           get_env_float("KISTI_RETRY_BUDGET_RESERVE", 10.0))
+
+
+# 헤지(중복) 요청 예산 (헤지 대상 요청 수 대비 비율)
+hedge_budget = RetryBudget(get_env_float("KISTI_HEDGE_BUDGET_RATIO", 0.05),
+                           get_env_float("KISTI_HEDGE_BUDGET_RESERVE", 5.0))
+
+
+class RetryPolicy:
+    """일시 오류 재시도 정책 (지수 백오프 + full jitter, Retry-After 존중)"""
+
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    def __init__(self, max_retries: int = 2, base_delay: float = 0.3, max_delay: float = 5.0,
+                 methods: tuple = ("GET",)):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.methods = methods
+
+    @classmethod
+    def from_env(cls) -> "RetryPolicy":
+        return cls(get_env_int("KISTI_RETRY_MAX", 2),
+                   get_env_float("KISTI_RETRY_BASE_DELAY", 0.3),
+                   get_env_float("KISTI_RETRY_MAX_DELAY", 5.0))
+
+    def should_retry(self, method: str, attempt: int, response: Optional[httpx.Response] = None,
+                     error: Optional[Exception] = None) -> bool:
+        if method.upper() not in self.methods or attempt >= self.max_retries:
+            return False
+        if error is not None:
+            return isinstance(error, httpx.TransportError)
+        return response is not None and response.status_code in self.RETRY_STATUSES
+
+    def delay(self, attempt: int, response: Optional[httpx.Response] = None) -> Optional[float]:
+        """다음 시도까지 대기 시간(초). Retry-After가 max_delay를 넘으면 None (재시도 안 함)"""
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after:
+            try:
+                wait = float(retry_after)
+            except ValueError:
+                try:
+                    from email.utils import parsedate_to_datetime
+                    wait = parsedate_to_datetime(retry_after).timestamp() - time.time()
+                except (TypeError, ValueError):
+                    wait = None
+            if wait is not None:
+                return max(0.0, wait) if wait <= self.max_delay else None
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+class LatencyStats:
+    """엔드포인트별 최근 응답 시간 표본 (적응형 타임아웃/헤징 기준)"""
+
+    def __init__(self, window: int = 200):
+        self._samples: deque = deque(maxlen=window)
+        self.count = 0
+
+    def record(self, seconds: float):
+        self._samples.append(seconds)
+        self.count += 1
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """최근 표본의 q 분위수 (표본이 없으면 None)"""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, max(0, int(q * len(ordered) + 0.5) - 1))
+        return ordered[index]
+
+
+class APIFastFailError(Exception):
+    """백오프 중인 업스트림 호출을 보내지 않고 즉시 실패시킬 때 사용"""
+
+
+class CircuitOpenError(APIFastFailError):
+    """회로 차단기가 열려 있어 업스트림 호출을 보내지 않음"""
+
+
+class AuthBackoffError(APIFastFailError):
+    """최근 인증/권한 오류로 백오프 중인 엔드포인트라 업스트림 호출을 보내지 않음"""
+
+
+class CircuitBreaker:
+    """엔드포인트별 회로 차단기 (closed → open → half_open)
+
+    연속 실패가 failure_threshold에 이르거나, 최근 window건 중 min_calls건 이상에서
+    오류율이 error_rate 이상이면 open_seconds 동안 열려 호출을 즉시 실패시킨다.
+    이후 half_open에서 프로브 1건만 통과시켜 성공하면 닫고, 실패하면 다시 연다.
+
+    상태가 바뀔 때마다 세대(generation)가 올라간다. allow()는 허용한 호출의 세대를
+    돌려주고, record()/release()는 같은 세대의 결과만 반영한다. 그래서 차단기가 열리기 전에
+    시작된 느린 호출이 열린 차단기를 닫거나, 프로브가 아닌 호출이 프로브 자리를 비우지 못한다.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 5, error_rate: float = 0.5,
+                 window: int = 20, min_calls: int = 10, open_seconds: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.error_rate = error_rate
+        self.min_calls = min_calls
+        self.open_seconds = open_seconds
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self._outcomes = deque(maxlen=window)
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._generation = 0
+        self.times_opened = 0
+        self.rejected = 0
+
+    @classmethod
+    def from_env(cls, name: str) -> "CircuitBreaker":
+        return cls(name,
+                   failure_threshold=get_env_int("KISTI_BREAKER_FAILURES", 5),
+                   error_rate=get_env_float("KISTI_BREAKER_ERROR_RATE", 0.5),
+                   window=get_env_int("KISTI_BREAKER_WINDOW", 20),
+                   min_calls=get_env_int("KISTI_BREAKER_MIN_CALLS", 10),
+                   open_seconds=get_env_float("KISTI_BREAKER_OPEN_SECONDS", 30.0))
+
+    def retry_in(self) -> float:
+        return max(0.0, self._opened_at + self.open_seconds - time.monotonic())
+
+    def allow(self) -> Optional[int]:
+        """호출 허용 시 현재 세대 번호, 차단이면 None (half_open에서는 프로브 1건만 허용)"""
+        if self.state == "open":
+            if self.retry_in() > 0:
+                self.rejected += 1
+                return None
+            self._set_state("half_open")
+        if self.state == "half_open":
+            if self._probe_in_flight:
+                self.rejected += 1
+                return None
+            self._probe_in_flight = True
+        return self._generation
+
+    def record(self, generation: int, ok: bool):
+        """allow()가 준 세대의 호출 결과 반영 (그 사이 상태가 바뀌었으면 무시)"""
+        if generation != self._generation:
+            return
+        if self.state == "half_open":
+            # half_open 세대에 허용된 호출은 프로브 1건뿐
+            self._probe_in_flight = False
+            if ok:
+                logger.info(f"회로 차단기 닫힘: {self.name}")
+                self._set_state("closed")
+            else:
+                self._open()
+            return
+        self._outcomes.append(ok)
+        if ok:
+            self.consecutive_failures = 0
+            return
+        self.consecutive_failures += 1
+        failures = self._outcomes.count(False)
+        if (self.consecutive_failures >= self.failure_threshold
+                or (len(self._outcomes) >= self.min_calls
+                    and failures / len(self._outcomes) >= self.error_rate)):
+            self._open()
+
+    def release(self, generation: int):
+        """결과 없이 끝난 호출(취소 등)이 프로브였으면 프로브 자리 반환"""
+        if generation == self._generation and self.state == "half_open":
+            self._probe_in_flight = False
+
+    def _set_state(self, state: str):
+        self.state = state
+        self._generation += 1
+        self._probe_in_flight = False
+        if state == "closed":
+            self.consecutive_failures = 0
+            self._outcomes.clear()
+
+    def _open(self):
+        self.times_opened += 1
+        logger.warning(f"회로 차단기 열림 ({self.open_seconds:g}초): {self.name}")
+        self._set_state("open")
+        self._opened_at = time.monotonic()
+
+    def describe(self) -> str:
+        total = len(self._outcomes)
+        rate = self._outcomes.count(False) / total if total else 0.0
+        text = (f"{self.state} (연속 실패 {self.consecutive_failures}, 최근 오류율 {rate:.0%}, "
+                f"열림 {self.times_opened}회, 차단 {self.rejected}건")
+        if self.state == "open":
+            text += f", {self.retry_in():.0f}초 후 프로브"
+        return text + ")"
+
+
+class FailureBackoff:
+    """실패 기억 + 지수 백오프 (인증 실패 등 반복해도 소용없는 호출 차단)
+
+    같은 키가 연속 실패하면 base, 2*base, 4*base ... (최대 max_delay)초 동안
+    check()가 마지막 실패 사유를 반환한다. 성공하면 기록을 지운다.
+    """
+
+    def __init__(self, base_delay: float = 5.0, max_delay: float = 600.0):
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._entries: Dict[Any, List[Any]] = {}  # key → [연속 실패 수, 차단 해제 시각, 사유]
+        self.fast_fails = 0
+
+    @classmethod
+    def from_env(cls) -> "FailureBackoff":
+        return cls(get_env_float("KISTI_AUTH_BACKOFF_BASE", 5.0),
+                   get_env_float("KISTI_AUTH_BACKOFF_MAX", 600.0))
+
+    def check(self, key) -> Optional[str]:
+        """백오프 중이면 '사유 (n초 후 재시도)' 반환, 아니면 None"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        remaining = entry[1] - time.monotonic()
+        if remaining <= 0:
+            return None
+        self.fast_fails += 1
+        return f"{entry[2]} ({remaining:.0f}초 후 재시도)"
+
+    def failure(self, key, reason: str):
+        entry = self._entries.get(key)
+        count = entry[0] + 1 if entry else 1
+        delay = min(self.max_delay, self.base_delay * (2 ** (count - 1)))
+        self._entries[key] = [count, time.monotonic() + delay, reason]
+        logger.warning(f"인증 실패 백오프 {delay:g}초: {key} - {reason}")
+
+    def success(self, key):
+        self._entries.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        active = {str(k): f"{e[2]} ({e[1] - now:.0f}초 남음)"
+                  for k, e in self._entries.items() if e[1] > now}
+        return {"fast_fails": self.fast_fails, "active": active or "-"}
+
+
+class BulkheadFullError(APIFastFailError):
+    """플랫폼 동시 호출 대기열이 가득 차 요청을 받지 않음"""
+
+
+class Bulkhead:
+    """플랫폼별 동시 호출 격벽 (느린 업스트림 하나가 다른 플랫폼 호출을 굶기지 않도록)
+
+    동시에 max_inflight건까지만 업스트림을 호출하고, 나머지는 max_queue건까지 대기한다.
+    대기열이 가득 찼거나 queue_timeout초 넘게 기다리면 BulkheadFullError로 즉시 실패한다.
+    자리는 전송 시도 1회 동안만 잡는다 (속도 제한 대기·재시도 백오프 중에는 반납).
+    """
+
+    def __init__(self, name: str, max_inflight: int = 8, max_queue: int = 32,
+                 queue_timeout: float = 10.0):
+        self.name = name
+        self.max_inflight = max(1, max_inflight)
+        self.max_queue = max(0, max_queue)
+        self.queue_timeout = queue_timeout
+        self._semaphore = asyncio.Semaphore(self.max_inflight)
+        self.in_flight = 0
+        self.queued = 0
+        self.peak_queued = 0
+        self.rejected = 0
+        self.timed_out = 0
+
+    @classmethod
+    def from_env(cls, platform: str) -> "Bulkhead":
+        return cls(platform,
+                   max_inflight=get_env_int(f"{platform}_MAX_INFLIGHT", 8),
+                   max_queue=get_env_int(f"{platform}_MAX_QUEUE", 32),
+                   queue_timeout=get_env_float("KISTI_BULKHEAD_QUEUE_TIMEOUT", 10.0))
+
+    @asynccontextmanager
+    async def slot(self):
+        if self._semaphore.locked():
+            if self.queued >= self.max_queue:
+                self.rejected += 1
+                raise BulkheadFullError(f"{self.name} 동시 요청이 너무 많습니다 "
+                                        f"(처리 중 {self.in_flight}, 대기 {self.queued})")
+            self.queued += 1
+            self.peak_queued = max(self.peak_queued, self.queued)
+            # wait_for는 시간 초과/취소와 획득이 겹치면 permit을 잃을 수 있어(3.10/3.11)
+            # acquire 태스크를 직접 기다리고, 포기할 때 이미 얻은 permit은 반납한다
+            acquire = asyncio.ensure_future(self._semaphore.acquire())
+            try:
+                done, _ = await asyncio.wait({acquire}, timeout=self.queue_timeout)
+            except BaseException:
+                self._abandon(acquire)
+                raise
+            finally:
+                self.queued -= 1
+            if not done:
+                self._abandon(acquire)
+                self.timed_out += 1
+                raise BulkheadFullError(f"{self.name} 대기열에서 {self.queue_timeout:g}초 넘게 기다려 "
+                                        f"요청을 취소했습니다")
+        else:
+            await self._semaphore.acquire()
+        self.in_flight += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            self._semaphore.release()
+
+    def _abandon(self, acquire: asyncio.Future):
+        """기다리기를 포기한 acquire가 이미(또는 취소 전에) permit을 얻었으면 반납"""
+        def release_if_acquired(task):
+            if not task.cancelled() and task.exception() is None:
+                self._semaphore.release()
+
+        if acquire.done():
+            release_if_acquired(acquire)
+        else:
+            acquire.cancel()
+            acquire.add_done_callback(release_if_acquired)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "in_flight": f"{self.in_flight}/{self.max_inflight}",
+            "queued": f"{self.queued}/{self.max_queue}",
+            "peak_queued": self.peak_queued,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+        }
+
+
+class RateLimitedError(APIFastFailError):
+    """클라이언트 측 호출 속도/일일 한도 초과로 업스트림 호출을 보내지 않음"""
+
+
+class QuotaLedger:
+    """자격증명별 일일 호출 수 기록 (quota.sqlite3, 날짜가 바뀌면 0부터)
+
+    프로세스가 자주 재시작돼도 하루 사용량이 이어지도록 디스크에 저장한다.
+    여러 kisti-mcp 프로세스가 같은 캐시 디렉터리를 공유하므로 파일을 덮어쓰지 않고
+    SQLite에 증가분을 더한다 (used = used + ?). 증가분은 메모리에 모았다가
+    flush_interval초에 한 번 백그라운드 스레드에서 반영하고, 그때 다른 프로세스 사용량이
+    합쳐진 값을 다시 읽는다. 서버 종료 시 flush()로 남은 증가분을 반영한다.
+    """
+
+    # 다른 프로세스가 쓰는 중일 때 기다리는 최대 시간(초)
+    BUSY_TIMEOUT = 5.0
+
+    def __init__(self, path: Optional[Path], flush_interval: float = 5.0):
+        self.path = path
+        self.flush_interval = flush_interval
+        # key → (날짜, 사용량): 마지막으로 DB에서 읽은 전체 프로세스 합계
+        self._shared: Dict[str, tuple] = {}
+        # (key, 날짜) → 아직 DB에 반영하지 않은 이 프로세스의 증가분 (반영 중인 것 포함)
+        self._pending: Dict[tuple, int] = {}
+        self._flushing: Dict[tuple, int] = {}
+        self._labels: Dict[str, str] = {}
+        self._flushed_at = time.monotonic()
+        self._writer: Optional[asyncio.Task] = None
+        if self.path is not None:
+            try:
+                self._shared = self._sync({})
+            except Exception as e:
+                logger.warning(f"호출량 기록 DB를 열 수 없어 메모리에만 보관합니다: {str(e)}")
+                self.path = None
+
+    @classmethod
+    def from_env(cls) -> "QuotaLedger":
+        try:
+            return cls(get_cache_dir() / "quota.sqlite3")
+        except OSError as e:
+            logger.warning(f"호출량 기록 경로를 만들 수 없어 메모리에만 보관합니다: {str(e)}")
+            return cls(None)
+
+    def _sync(self, batch: Dict[tuple, int]) -> Dict[str, tuple]:
+        """증가분을 DB에 더하고 오늘 기준 전체 합계를 읽음 (스레드에서 실행 가능)"""
+        conn = sqlite3.connect(str(self.path), timeout=self.BUSY_TIMEOUT, isolation_level=None)
+        try:
+            conn.execute("""CREATE TABLE IF NOT EXISTS quota (
+                                key TEXT NOT NULL,
+                                date TEXT NOT NULL,
+                                label TEXT NOT NULL,
+                                used INTEGER NOT NULL,
+                                PRIMARY KEY (key, date))""")
+            today = self._today()
+            if batch:
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    conn.executemany(
+                        "INSERT INTO quota (key, date, label, used) VALUES (?, ?, ?, ?) "
+                        "ON CONFLICT (key, date) DO UPDATE SET used = used + excluded.used",
+                        [(key, date, self._labels.get(key, ""), n) for (key, date), n in batch.items()])
+                    conn.execute("DELETE FROM quota WHERE date < ?", (today,))
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+            rows = conn.execute("SELECT key, used FROM quota WHERE date = ?", (today,)).fetchall()
+            return {key: (today, used) for key, used in rows}
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _today() -> str:
+        return datetime.now().strftime("%Y-%m-%d")
+
+    def used(self, key: str) -> int:
+        today = self._today()
+        date, shared = self._shared.get(key, (today, 0))
+        return ((shared if date == today else 0)
+                + self._pending.get((key, today), 0) + self._flushing.get((key, today), 0))
+
+    def add(self, key: str, label: str):
+        self._labels[key] = label
+        slot = (key, self._today())
+        self._pending[slot] = self._pending.get(slot, 0) + 1
+        if (self.path is not None and time.monotonic() - self._flushed_at >= self.flush_interval
+                and (self._writer is None or self._writer.done())):
+            self._writer = asyncio.ensure_future(self._flush_async())
+
+    def remove(self, key: str):
+        """add()로 기록했지만 실제로 보내지 않은 호출 1건 취소"""
+        slot = (key, self._today())
+        n = self._pending.get(slot, 0) - 1
+        if n:
+            self._pending[slot] = n  # 이미 반영 중/반영된 건이면 음수 증가분으로 다음 flush에서 차감
+        else:
+            self._pending.pop(slot, None)
+
+    def _take_batch(self) -> Dict[tuple, int]:
+        batch, self._pending = self._pending, {}
+        self._flushing = batch
+        self._flushed_at = time.monotonic()
+        return batch
+
+    def _finish_batch(self, batch: Dict[tuple, int], shared: Optional[Dict[str, tuple]]):
+        self._flushing = {}
+        if shared is None:
+            # 반영 실패 → 다음 flush에서 다시 시도
+            for slot, n in batch.items():
+                self._pending[slot] = self._pending.get(slot, 0) + n
+        else:
+            self._shared = shared
+
+    async def _flush_async(self):
+        batch = self._take_batch()
+        shared = None
+        try:
+            shared = await asyncio.to_thread(self._sync, batch)
+        except Exception as e:
+            logger.warning(f"호출량 기록 저장 오류: {str(e)}")
+        finally:
+            self._finish_batch(batch, shared)
+
+    async def flush(self):
+        """남은 증가분을 즉시 반영 (서버 종료 시)
+
+        진행 중인 저장이 있으면 그 배치가 끝나기(실패 시 _pending으로 되돌아오기)를 기다린 뒤
+        남은 것을 한 번에 반영한다.
+        """
+        writer = self._writer
+        if writer is not None and not writer.done():
+            await asyncio.wait({writer})
+        if self.path is None or not self._pending:
+            return
+        await self._flush_async()
+
+
+quota_ledger = QuotaLedger.from_env()
+
+
+class RateLimiter:
+    """자격증명별 토큰 버킷 속도 제한 + 일일 호출 한도
+
+    초당 rate건(버스트 burst건, rate 0이면 속도 제한 없음)을 넘는 요청은 최대 max_wait초까지 대기열에서 기다리고,
+    그보다 오래 기다려야 하거나 일일 한도(daily_limit, 0이면 무제한)를 다 쓰면
+    RateLimitedError로 즉시 실패한다. 사용량이 한도의 cache_first_ratio를 넘으면
+    near_limit()이 True가 되어 캐시 우선(만료 캐시 재사용) 모드로 전환된다.
+    """
+
+    def __init__(self, platform: str, label: str, secret: str, rate: float = 0.0,
+                 burst: float = 10.0, daily_limit: int = 0, max_wait: float = 5.0,
+                 cache_first_ratio: float = 0.9, ledger: Optional[QuotaLedger] = None):
+        self.platform = platform
+        self.label = label
+        # 키 원문 대신 해시로 기록
+        self.key = hashlib.sha256(f"{label}:{secret}".encode('utf-8')).hexdigest()[:16]
+        self.rate = rate
+        self.burst = max(1.0, burst)
+        self.daily_limit = daily_limit
+        self.max_wait = max_wait
+        self.cache_first_ratio = cache_first_ratio
+        self.ledger = ledger or quota_ledger
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self.waited = 0
+        self.rejected = 0
+
+    @classmethod
+    def from_env(cls, platform: str, label: str, secret: str) -> "RateLimiter":
+        return cls(platform, label, secret,
+                   rate=get_env_float(f"{platform}_RATE_PER_SEC", 0.0),
+                   burst=get_env_float(f"{platform}_RATE_BURST", 10.0),
+                   daily_limit=get_env_int(f"{platform}_DAILY_QUOTA", 0),
+                   max_wait=get_env_float("KISTI_RATE_MAX_WAIT", 5.0),
+                   cache_first_ratio=get_env_float("KISTI_QUOTA_CACHE_FIRST_RATIO", 0.9))
+
+    def near_limit(self) -> bool:
+        return bool(self.daily_limit) and \
+            self.ledger.used(self.key) >= self.daily_limit * self.cache_first_ratio
+
+    async def acquire(self):
+        """호출 1건 허가 (필요하면 대기, 한도 초과면 RateLimitedError)"""
+        if self.daily_limit and self.ledger.used(self.key) >= self.daily_limit:
+            self.rejected += 1
+            raise RateLimitedError(f"{self.label} 일일 호출 한도({self.daily_limit}회)를 모두 사용했습니다")
+        if self.rate > 0:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # 토큰을 먼저 예약(음수 허용)해 대기 중인 호출들이 순서대로 깨어나게 함
+            wait = 0.0 if self._tokens >= 1 else (1 - self._tokens) / self.rate
+            if wait > self.max_wait:
+                self.rejected += 1
+                raise RateLimitedError(f"{self.label} 호출 속도 제한 대기({wait:.1f}초)가 너무 깁니다")
+            self._tokens -= 1
+            if wait > 0:
+                self.waited += 1
+                await asyncio.sleep(wait)
+        self.ledger.add(self.key, self.label)
+
+    def try_acquire(self) -> bool:
+        """대기 없이 호출 1건 허가 (헤지 요청용, 여유가 없으면 False)"""
+        if self.daily_limit and self.ledger.used(self.key) >= self.daily_limit:
+            return False
+        if self.rate > 0:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+        self.ledger.add(self.key, self.label)
+        return True
+
+    def refund(self):
+        """acquire()로 받았지만 보내지 못한 호출 1건의 토큰과 사용량 반환 (격벽 거부 등)"""
+        if self.rate > 0:
+            self._tokens = min(self.burst, self._tokens + 1)
+        self.ledger.remove(self.key)
+
+    def describe(self) -> str:
+        used = self.ledger.used(self.key)
+        limit = f"/{self.daily_limit}" if self.daily_limit else " (한도 미설정)"
+        mode = ", 캐시 우선" if self.near_limit() else ""
+        rate = f"{self.rate:g}건/초" if self.rate > 0 else "속도 제한 없음"
+        return (f"오늘 {used}{limit}회{mode}, {rate}, "
+                f"대기 {self.waited}건, 거부 {self.rejected}건")
+
+
+def quota_near_limit(platform: str) -> bool:
+    """플랫폼의 어느 자격증명이든 일일 한도에 근접했는지"""
+    platform = platform.upper()
+    return any(l.platform == platform and l.near_limit()
+               for l in BaseAPIClient._rate_limiters.values())
+
+
 # 추상 기본 클래스들
 class BaseAPIClient(ABC):
-    """API 클라이언트 기본 클래스"""
-    
+    """API 클라이언트 기본 클래스
+
+    업스트림 호스트(base_url)별로 httpx.AsyncClient 커넥션 풀 하나를 공유한다.
+    풀은 첫 요청 시 생성되고 서버 종료 시 close_all()로 정리된다.
+    {PLATFORM}_HTTP2=1 이면 HTTP/2 전송을 사용한다 (ALPN 협상, 미지원 서버는 HTTP/1.1).
+    """
+
+    # 플랫폼 식별자 (플랫폼별 환경변수 접두어)
+    PLATFORM = "KISTI"
+
+    # base_url → 공유 커넥션 풀
+    _http_pools: Dict[str, httpx.AsyncClient] = {}
+
+    # (host, path) → 회로 차단기 (진단 도구에서 전체 조회)
+    _breakers: Dict[tuple, CircuitBreaker] = {}
+
+    # 자격증명 라벨 → 속도 제한/일일 한도
+    _rate_limiters: Dict[str, RateLimiter] = {}
+
+    # (host, path, 타임아웃 프로필) → 응답 시간 표본
+    _latencies: Dict[tuple, LatencyStats] = {}
+
+    # 헤지 요청 카운터 (전체 클라이언트 합계)
+    _hedge_stats: Dict[str, int] = {"hedged": 0, "hedge_wins": 0, "skipped": 0}
+
+    # 타임아웃 프로필별 기본 읽기 제한(초), 없는 프로필은 DEFAULT_READ_TIMEOUT
+    # ({PLATFORM}_READ_TIMEOUT_{프로필} 환경변수로 덮어씀)
+    READ_TIMEOUTS: Dict[str, float] = {}
+    DEFAULT_READ_TIMEOUT = 30.0
+
+    # 인증 실패로 보는 응답 본문 문구 (짧은 응답에서만 검사)
+    AUTH_ERROR_MARKERS: tuple = ()
+    # True면 401/403 또는 AUTH_ERROR_MARKERS 응답 시 해당 엔드포인트를 백오프 동안 즉시 실패 처리
+    AUTH_FAIL_FAST = False
+    # 재시도하지 않을 target (비멱등 호출 등)
+    NO_RETRY_TARGETS: tuple = ()
+
     def __init__(self, base_url: str):
         self.base_url = base_url
         self.access_token = None
-    
+        # 동일 search/get_details 동시 호출 병합
+        self._inflight = SingleFlight()
+        # 인증 실패 기억 (엔드포인트별 지수 백오프)
+        self._auth_backoff = FailureBackoff.from_env()
+        # 일시 오류 재시도 정책 (KISTI_RETRY_* 환경변수)
+        self.retry_policy = RetryPolicy.from_env()
+        # 플랫폼별 동시 호출 격벽 ({PLATFORM}_MAX_INFLIGHT / {PLATFORM}_MAX_QUEUE)
+        self._bulkhead = Bulkhead.from_env(self.PLATFORM)
+        # 연결/풀 대기 제한, 적응형 읽기 제한 (관측 p99 × 배수, 최소/최대 범위 안)
+        self.connect_timeout = get_env_float("KISTI_CONNECT_TIMEOUT", 5.0)
+        self.pool_timeout = get_env_float("KISTI_POOL_TIMEOUT", 10.0)
+        self.adaptive_timeouts = get_env_bool("KISTI_ADAPTIVE_TIMEOUTS")
+        self.adaptive_factor = get_env_float("KISTI_ADAPTIVE_TIMEOUT_FACTOR", 3.0)
+        self.adaptive_min = get_env_float("KISTI_ADAPTIVE_TIMEOUT_MIN", 2.0)
+        self.adaptive_max = get_env_float("KISTI_ADAPTIVE_TIMEOUT_MAX", 120.0)
+        self.adaptive_samples = get_env_int("KISTI_ADAPTIVE_TIMEOUT_SAMPLES", 20)
+        # 멱등 조회 헤징: 관측 p95 안에 응답이 없으면 중복 요청을 보내 먼저 온 응답 사용
+        self.hedging = get_env_bool("KISTI_HEDGING")
+        self.hedge_min_delay = get_env_float("KISTI_HEDGE_MIN_DELAY", 0.1)
+        self.http2 = get_env_bool(f"{self.PLATFORM}_HTTP2")
+        if self.http2 and not _HTTP2_AVAILABLE:
+            logger.warning(f"{self.PLATFORM}_HTTP2가 설정됐지만 h2 패키지가 없어 HTTP/1.1을 사용합니다. "
+                           "(pip install 'httpx[http2]')")
+            self.http2 = False
+        # 커넥션 풀 크기/keep-alive (KISTI_HTTP_* 환경변수로 조정)
+        self._http_limits = httpx.Limits(
+            max_connections=get_env_int("KISTI_HTTP_MAX_CONNECTIONS", 20),
+            max_keepalive_connections=get_env_int("KISTI_HTTP_MAX_KEEPALIVE", 10),
+            keepalive_expiry=get_env_float("KISTI_HTTP_KEEPALIVE_EXPIRY", 30.0),
+        )
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """호스트별 공유 커넥션 풀 반환 (없거나 닫혔으면 새로 생성)"""
+        client = self._http_pools.get(self.base_url)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.DEFAULT_READ_TIMEOUT, connect=self.connect_timeout,
+                                      pool=self.pool_timeout),
+                headers={"User-Agent": USER_AGENT},
+                limits=self._http_limits,
+                http2=self.http2,
+            )
+            self._http_pools[self.base_url] = client
+            logger.info(f"HTTP 커넥션 풀 생성: {self.base_url} "
+                        f"({'HTTP/2 우선' if self.http2 else 'HTTP/1.1'})")
+        return client
+
+    def _credential(self, endpoint: str) -> tuple:
+        """엔드포인트 호출에 쓰이는 자격증명 (환경변수 이름, 값)"""
+        return self.PLATFORM, ""
+
+    def _endpoint_key(self, path: str) -> str:
+        """회로 차단기·응답 시간 표본을 묶을 엔드포인트 이름 (경로에 ID가 들어가면 치환)"""
+        return path
+
+    def _rate_limiter(self, endpoint: str) -> RateLimiter:
+        label, secret = self._credential(endpoint)
+        limiter = self._rate_limiters.get(label)
+        if limiter is None:
+            limiter = self._rate_limiters[label] = RateLimiter.from_env(self.PLATFORM, label, secret)
+        return limiter
+
+    def _latency_stats(self, host: str, endpoint: str, profile: str) -> LatencyStats:
+        key = (host, endpoint, profile)
+        stats = self._latencies.get(key)
+        if stats is None:
+            stats = self._latencies[key] = LatencyStats()
+        return stats
+
+    def _static_read_timeout(self, profile: str) -> float:
+        """프로필 기본 읽기 제한 (환경변수 > READ_TIMEOUTS > {PLATFORM}_READ_TIMEOUT)"""
+        default = self.READ_TIMEOUTS.get(
+            profile, get_env_float(f"{self.PLATFORM}_READ_TIMEOUT", self.DEFAULT_READ_TIMEOUT))
+        return get_env_float(f"{self.PLATFORM}_READ_TIMEOUT_{profile.upper()}", default)
+
+    def _read_timeout(self, profile: str, stats: LatencyStats) -> float:
+        """이번 요청의 읽기 제한 (적응형이면 표본이 충분할 때 p99 기반)"""
+        if self.adaptive_timeouts and len(stats) >= self.adaptive_samples:
+            p99 = stats.percentile(0.99)
+            return min(self.adaptive_max, max(self.adaptive_min, p99 * self.adaptive_factor))
+        return self._static_read_timeout(profile)
+
+    def _timeout(self, profile: str, stats: LatencyStats) -> httpx.Timeout:
+        return httpx.Timeout(connect=self.connect_timeout,
+                             read=self._read_timeout(profile, stats),
+                             write=self.connect_timeout,
+                             pool=self.pool_timeout)
+
+    def describe_timeouts(self) -> Dict[str, str]:
+        """이 클라이언트 엔드포인트별 응답 시간과 현재 읽기 제한"""
+        host = httpx.URL(self.base_url).host
+        report = {}
+        for (h, endpoint, profile), stats in self._latencies.items():
+            if h != host or not len(stats):
+                continue
+            report[f"{endpoint} [{profile}]"] = (
+                f"표본 {len(stats)}, p50 {stats.percentile(0.5):.2f}초, "
+                f"p99 {stats.percentile(0.99):.2f}초, "
+                f"읽기 제한 {self._read_timeout(profile, stats):.1f}초")
+        return report
+
+    def _hedge_delay(self, latency: LatencyStats) -> Optional[float]:
+        """헤지 요청을 보낼 대기 시간 (헤징 꺼짐/표본 부족이면 None)"""
+        if not self.hedging or len(latency) < self.adaptive_samples:
+            return None
+        return max(self.hedge_min_delay, latency.percentile(0.95))
+
+    async def _hedged(self, limiter: RateLimiter, hedge_after: Optional[float],
+                      method: str, url: str, **kwargs) -> httpx.Response:
+        """요청 1회 (hedge_after초 안에 응답이 없으면 중복 요청, 먼저 성공한 응답 반환)
+
+        중복 요청은 주 요청이 커넥션을 점유 중일 때 보내므로 풀의 다른 커넥션을 쓴다.
+        성공은 예외 없이 429/5xx가 아닌 응답이다. 먼저 끝난 쪽이 실패면 다른 쪽을 기다리고,
+        둘 다 실패면 주 요청 쪽 응답(없으면 헤지 응답, 둘 다 예외면 주 요청 예외)을 돌려준다.
+        진 쪽 요청은 취소한다. 헤지 예산이나 속도 제한 여유가 없으면 주 요청만 기다린다.
+        """
+        client = self._get_http_client()
+        if hedge_after is None:
+            return await client.request(method, url, **kwargs)
+        hedge_budget.on_request()
+        primary = asyncio.ensure_future(client.request(method, url, **kwargs))
+        tasks = [primary]
+        winner = None
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=hedge_after)
+            if not done and hedge_budget.try_spend():
+                if not limiter.try_acquire():
+                    # 속도 제한으로 보내지 못한 헤지는 예산을 쓰지 않음
+                    hedge_budget.refund()
+                else:
+                    tasks.append(asyncio.ensure_future(client.request(method, url, **kwargs)))
+            if len(tasks) == 1:
+                if not done:
+                    self._hedge_stats["skipped"] += 1
+                winner = primary
+                return await primary
+            self._hedge_stats["hedged"] += 1
+            logger.info(f"{self.PLATFORM} 헤지 요청 ({hedge_after:.2f}초 무응답): {httpx.URL(url).path}")
+            pending = set(tasks)
+            while pending and winner is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in tasks:
+                    if winner is None and task in done and self._hedge_succeeded(task):
+                        winner = task
+            if winner is None:
+                # 둘 다 실패: 응답이 있는 쪽(주 요청 우선), 둘 다 예외면 주 요청 예외
+                winner = next((t for t in tasks if t.exception() is None), primary)
+            elif winner is not primary:
+                self._hedge_stats["hedge_wins"] += 1
+            return winner.result()
+        finally:
+            for task in tasks:
+                if task is winner:
+                    continue
+                if not task.done():
+                    task.cancel()
+                task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+    @staticmethod
+    def _hedge_succeeded(task: asyncio.Future) -> bool:
+        """헤지 경쟁에서 채택할 결과인지 (예외 없이 받은 429/5xx 아닌 응답)"""
+        if task.exception() is not None:
+            return False
+        status = task.result().status_code
+        return status < 500 and status != 429
+
+    def _retry_for(self, target: str) -> Optional[RetryPolicy]:
+        """target별 재시도 정책 (NO_RETRY_TARGETS면 None)"""
+        return None if target in self.NO_RETRY_TARGETS else self.retry_policy
+
+    async def _send(self, method: str, url: str, retry: Optional[RetryPolicy],
+                    profile: str, hedge: bool, **kwargs) -> httpx.Response:
+        """재시도 정책에 따라 요청 전송 (재시도는 프로세스 재시도 예산 안에서만)"""
+        retry_budget.on_request()
+        parsed = httpx.URL(url)
+        endpoint = self._endpoint_key(parsed.path)
+        limiter = self._rate_limiter(endpoint)
+        latency = self._latency_stats(parsed.host, endpoint, profile)
+        attempt = 0
+        while True:
+            await limiter.acquire()
+            admitted = False
+            try:
+                # 격벽 자리는 전송 시도마다 잡음 (속도 제한 대기·재시도 대기 중에는 점유 안 함)
+                async with self._bulkhead.slot():
+                    admitted = True
+                    started = time.perf_counter()
+                    response = await self._hedged(
+                        limiter, self._hedge_delay(latency) if hedge else None,
+                        method, url, timeout=self._timeout(profile, latency), **kwargs)
+                error = None
+                if response.status_code < 500:
+                    latency.record(time.perf_counter() - started)
+            except httpx.TransportError as e:
+                response, error = None, e
+                if isinstance(e, httpx.ReadTimeout):
+                    # 시간 초과도 표본에 넣어야 느려진 엔드포인트의 적응형 제한이 따라 올라감
+                    latency.record(time.perf_counter() - started)
+            finally:
+                if not admitted:
+                    # 격벽 거부/대기 중 취소로 보내지 못함 → 받은 호출 허가를 되돌림
+                    limiter.refund()
+            if retry is None or not retry.should_retry(method, attempt, response, error):
+                break
+            wait = retry.delay(attempt, response)
+            if wait is None or not retry_budget.try_spend():
+                break
+            attempt += 1
+            cause = f"{type(error).__name__}" if error else f"HTTP {response.status_code}"
+            logger.warning(f"{self.PLATFORM} 요청 재시도 {attempt}/{retry.max_retries} "
+                           f"({cause}, {wait:.2f}초 후): {httpx.URL(url).path}")
+            if response is not None:
+                await response.aclose()
+            await asyncio.sleep(wait)
+        if error is not None:
+            raise error
+        return response
+
+    async def _request(self, method: str, url: str, retry=True, profile: str = "DEFAULT",
+                       hedge: bool = False, **kwargs) -> httpx.Response:
+        """공유 커넥션 풀로 HTTP 요청 수행
+
+        retry: RetryPolicy, True(클라이언트 기본 정책, 기본값) 또는 None/False(재시도 안 함).
+        profile: 타임아웃 프로필 이름 (보통 target, READ_TIMEOUTS 참고).
+        hedge: 멱등 조회만 True (KISTI_HEDGING=1이면 관측 p95 후 중복 요청).
+        AUTH_FAIL_FAST 클라이언트는 인증 실패 백오프 중인 엔드포인트면 호출하지 않고
+        AuthBackoffError를 던진다.
+        """
+        if retry is True:
+            retry = self.retry_policy
+        elif not retry:
+            retry = None
+        parsed = httpx.URL(url)
+        endpoint = self._endpoint_key(parsed.path)
+        if self.AUTH_FAIL_FAST:
+            reason = self._auth_backoff.check(endpoint)
+            if reason:
+                raise AuthBackoffError(f"{self.PLATFORM} 인증 오류로 호출을 건너뜁니다: {reason}")
+
+        response = await self._send_guarded(parsed.host, endpoint, method, url, retry,
+                                            profile, hedge, **kwargs)
+
+        if self.AUTH_FAIL_FAST:
+            reason = self._auth_failure_reason(response)
+            if reason:
+                self._auth_backoff.failure(endpoint, reason)
+            else:
+                self._auth_backoff.success(endpoint)
+        return response
+
+    async def _send_guarded(self, host: str, endpoint: str, method: str, url: str,
+                            retry: Optional[RetryPolicy], profile: str, hedge: bool,
+                            **kwargs) -> httpx.Response:
+        """(host, endpoint) 회로 차단기를 거쳐 전송 (5xx/전송 오류를 실패로 기록)"""
+        key = (host, endpoint)
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            breaker = self._breakers[key] = CircuitBreaker.from_env(f"{host}{endpoint}")
+        generation = breaker.allow()
+        if generation is None:
+            raise CircuitOpenError(f"{self.PLATFORM} 서버 응답 불안정으로 호출을 건너뜁니다 "
+                                   f"({endpoint}, {breaker.retry_in():.0f}초 후 재시도)")
+        recorded = False
+        try:
+            response = await self._send(method, url, retry, profile, hedge, **kwargs)
+            breaker.record(generation, response.status_code < 500)
+            recorded = True
+            return response
+        except httpx.TransportError:
+            breaker.record(generation, False)
+            recorded = True
+            raise
+        finally:
+            if not recorded:
+                breaker.release(generation)
+
+    def _auth_failure_reason(self, response: httpx.Response) -> Optional[str]:
+        """인증 실패 응답이면 사유 반환"""
+        if response.status_code in (401, 403):
+            return f"HTTP {response.status_code}"
+        if self.AUTH_ERROR_MARKERS and len(response.content) < 2048:
+            text = response.text
+            for marker in self.AUTH_ERROR_MARKERS:
+                if marker in text:
+                    return marker
+        return None
+
+    @classmethod
+    async def close_all(cls):
+        """모든 호스트의 커넥션 풀 종료"""
+        pools = list(cls._http_pools.items())
+        cls._http_pools.clear()
+        for base_url, client in pools:
+            try:
+                await client.aclose()
+                logger.info(f"HTTP 커넥션 풀 종료: {base_url}")
+            except Exception as e:
+                logger.warning(f"HTTP 커넥션 풀 종료 중 오류 ({base_url}): {str(e)}")
+
     @abstractmethod
     async def get_token(self) -> bool:
         """토큰 발급"""
@@ -159,6 +1598,20 @@ class BaseAPIClient(ABC):
         pass
 class BaseResultFormatter(ABC):
     """결과 포맷터 기본 클래스"""
+
+    @staticmethod
+    def stale_notice(result: Dict[str, Any]) -> str:
+        """호출 한도 때문에 만료된 캐시 응답을 쓴 경우 결과 앞에 붙일 안내 (아니면 빈 문자열)"""
+        age = result.get("stale_age")
+        if age is None:
+            return ""
+        if age >= 3600:
+            elapsed = f"{age / 3600:.1f}시간"
+        elif age >= 60:
+            elapsed = f"{int(age // 60)}분"
+        else:
+            elapsed = "1분 미만"
+        return f"⚠️ 호출 한도 때문에 캐시된 결과(저장 후 {elapsed} 경과)를 표시합니다. 최신이 아닐 수 있습니다.\n\n"
     
     @abstractmethod
     def format_search_results(self, results: List[Dict], query: str, total_count: int, result_type: str) -> str:
@@ -169,9 +1622,585 @@ class BaseResultFormatter(ABC):
     def format_detail_result(self, result: Dict, identifier: str) -> str:
         """상세 결과 포맷팅"""
         pass
+
+
+# XML 스트리밍 파싱
+XML_FEED_CHUNK = 64 * 1024
+
+_XML_ENCODING_DECL = re.compile(rb'<\?xml[^>]*encoding=["\']([A-Za-z0-9._-]+)["\']')
+
+
+def body_preview(data: Union[bytes, str], limit: int) -> str:
+    """응답 본문 앞부분 (오류 메시지/로그용, 잘린 멀티바이트 문자는 치환)"""
+    if isinstance(data, bytes):
+        return data[:limit].decode('utf-8', errors='replace')
+    return data[:limit]
+
+
+def log_body(label: str, content: bytes, limit: int = 500):
+    """응답 본문 미리보기 DEBUG 로그 (DEBUG가 꺼져 있으면 본문을 디코딩하지 않음)"""
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"{label}: {body_preview(content, limit)}...")
+
+
+def stream_xml_records(data: Union[bytes, str], record_path: Optional[str], convert) -> tuple:
+    """XML을 청크 단위로 증분 파싱하며 레코드가 닫히는 즉시 convert해 수집하고 하위 트리를 버림
+
+    record_path: "RESULTSET/HIT"(루트 기준 정확한 경로), ".//record"(모든 깊이의 태그), None(레코드 없음)
+    반환: (레코드가 제거된 루트 엘리먼트, convert 결과 리스트). 문법 오류는 ET.ParseError.
+    """
+    if isinstance(data, bytes):
+        # expat이 직접 못 읽는 멀티바이트 인코딩(EUC-KR 등) 선언이면 문자열로 풀어 파싱
+        declared = _XML_ENCODING_DECL.match(data[:200].lstrip())
+        encoding = declared.group(1).decode('ascii').lower().replace('_', '-') if declared else ''
+        if encoding and encoding not in ('utf-8', 'utf8', 'us-ascii', 'ascii', 'iso-8859-1', 'latin-1'):
+            data = data.decode(encoding, errors='replace')
+    if record_path is None:
+        any_depth, path = False, ()
+    elif record_path.startswith('.//'):
+        any_depth, path = True, (record_path[3:],)
+    else:
+        any_depth, path = False, tuple(record_path.split('/'))
+    parser = ET.XMLPullParser(events=('start', 'end'))
+    stack: List[ET.Element] = []
+    records = []
+    root = None
+
+    def drain():
+        nonlocal root
+        for event, elem in parser.read_events():
+            if event == 'start':
+                if root is None:
+                    root = elem
+                stack.append(elem)
+                continue
+            stack.pop()
+            if not stack or not path:
+                continue
+            if any_depth:
+                matched = elem.tag == path[0]
+            else:
+                matched = len(stack) == len(path) and elem.tag == path[-1] and \
+                    all(stack[i].tag == path[i - 1] for i in range(1, len(path)))
+            if matched:
+                records.append(convert(elem))
+                stack[-1].remove(elem)
+                elem.clear()
+
+    for start in range(0, len(data), XML_FEED_CHUNK):
+        parser.feed(data[start:start + XML_FEED_CHUNK])
+        drain()
+    parser.close()
+    drain()
+    return root, records
+
+
+class ElementPathTable:
+    """여러 elem.find(path)를 한 번의 순회로 대신하는 경로 표
+
+    지원 경로: 'Child'(직계 자식), './/Parent/Child', './/Parent[@attr="값"]/Child'.
+    find_all(elem)은 경로 → 엘리먼트 dict를 돌려주며 각 값은 elem.find(path)와 같다
+    (문서 순서상 첫 일치, 없으면 키 없음).
+    """
+
+    _PARENT = re.compile(r'^(\w+)((?:\[@\w+="[^"]*"\])*)$')
+
+    def __init__(self, paths):
+        self.paths = tuple(paths)
+        self._children: Dict[str, str] = {}
+        # 부모 태그 → [(속성 조건, 자식 태그, 경로)]
+        self._nested: Dict[str, List[tuple]] = {}
+        for path in self.paths:
+            if '/' not in path and '[' not in path:
+                self._children[path] = path
+                continue
+            parent, _, child = path[3:].rpartition('/') if path.startswith('.//') else ('', '', '')
+            matched = self._PARENT.match(parent)
+            if not matched or not child.isidentifier():
+                raise ValueError(f"지원하지 않는 경로: {path}")
+            attrs = tuple(re.findall(r'\[@(\w+)="([^"]*)"\]', matched.group(2)))
+            self._nested.setdefault(matched.group(1), []).append((attrs, child, path))
+
+    def find_all(self, elem) -> Dict[str, ET.Element]:
+        found: Dict[str, ET.Element] = {}
+        for child in elem:
+            path = self._children.get(child.tag)
+            if path is not None and path not in found:
+                found[path] = child
+        for node in elem.iter():
+            rules = self._nested.get(node.tag)
+            if rules is None or node is elem:
+                continue
+            for attrs, child_tag, path in rules:
+                if path in found or any(node.get(k) != v for k, v in attrs):
+                    continue
+                match = node.find(child_tag)
+                if match is not None:
+                    found[path] = match
+        return found
+
+
+def parse_xml(data: Union[bytes, str]) -> ET.Element:
+    """XML 전체를 증분 파싱해 루트 반환 (작은 응답용)"""
+    return stream_xml_records(data, None, None)[0]
+
+
+# 압축 레코드 (대량 검색 결과의 메모리 절감)
+class CompactRecord(Mapping):
+    """읽기 전용 dict 호환 레코드
+
+    같은 키 구성(shape)의 레코드끼리 키 → 위치 표를 공유하고 값만 튜플로 보관한다.
+    포맷터는 dict처럼 get/[]/in/items로 읽으면 된다. 중첩 dict 값도 CompactRecord로 바꾼다.
+    """
+
+    __slots__ = ("_shape", "_values")
+
+    # 레코드 계열별 shape 표 (키 튜플 → {키: 위치}), 계열마다 최대 MAX_SHAPES개까지만 공유
+    _shapes: Dict[tuple, Dict[str, int]] = {}
+    MAX_SHAPES = 1024
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._shapes = {}
+
+    def __init__(self, data: Mapping):
+        keys = tuple(data)
+        shape = self._shapes.get(keys)
+        if shape is None:
+            shape = {key: i for i, key in enumerate(keys)}
+            if len(self._shapes) < self.MAX_SHAPES:
+                self._shapes[keys] = shape
+        self._shape = shape
+        self._values = tuple(CompactRecord(v) if type(v) is dict else v for v in data.values())
+
+    def __getitem__(self, key):
+        return self._values[self._shape[key]]
+
+    def get(self, key, default=None):
+        index = self._shape.get(key)
+        return default if index is None else self._values[index]
+
+    def __contains__(self, key) -> bool:
+        return key in self._shape
+
+    def __iter__(self):
+        return iter(self._shape)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """중첩 레코드까지 일반 dict로 변환"""
+        return {k: v.to_dict() if isinstance(v, CompactRecord) else v for k, v in self.items()}
+
+
+class PaperRecord(CompactRecord):
+    """ScienceON 논문"""
+    __slots__ = ()
+
+
+class PatentRecord(CompactRecord):
+    """ScienceON 특허"""
+    __slots__ = ()
+
+
+class ReportRecord(CompactRecord):
+    """ScienceON/NTIS 보고서"""
+    __slots__ = ()
+
+
+class ProjectRecord(CompactRecord):
+    """NTIS 과제 (검색/추천)"""
+    __slots__ = ()
+
+
+class OutcomeRecord(CompactRecord):
+    """NTIS 성과"""
+    __slots__ = ()
+
+
+class DatasetRecord(CompactRecord):
+    """DataON 연구데이터"""
+    __slots__ = ()
+
+
+# NTIS target 명세 (요청 구성·응답 파싱을 target별 표로 관리)
+class NTISTargetSpec:
+    """NTIS target 하나의 요청/응답 명세
+
+    endpoint: 경로 문자열 또는 query를 받아 경로를 돌려주는 함수
+    build_params(query, max_results, api_key): 요청 파라미터 dict (잘못된 query면 ValueError)
+    response_format: "xml" 또는 "json"
+    record_path: 스트리밍 중 레코드로 변환할 엘리먼트 경로 (stream_xml_records 참고, 없으면 None)
+    record_parser / parser: NTISClient 메서드 이름. parser는 record_path가 있으면 (root, results),
+    없으면 (root)를 받는다.
+    record_type: 레코드를 담을 CompactRecord 계열 (None이면 dict 그대로)
+    read_timeout: 기본 읽기 제한(초), None이면 플랫폼 기본값
+    """
+
+    __slots__ = ("target", "endpoint", "build_params", "method", "response_format",
+                 "record_path", "record_parser", "record_type", "parser", "read_timeout",
+                 "description")
+
+    def __init__(self, target: str, endpoint, build_params, method: str = "GET",
+                 response_format: str = "xml", record_path: Optional[str] = None,
+                 record_parser: Optional[str] = None, record_type: Optional[type] = None,
+                 parser: Optional[str] = None, read_timeout: Optional[float] = None,
+                 description: str = ""):
+        self.target = target
+        self.endpoint = endpoint
+        self.build_params = build_params
+        self.method = method
+        self.response_format = response_format
+        self.record_path = record_path
+        self.record_parser = record_parser
+        self.record_type = record_type
+        self.parser = parser
+        self.read_timeout = read_timeout
+        self.description = description
+
+    def endpoint_for(self, query) -> str:
+        return self.endpoint(query) if callable(self.endpoint) else self.endpoint
+
+    def describe(self) -> Dict[str, Any]:
+        """진단/벤치마크용 명세 요약"""
+        return {
+            "target": self.target,
+            "endpoint": "(query별)" if callable(self.endpoint) else self.endpoint,
+            "method": self.method,
+            "format": self.response_format,
+            "records": self.record_path or "-",
+            "record_type": self.record_type.__name__ if self.record_type else "dict",
+            "parser": self.parser or "-",
+            "read_timeout": self.read_timeout,
+            "description": self.description,
+        }
+
+
+# collection별 DBT값 (성과/통합검색 addQuery에 필수)
+_NTIS_DBT = {"rpaper": "PAP", "rpatent": "PAT", "requip": "EQU", "rresearch": "TRKO"}
+
+# 분류 추천 컬렉션 (일반 / 항목별 세부)
+_NTIS_CLASSIFICATION_COLLECTIONS = {
+    "standard": ("rcmncls", "rcmnclsdtl"),
+    "health": ("rcmnhtcls", "rcmnhtclsdtl"),
+    "industry": ("rcmnitcls", "rcmnitclsdtl"),
+}
+
+# 성과검색 권한 단계별 엔드포인트
+_NTIS_OUTCOME_ENDPOINTS = {
+    "all": "/rndopen/openApi/natRnDAllSearch",
+    "org": "/rndopen/openApi/natRnDSearch",
+    "public": "/rndopen/openApi/public_result",
+}
+
+
+def _ntis_search_params(collection: str):
+    """과제검색/추천 공통 파라미터 구성 함수"""
+    def build(query, max_results, api_key):
+        return {
+            "apprvKey": api_key,
+            "userId": "",
+            "collection": collection,
+            "SRWR": query,
+            "searchFd": "",
+            "addQuery": "",
+            "searchRnkn": "",
+            "startPosition": 1,
+            "displayCnt": min(max_results, 100)
+        }
+    return build
+
+
+def _ntis_classification_params(query, max_results, api_key):
+    # query가 튜플 형태로 (실제_쿼리, 분류_타입) 전달될 것으로 가정
+    if isinstance(query, tuple):
+        actual_query, classification_type = query
+    else:
+        actual_query, classification_type = query, "standard"
+    collections = _NTIS_CLASSIFICATION_COLLECTIONS.get(
+        classification_type, _NTIS_CLASSIFICATION_COLLECTIONS["standard"])
+    return {
+        "apprvKey": api_key,
+        "collection": collections[0],
+        "rqstDes": actual_query
+    }
+
+
+def _ntis_classification_detailed_params(query, max_results, api_key):
+    # query가 튜플 형태로 (research_goal, research_content, expected_effect, korean_keywords, english_keywords, classification_type) 전달
+    if not (isinstance(query, tuple) and len(query) == 6):
+        raise ValueError("CLASSIFICATION_DETAILED 타입에는 6개 파라미터가 필요합니다")
+    research_goal, research_content, expected_effect, korean_keywords, english_keywords, classification_type = query
+    collections = _NTIS_CLASSIFICATION_COLLECTIONS.get(
+        classification_type, _NTIS_CLASSIFICATION_COLLECTIONS["standard"])
+    return {
+        "apprvKey": api_key,
+        "collection": collections[1],
+        "rschGoalAbstract": research_goal,
+        "rschAbstract": research_content,
+        "expEfctAbstract": expected_effect,
+        "korKywd": korean_keywords,
+        "engKywd": english_keywords
+    }
+
+
+def _ntis_related_content_params(query, max_results, api_key):
+    # query가 튜플 형태로 (pjtId, collection_type) 전달될 것으로 가정
+    if isinstance(query, tuple):
+        pjt_id, collection_type = query
+    else:
+        pjt_id, collection_type = query, "researchreport"
+    return {
+        "apprvKey": api_key,
+        "pjtId": pjt_id,
+        "collection": collection_type
+    }
+
+
+def _ntis_outcome_query(query) -> tuple:
+    """성과검색 query=(검색어, collection, level) 정규화
+
+    level: "all"(전문기관용 natRnDAllSearch) / "org"(기관용 natRnDSearch) / "public"(전체용 public_result)
+    """
+    if isinstance(query, tuple) and len(query) == 3:
+        return query
+    if isinstance(query, tuple):
+        return query[0], query[1], "public"
+    return query, "rpaper", "public"
+
+
+def _ntis_outcome_endpoint(query) -> str:
+    level = _ntis_outcome_query(query)[2]
+    return _NTIS_OUTCOME_ENDPOINTS.get(level, _NTIS_OUTCOME_ENDPOINTS["public"])
+
+
+def _ntis_outcome_params(query, max_results, api_key):
+    srwr, collection_type, _ = _ntis_outcome_query(query)
+    return {
+        "apprvKey": api_key,
+        "userId": "",
+        "collection": collection_type,
+        "SRWR": srwr,
+        "searchFd": "BI",
+        "addQuery": f"DBT={_NTIS_DBT.get(collection_type, 'PAP')}",
+        "startPosition": 1,
+        "displayCnt": min(max_results, 100),
+    }
+
+
+def _ntis_report_params(query, max_results, api_key):
+    return {
+        "apprvKey": api_key,
+        "userId": "",
+        "collection": "researchpdf",
+        "query": query,
+        "searchField": "BI",
+        "startPosition": 1,
+        "displayCount": min(max_results, 100),
+        "returnType": "xml",
+    }
+
+
+def _ntis_terminology_params(query, max_results, api_key):
+    return {
+        "apprvKey": api_key,
+        "userId": "",
+        "query": query,
+        "searchField": "BI",
+        "startPosition": 1,
+        "displayCount": min(max_results, 100),
+    }
+
+
+def _ntis_org_status_params(query, max_results, api_key):
+    # query=(값, mode) mode: "bno" 또는 "nm"
+    if isinstance(query, tuple):
+        org_value, mode = query
+    else:
+        org_value, mode = query, "nm"
+    params = {"apprvKey": api_key}
+    if mode == "bno":
+        params["reqOrgBno"] = org_value
+    else:
+        params["reqOrgNm"] = org_value
+    return params
+
+
+def _ntis_issue_params(query, max_results, api_key):
+    # SRWR 선택, 미입력시 최신 5개
+    params = {"apprvKey": api_key}
+    if query:
+        params["SRWR"] = query
+    return params
+
+
+def _ntis_class_code_params(query, max_results, api_key):
+    # query=(rqstSlctCd, rqstSearchCd)
+    if isinstance(query, tuple):
+        slct_cd, search_cd = query
+    else:
+        slct_cd, search_cd = query, ""
+    params = {"apprvKey": api_key, "rqstSlctCd": slct_cd}
+    if search_cd:
+        params["rqstSearchCd"] = search_cd
+    return params
+
+
+def _ntis_commission_params(query, max_results, api_key):
+    return {"apprvKey": api_key, "pjtId": query}
+
+
+def _ntis_participation_params(query, max_results, api_key):
+    # query=(psnNm, rrNo)
+    if isinstance(query, tuple):
+        psn_nm, rr_no = query
+    else:
+        psn_nm, rr_no = query, ""
+    return {"apprvKey": api_key, "psnNm": psn_nm, "rrNo": rr_no}
+
+
+def _ntis_total_search_params(query, max_results, api_key):
+    # query=(검색어, collection)
+    if isinstance(query, tuple):
+        srwr, collection_type = query
+    else:
+        srwr, collection_type = query, "project"
+    params = {
+        "apprvKey": api_key,
+        "userId": "",
+        "collection": collection_type,
+        "SRWR": srwr,
+        "searchFd": "BI",
+        "startPosition": 1,
+        "displayCnt": min(max_results, 100),
+    }
+    if collection_type in _NTIS_DBT:
+        params["addQuery"] = f"DBT={_NTIS_DBT[collection_type]}"
+    return params
+
+
+def _ntis_researcher_info_params(query, max_results, api_key):
+    # query=(nm, rrno, brthdt)
+    if isinstance(query, tuple) and len(query) == 3:
+        nm, rrno, brthdt = query
+    elif isinstance(query, tuple):
+        nm, rrno = query
+        brthdt = ""
+    else:
+        nm, rrno, brthdt = query, "", ""
+    params = {"apprvKey": api_key, "nm": nm}
+    if rrno:
+        params["rrno"] = rrno
+    if brthdt:
+        params["brthdt"] = brthdt
+    return params
+
+
+def _ntis_project_spec(target: str, endpoint: str, collection: str, description: str) -> NTISTargetSpec:
+    return NTISTargetSpec(target, endpoint, _ntis_search_params(collection),
+                          record_path="RESULTSET/HIT", record_parser="_parse_project_hit",
+                          record_type=ProjectRecord, parser="_parse_project_response",
+                          description=description)
+
+
+def _ntis_resultset_spec(target: str, endpoint, build_params, read_timeout: Optional[float],
+                         description: str, record_type: type = CompactRecord) -> NTISTargetSpec:
+    return NTISTargetSpec(target, endpoint, build_params,
+                          record_path="RESULTSET/HIT", record_parser="_flatten_element",
+                          record_type=record_type, parser="_parse_resultset_response",
+                          read_timeout=read_timeout, description=description)
+
+
+NTIS_TARGETS: Dict[str, NTISTargetSpec] = {spec.target: spec for spec in (
+    # 전체용=public_project, 전문기관용=projectAllSearch (자동 폴백용)
+    _ntis_project_spec("PROJECT", "/rndopen/openApi/public_project", "project", "과제검색 (전체용)"),
+    _ntis_project_spec("PROJECT_SPECIAL", "/rndopen/openApi/projectAllSearch", "project",
+                       "과제검색 (전문기관용)"),
+    _ntis_project_spec("RECOMMENDATION", "/rndopen/openApi/public_recommend", "recommend", "과제 추천"),
+    NTISTargetSpec("CLASSIFICATION", "/rndopen/openApi/rcmncls", _ntis_classification_params,
+                   parser="_parse_classification_response", read_timeout=45.0,
+                   description="과학기술표준분류 추천"),
+    # 항목별 세부 추천 (응답은 과제검색과 같은 경로로 파싱)
+    NTISTargetSpec("CLASSIFICATION_DETAILED", "/rndopen/openApi/rcmncls",
+                   _ntis_classification_detailed_params,
+                   record_path="RESULTSET/HIT", record_parser="_parse_project_hit",
+                   record_type=ProjectRecord, parser="_parse_project_response", read_timeout=60.0,
+                   description="분류 항목별 세부 추천"),
+    NTISTargetSpec("RELATED_CONTENT", "/rndopen/openApi/ConnectionContent",
+                   _ntis_related_content_params, response_format="json", read_timeout=45.0,
+                   description="연관콘텐츠 (JSON)"),
+    _ntis_resultset_spec("OUTCOME", _ntis_outcome_endpoint, _ntis_outcome_params, None,
+                         "성과검색 (논문/특허/연구시설장비/보고서)", OutcomeRecord),
+    _ntis_resultset_spec("REPORT_SEARCH", "/rndopen/openApi/rresearchpdf/", _ntis_report_params, None,
+                         "국가R&D 연구보고서", ReportRecord),
+    _ntis_resultset_spec("TERMINOLOGY", "/rndopen/openApi/ntisDic", _ntis_terminology_params, 10.0,
+                         "국가R&D 용어사전"),
+    _ntis_resultset_spec("COMMISSION", "/rndopen/openApi/projectuOrg", _ntis_commission_params, 15.0,
+                         "위탁/공동연구 과제 (기관용)"),
+    _ntis_resultset_spec("TOTAL_SEARCH", "/rndopen/openApi/totalRstSearch", _ntis_total_search_params,
+                         45.0, "국가R&D 통합검색 (기관용)"),
+    NTISTargetSpec("ORG_STATUS", "/rndopen/openApi/orgRndInfo", _ntis_org_status_params,
+                   parser="_parse_org_status_response", description="수행기관 R&D현황"),
+    NTISTargetSpec("ISSUE", "/rndopen/openApi/issue", _ntis_issue_params,
+                   parser="_parse_issue_response", read_timeout=10.0, description="이슈로보는R&D"),
+    # 분류/중점기술 코드검색은 POST 방식
+    NTISTargetSpec("CLASS_CODE", "/rndopen/openApi/targetSearch", _ntis_class_code_params,
+                   method="POST", parser="_parse_class_code_response", read_timeout=10.0,
+                   description="표준분류/중점기술 코드검색"),
+    NTISTargetSpec("PARTICIPATION", "/rndopen/openApi/prtcpProdRt", _ntis_participation_params,
+                   parser="_parse_participation_response", read_timeout=15.0,
+                   description="과제참여정보 (전문기관용)"),
+    NTISTargetSpec("RESEARCHER_INFO", "/rndopen/openApi/rsrcInfo", _ntis_researcher_info_params,
+                   parser="_parse_researcher_info_response", read_timeout=15.0,
+                   description="출연(연) 연구자정보 (기관용)"),
+)}
+
+
 # NTIS 전용 구현  
 class NTISClient(BaseAPIClient):
     """NTIS OpenAPI 클라이언트"""
+
+    PLATFORM = "NTIS"
+    AUTH_FAIL_FAST = True
+    AUTH_ERROR_MARKERS = ("유효한 인증키가 아닙니다", "접근 허용 IP가 아닙니다")
+    # POST(분류코드 검색)는 재시도하지 않음
+    NO_RETRY_TARGETS = tuple(t for t, spec in NTIS_TARGETS.items() if spec.method != "GET")
+    # 가벼운 조회는 빨리 실패, 분류 상세·통합검색 등 무거운 조회는 길게 (NTIS_TARGETS 참고)
+    READ_TIMEOUTS = {t: spec.read_timeout for t, spec in NTIS_TARGETS.items() if spec.read_timeout}
+    # 과제 HIT에서 꺼내는 필드 경로 (_parse_project_hit)
+    _PROJECT_HIT_PATHS = ElementPathTable((
+        'ProjectNumber',
+        './/ProjectTitle/Korean',
+        './/ProjectTitle/English',
+        './/Manager/Name',
+        './/Researchers/Name',
+        './/Researchers/ManCount',
+        './/Researchers/WomanCount',
+        './/ResearchAgency/Name',
+        './/OrderAgency/Name',
+        './/BudgetProject/Name',
+        './/Ministry/Name',
+        'ProjectYear',
+        './/ProjectPeriod/Start',
+        './/ProjectPeriod/End',
+        './/ProjectPeriod/TotalStart',
+        './/ProjectPeriod/TotalEnd',
+        'GovernmentFunds',
+        'TotalFunds',
+        './/Goal/Full',
+        './/Goal/Teaser',
+        './/Abstract/Full',
+        './/Abstract/Teaser',
+        './/Effect/Full',
+        './/Effect/Teaser',
+        './/Keyword/Korean',
+        './/Keyword/English',
+        './/ScienceClass[@type="new"][@sequence="1"]/Large',
+    ))
     
     def __init__(self):
         super().__init__("https://www.ntis.go.kr")
@@ -194,11 +2223,15 @@ class NTISClient(BaseAPIClient):
     def _get_api_key(self, target: str) -> str:
         """API KEY 반환 (모든 서비스에서 동일한 키 사용)"""
         return self.api_key
+
+    def _credential(self, endpoint: str) -> tuple:
+        return "NTIS_API_KEY", self.api_key
     
     async def get_token(self) -> bool:
         """NTIS는 토큰 발급이 필요하지 않음"""
         return True
     
+    @single_flight
     async def search(self, query: str, target: str, max_results: int = 10) -> Dict[str, Any]:
         """NTIS 검색 수행"""
         
@@ -206,273 +2239,49 @@ class NTISClient(BaseAPIClient):
         if not api_key:
             return {"error": True, "message": f"{target} 서비스에 대한 NTIS API KEY가 설정되지 않았습니다"}
         
-        # target에 따른 엔드포인트 결정
-        if target in ("PROJECT", "PROJECT_SPECIAL"):
-            # 전체용=public_project, 전문기관용=projectAllSearch (자동 폴백용)
-            endpoint = ("/rndopen/openApi/projectAllSearch"
-                        if target == "PROJECT_SPECIAL"
-                        else "/rndopen/openApi/public_project")
-            params = {
-                "apprvKey": api_key,
-                "userId": "",
-                "collection": "project",
-                "SRWR": query,
-                "searchFd": "",
-                "addQuery": "",
-                "searchRnkn": "",
-                "startPosition": 1,
-                "displayCnt": min(max_results, 100)
-            }
-        elif target == "CLASSIFICATION":
-            # 분류 타입별 엔드포인트와 컬렉션 결정
-            # query가 튜플 형태로 (실제_쿼리, 분류_타입) 전달될 것으로 가정
-            if isinstance(query, tuple):
-                actual_query, classification_type = query
-            else:
-                actual_query, classification_type = query, "standard"
-            
-            classification_configs = {
-                "standard": {
-                    "endpoint": "/rndopen/openApi/rcmncls",
-                    "collection": "rcmncls"
-                },
-                "health": {
-                    "endpoint": "/rndopen/openApi/rcmncls", 
-                    "collection": "rcmnhtcls"
-                },
-                "industry": {
-                    "endpoint": "/rndopen/openApi/rcmncls",
-                    "collection": "rcmnitcls"
-                }
-            }
-            
-            config = classification_configs.get(classification_type, classification_configs["standard"])
-            endpoint = config["endpoint"]
-            params = {
-                "apprvKey": api_key,
-                "collection": config["collection"],
-                "rqstDes": actual_query
-            }
-        elif target == "CLASSIFICATION_DETAILED":
-            # 항목별 세부 추천 모드
-            # query가 튜플 형태로 (research_goal, research_content, expected_effect, korean_keywords, english_keywords, classification_type) 전달
-            if isinstance(query, tuple) and len(query) == 6:
-                research_goal, research_content, expected_effect, korean_keywords, english_keywords, classification_type = query
-            else:
-                return {"error": True, "message": "CLASSIFICATION_DETAILED 타입에는 6개 파라미터가 필요합니다"}
-            
-            classification_configs = {
-                "standard": {
-                    "endpoint": "/rndopen/openApi/rcmncls",
-                    "collection": "rcmnclsdtl"
-                },
-                "health": {
-                    "endpoint": "/rndopen/openApi/rcmncls", 
-                    "collection": "rcmnhtclsdtl"
-                },
-                "industry": {
-                    "endpoint": "/rndopen/openApi/rcmncls",
-                    "collection": "rcmnitclsdtl"
-                }
-            }
-            
-            config = classification_configs.get(classification_type, classification_configs["standard"])
-            endpoint = config["endpoint"]
-            params = {
-                "apprvKey": api_key,
-                "collection": config["collection"],
-                "rschGoalAbstract": research_goal,
-                "rschAbstract": research_content,
-                "expEfctAbstract": expected_effect,
-                "korKywd": korean_keywords,
-                "engKywd": english_keywords
-            }
-        elif target == "RECOMMENDATION":
-            endpoint = "/rndopen/openApi/public_recommend"
-            params = {
-                "apprvKey": api_key,
-                "userId": "",
-                "collection": "recommend",
-                "SRWR": query,
-                "searchFd": "",
-                "addQuery": "",
-                "searchRnkn": "",
-                "startPosition": 1,
-                "displayCnt": min(max_results, 100)
-            }
-        elif target == "RELATED_CONTENT":
-            # 연관콘텐츠 검색 (pjtId, collection 기반)
-            # query가 튜플 형태로 (pjtId, collection_type) 전달될 것으로 가정
-            if isinstance(query, tuple):
-                pjt_id, collection_type = query
-            else:
-                pjt_id, collection_type = query, "researchreport"
-                
-            endpoint = "/rndopen/openApi/ConnectionContent"
-            params = {
-                "apprvKey": api_key,
-                "pjtId": pjt_id,
-                "collection": collection_type
-            }
-        elif target == "OUTCOME":
-            # 성과검색 (논문/특허/연구시설장비/보고서) - query=(검색어, collection, level)
-            # level: "all"(전문기관용 natRnDAllSearch) / "org"(기관용 natRnDSearch) / "public"(전체용 public_result)
-            if isinstance(query, tuple) and len(query) == 3:
-                srwr, collection_type, level = query
-            elif isinstance(query, tuple):
-                srwr, collection_type = query
-                level = "public"
-            else:
-                srwr, collection_type, level = query, "rpaper", "public"
-
-            outcome_endpoints = {
-                "all": "/rndopen/openApi/natRnDAllSearch",
-                "org": "/rndopen/openApi/natRnDSearch",
-                "public": "/rndopen/openApi/public_result",
-            }
-            endpoint = outcome_endpoints.get(level, outcome_endpoints["public"])
-            # collection별 DBT값 (addQuery에 필수)
-            dbt_map = {"rpaper": "PAP", "rpatent": "PAT", "requip": "EQU",
-                       "rresearch": "TRKO"}
-            dbt = dbt_map.get(collection_type, "PAP")
-            params = {
-                "apprvKey": api_key,
-                "userId": "",
-                "collection": collection_type,
-                "SRWR": srwr,
-                "searchFd": "BI",
-                "addQuery": f"DBT={dbt}",
-                "startPosition": 1,
-                "displayCnt": min(max_results, 100),
-            }
-        elif target == "REPORT_SEARCH":
-            # 국가R&D 연구보고서 검색
-            endpoint = "/rndopen/openApi/rresearchpdf/"
-            params = {
-                "apprvKey": api_key,
-                "userId": "",
-                "collection": "researchpdf",
-                "query": query,
-                "searchField": "BI",
-                "startPosition": 1,
-                "displayCount": min(max_results, 100),
-                "returnType": "xml",
-            }
-        elif target == "TERMINOLOGY":
-            # 국가R&D 용어사전 조회
-            endpoint = "/rndopen/openApi/ntisDic"
-            params = {
-                "apprvKey": api_key,
-                "userId": "",
-                "query": query,
-                "searchField": "BI",
-                "startPosition": 1,
-                "displayCount": min(max_results, 100),
-            }
-        elif target == "ORG_STATUS":
-            # 수행기관 R&D현황조회 - query=(값, mode) mode: "bno" 또는 "nm"
-            if isinstance(query, tuple):
-                org_value, mode = query
-            else:
-                org_value, mode = query, "nm"
-            endpoint = "/rndopen/openApi/orgRndInfo"
-            params = {"apprvKey": api_key}
-            if mode == "bno":
-                params["reqOrgBno"] = org_value
-            else:
-                params["reqOrgNm"] = org_value
-        elif target == "ISSUE":
-            # 이슈로보는R&D (SRWR 선택, 미입력시 최신 5개)
-            endpoint = "/rndopen/openApi/issue"
-            params = {"apprvKey": api_key}
-            if query:
-                params["SRWR"] = query
-        elif target == "CLASS_CODE":
-            # 표준분류/중점기술 코드검색 (POST) - query=(rqstSlctCd, rqstSearchCd)
-            if isinstance(query, tuple):
-                slct_cd, search_cd = query
-            else:
-                slct_cd, search_cd = query, ""
-            endpoint = "/rndopen/openApi/targetSearch"
-            params = {"apprvKey": api_key, "rqstSlctCd": slct_cd}
-            if search_cd:
-                params["rqstSearchCd"] = search_cd
-        elif target == "COMMISSION":
-            # 위탁/공동연구 과제 정보 (기관용) - query=pjtId
-            endpoint = "/rndopen/openApi/projectuOrg"
-            params = {"apprvKey": api_key, "pjtId": query}
-        elif target == "PARTICIPATION":
-            # 과제참여정보 (전문기관용) - query=(psnNm, rrNo)
-            if isinstance(query, tuple):
-                psn_nm, rr_no = query
-            else:
-                psn_nm, rr_no = query, ""
-            endpoint = "/rndopen/openApi/prtcpProdRt"
-            params = {"apprvKey": api_key, "psnNm": psn_nm, "rrNo": rr_no}
-        elif target == "TOTAL_SEARCH":
-            # 국가R&D 통합검색 (기관용) - query=(검색어, collection)
-            if isinstance(query, tuple):
-                srwr, collection_type = query
-            else:
-                srwr, collection_type = query, "project"
-            endpoint = "/rndopen/openApi/totalRstSearch"
-            params = {
-                "apprvKey": api_key,
-                "userId": "",
-                "collection": collection_type,
-                "SRWR": srwr,
-                "searchFd": "BI",
-                "startPosition": 1,
-                "displayCnt": min(max_results, 100),
-            }
-            if collection_type in ("rpaper", "rpatent", "rresearch", "requip"):
-                dbt_map = {"rpaper": "PAP", "rpatent": "PAT",
-                           "rresearch": "TRKO", "requip": "EQU"}
-                params["addQuery"] = f"DBT={dbt_map[collection_type]}"
-        elif target == "RESEARCHER_INFO":
-            # 출연(연) 연구자정보검색 (기관용) - query=(nm, rrno, brthdt)
-            if isinstance(query, tuple) and len(query) == 3:
-                nm, rrno, brthdt = query
-            elif isinstance(query, tuple):
-                nm, rrno = query
-                brthdt = ""
-            else:
-                nm, rrno, brthdt = query, "", ""
-            endpoint = "/rndopen/openApi/rsrcInfo"
-            params = {"apprvKey": api_key, "nm": nm}
-            if rrno:
-                params["rrno"] = rrno
-            if brthdt:
-                params["brthdt"] = brthdt
-        else:
+        spec = NTIS_TARGETS.get(target)
+        if spec is None:
             return {"error": True, "message": f"지원되지 않는 검색 타입: {target}"}
+        try:
+            params = spec.build_params(query, max_results, api_key)
+        except ValueError as e:
+            return {"error": True, "message": str(e)}
+        endpoint = spec.endpoint_for(query)
 
         url = f"{self.base_url}{endpoint}"
 
         logger.info(f"NTIS 요청 URL: {url}")
         logger.info(f"파라미터: {params}")
 
-        async with httpx.AsyncClient(timeout=30.0, headers={"User-Agent": USER_AGENT}) as client:
-            # 분류/중점기술 코드검색은 POST 방식
-            if target == "CLASS_CODE":
-                response = await client.post(url, data=params)
-            else:
-                response = await client.get(url, params=params)
-
-            logger.info(f"NTIS 응답 상태코드: {response.status_code}")
-            logger.info(f"NTIS 응답 내용: {response.text[:500]}...")
-
-            if response.status_code == 200:
-                # 연관콘텐츠 검색은 JSON 형태로 응답
-                if target == "RELATED_CONTENT":
-                    return self._parse_json_response(response.text, target)
-                else:
-                    return self._parse_xml_response(response.text, target)
+        if spec.method == "POST":
+            response = await self._request("POST", url, data=params, retry=self._retry_for(target),
+                                           profile=target)
+        else:
+            response = await self._request("GET", url, params=params, retry=self._retry_for(target),
+                                           profile=target)
+
+        logger.info(f"NTIS 응답 상태코드: {response.status_code}")
+        log_body("NTIS 응답 내용", response.content)
+
+        # 키 권한 밖의 엔드포인트(401/403, 인증키/IP 오류)는 일시 오류와 구분 (권한 단계 학습용)
+        denied = self._auth_failure_reason(response)
+        if response.status_code == 200 and denied:
+            # 인증키/IP 오류는 200 본문으로 옴 → 파서가 0건 성공으로 읽어 캐시하지 않도록 먼저 거름
+            result = {"error": True, "message": f"NTIS API 인증 오류: {denied}"}
+        elif response.status_code == 200:
+            # 연관콘텐츠 검색은 JSON 형태로 응답
+            if spec.response_format == "json":
+                result = self._parse_json_response(response.content, target)
             else:
-                return {"error": True, "message": f"NTIS API 요청 실패: {response.status_code}, 응답: {response.text[:200]}"}
+                result = self._parse_xml_response(response.content, target)
+        else:
+            result = {"error": True, "message": f"NTIS API 요청 실패: {response.status_code}, 응답: {body_preview(response.content, 200)}"}
+        if denied:
+            result["permission_denied"] = denied
+        return result
     
-    def _parse_json_response(self, json_result: str, target: str) -> Dict[str, Any]:
-        """NTIS JSON 응답 파싱 (연관콘텐츠 전용)"""
+    def _parse_json_response(self, json_result: Union[bytes, str], target: str) -> Dict[str, Any]:
+        """NTIS JSON 응답 파싱 (연관콘텐츠 전용, 바이트/문자열 모두 가능)"""
         try:
             import json
             data = json.loads(json_result)
@@ -524,271 +2333,260 @@ class NTISClient(BaseAPIClient):
                 "success": True,
                 "total_count": len(results),
                 "results": results,
-                "project_info": {
-                    "pjt_id": data.get("PJT_ID", ""),
-                    "title": data.get("KOR_PJT_NM", "")
-                }
-            }
-            
-        except json.JSONDecodeError as e:
-            logger.error(f"NTIS JSON 파싱 오류: {str(e)}")
-            logger.error(f"원본 JSON: {json_result[:500]}...")
-            return {
-                "error": True,
-                "message": f"JSON 파싱 오류: {str(e)}",
-                "raw_result": json_result[:200]
-            }
-        except Exception as e:
-            logger.error(f"NTIS JSON 처리 오류: {str(e)}")
-            return {
-                "error": True,
-                "message": f"JSON 처리 오류: {str(e)}",
-                "raw_result": json_result[:200]
-            }
-    
-    def _parse_xml_response(self, xml_result: str, target: str) -> Dict[str, Any]:
-        """NTIS XML 응답 파싱"""
-        try:
-            root = ET.fromstring(xml_result)
-            
-            # 분류 추천 서비스는 다른 XML 구조를 사용
-            if target == "CLASSIFICATION":
-                return self._parse_classification_response(root)
-
-            # 신규 전체용 서비스는 응답 래퍼가 제각각이라 전용 파서 사용
-            if target in ("OUTCOME", "REPORT_SEARCH", "TERMINOLOGY",
-                          "COMMISSION", "TOTAL_SEARCH"):
-                return self._parse_resultset_response(root)
-            if target == "ORG_STATUS":
-                return self._parse_org_status_response(root)
-            if target == "ISSUE":
-                return self._parse_issue_response(root)
-            if target == "CLASS_CODE":
-                return self._parse_class_code_response(root)
-            if target == "PARTICIPATION":
-                return self._parse_participation_response(root)
-            if target == "RESEARCHER_INFO":
-                return self._parse_researcher_info_response(root)
-
-            # 기존 PROJECT, RECOMMENDATION 서비스용 파싱
-            # NTIS 응답 구조: RESULT 루트 엘리먼트
-            total_hits = root.find('TOTALHITS')
-            if total_hits is None:
-                return {"error": True, "message": "TOTALHITS를 찾을 수 없습니다"}
-            
-            total_count = int(total_hits.text) if total_hits.text else 0
-            
-            # RESULTSET에서 HIT 요소들 파싱
-            resultset = root.find('RESULTSET')
-            if resultset is None:
-                return {"error": True, "message": "RESULTSET을 찾을 수 없습니다"}
-            
-            hits = resultset.findall('HIT')
-            results = []
-            
-            for hit in hits:
-                # PDF 매뉴얼 page 8-9 구조에 맞게 전체 XML 구조를 그대로 파싱
-                result = {}
-                
-                # 기본 정보
-                project_number = hit.find('ProjectNumber')
-                if project_number is not None:
-                    result['ProjectNumber'] = project_number.text
-                
-                # 과제명 (한국어/영어)
-                project_title_korean = hit.find('.//ProjectTitle/Korean')
-                project_title_english = hit.find('.//ProjectTitle/English')
-                project_title = {}
-                if project_title_korean is not None:
-                    project_title['Korean'] = project_title_korean.text or ""
-                if project_title_english is not None:
-                    project_title['English'] = project_title_english.text or ""
-                if project_title:
-                    result['ProjectTitle'] = project_title
-                
-                # 연구책임자
-                manager_name = hit.find('.//Manager/Name')
-                if manager_name is not None:
-                    result['Manager'] = {'Name': manager_name.text or ""}
-                
-                # 참여연구원
-                researchers_name = hit.find('.//Researchers/Name')
-                man_count = hit.find('.//Researchers/ManCount')
-                woman_count = hit.find('.//Researchers/WomanCount')
-                researchers = {}
-                if researchers_name is not None:
-                    researchers['Name'] = researchers_name.text or ""
-                if man_count is not None:
-                    researchers['ManCount'] = man_count.text or ""
-                if woman_count is not None:
-                    researchers['WomanCount'] = woman_count.text or ""
-                if researchers:
-                    result['Researchers'] = researchers
-                
-                # 연구기관
-                research_agency_name = hit.find('.//ResearchAgency/Name')
-                if research_agency_name is not None:
-                    result['ResearchAgency'] = {'Name': research_agency_name.text or ""}
-                
-                order_agency_name = hit.find('.//OrderAgency/Name')
-                if order_agency_name is not None:
-                    result['OrderAgency'] = {'Name': order_agency_name.text or ""}
-                
-                # 예산 사업
-                budget_project_name = hit.find('.//BudgetProject/Name')
-                if budget_project_name is not None:
-                    result['BudgetProject'] = {'Name': budget_project_name.text or ""}
-                
-                # 부처
-                ministry_name = hit.find('.//Ministry/Name')
-                if ministry_name is not None:
-                    result['Ministry'] = {'Name': ministry_name.text or ""}
-                
-                # 과제 연도
-                project_year = hit.find('ProjectYear')
-                if project_year is not None:
-                    result['ProjectYear'] = project_year.text or ""
-                
-                # 과제 기간
-                period_start = hit.find('.//ProjectPeriod/Start')
-                period_end = hit.find('.//ProjectPeriod/End')
-                total_start = hit.find('.//ProjectPeriod/TotalStart')
-                total_end = hit.find('.//ProjectPeriod/TotalEnd')
-                period = {}
-                if period_start is not None:
-                    period['Start'] = period_start.text or ""
-                if period_end is not None:
-                    period['End'] = period_end.text or ""
-                if total_start is not None:
-                    period['TotalStart'] = total_start.text or ""
-                if total_end is not None:
-                    period['TotalEnd'] = total_end.text or ""
-                if period:
-                    result['ProjectPeriod'] = period
-                
-                # 예산 정보
-                gov_funds = hit.find('GovernmentFunds')
-                if gov_funds is not None:
-                    result['GovernmentFunds'] = gov_funds.text or ""
-                
-                total_funds = hit.find('TotalFunds')
-                if total_funds is not None:
-                    result['TotalFunds'] = total_funds.text or ""
-                
-                # 연구 목표/내용/효과 (핵심!)
-                goal_full = hit.find('.//Goal/Full')
-                goal_teaser = hit.find('.//Goal/Teaser')
-                goal = {}
-                if goal_full is not None:
-                    goal['Full'] = goal_full.text or ""
-                if goal_teaser is not None:
-                    goal['Teaser'] = goal_teaser.text or ""
-                if goal:
-                    result['Goal'] = goal
-                
-                abstract_full = hit.find('.//Abstract/Full')
-                abstract_teaser = hit.find('.//Abstract/Teaser')
-                abstract = {}
-                if abstract_full is not None:
-                    abstract['Full'] = abstract_full.text or ""
-                if abstract_teaser is not None:
-                    abstract['Teaser'] = abstract_teaser.text or ""
-                if abstract:
-                    result['Abstract'] = abstract
-                
-                effect_full = hit.find('.//Effect/Full')
-                effect_teaser = hit.find('.//Effect/Teaser')
-                effect = {}
-                if effect_full is not None:
-                    effect['Full'] = effect_full.text or ""
-                if effect_teaser is not None:
-                    effect['Teaser'] = effect_teaser.text or ""
-                if effect:
-                    result['Effect'] = effect
-                
-                # 키워드
-                keyword_korean = hit.find('.//Keyword/Korean')
-                keyword_english = hit.find('.//Keyword/English')
-                keyword = {}
-                if keyword_korean is not None:
-                    keyword['Korean'] = keyword_korean.text or ""
-                if keyword_english is not None:
-                    keyword['English'] = keyword_english.text or ""
-                if keyword:
-                    result['Keyword'] = keyword
-                
-                # 하위 호환성을 위한 기존 필드명들
-                if 'ProjectNumber' in result:
-                    result['pjtNo'] = result['ProjectNumber']
-                    result['pjtId'] = result['ProjectNumber']  # 연관콘텐츠 검색용 pjtId 추가
-                if 'ProjectTitle' in result and 'Korean' in result['ProjectTitle']:
-                    result['pjtName'] = result['ProjectTitle']['Korean']
-                    result['title'] = result['ProjectTitle']['Korean']  # 연관콘텐츠 검색용 title 추가
-                if 'Manager' in result and 'Name' in result['Manager']:
-                    result['researchManager'] = result['Manager']['Name']
-                if 'ResearchAgency' in result and 'Name' in result['ResearchAgency']:
-                    result['instName'] = result['ResearchAgency']['Name']
-                if 'ProjectPeriod' in result:
-                    if 'Start' in result['ProjectPeriod'] and 'End' in result['ProjectPeriod']:
-                        start_date = result['ProjectPeriod']['Start']
-                        end_date = result['ProjectPeriod']['End']
-                        start_year = start_date[:4] if start_date and len(start_date) >= 4 else ""
-                        end_year = end_date[:4] if end_date and len(end_date) >= 4 else ""
-                        if start_year and end_year:
-                            result['pjtPeriod'] = f"{start_year}~{end_year}"
-                
-                # 연구분야
-                science_class = hit.find('.//ScienceClass[@type="new"][@sequence="1"]/Large')
-                if science_class is not None:
-                    result['researchArea'] = science_class.text
-                
-                # 총 연구비
-                total_funds = hit.find('TotalFunds')
-                if total_funds is not None and total_funds.text:
-                    try:
-                        funds_amount = int(total_funds.text)
-                        result['totalExpense'] = f"{funds_amount:,}원"
-                    except:
-                        result['totalExpense'] = total_funds.text
-                
-                # 정부지원금
-                govt_funds = hit.find('GovernmentFunds')
-                if govt_funds is not None and govt_funds.text:
-                    try:
-                        govt_amount = int(govt_funds.text)
-                        result['govtExpense'] = f"{govt_amount:,}원"
-                    except:
-                        result['govtExpense'] = govt_funds.text
-                
-                # 과제요약 (목표)
-                goal = hit.find('.//Goal/Full')
-                if goal is not None:
-                    clean_goal = re.sub(r'<[^>]+>', '', goal.text) if goal.text else ""
-                    result['abstract'] = clean_goal[:500] + "..." if len(clean_goal) > 500 else clean_goal
-                
-                # 키워드
-                keyword = hit.find('.//Keyword/Korean')
-                if keyword is not None:
-                    clean_keyword = re.sub(r'<[^>]+>', '', keyword.text) if keyword.text else ""
-                    result['keyword'] = clean_keyword
-                
-                results.append(result)
+                "project_info": {
+                    "pjt_id": data.get("PJT_ID", ""),
+                    "title": data.get("KOR_PJT_NM", "")
+                }
+            }
             
+        except json.JSONDecodeError as e:
+            logger.error(f"NTIS JSON 파싱 오류: {str(e)}")
+            logger.error(f"원본 JSON: {body_preview(json_result, 500)}...")
             return {
-                "success": True,
-                "total_count": total_count,
-                "results": results
+                "error": True,
+                "message": f"JSON 파싱 오류: {str(e)}",
+                "raw_result": body_preview(json_result, 200)
+            }
+        except Exception as e:
+            logger.error(f"NTIS JSON 처리 오류: {str(e)}")
+            return {
+                "error": True,
+                "message": f"JSON 처리 오류: {str(e)}",
+                "raw_result": body_preview(json_result, 200)
             }
+    
+    def _parse_xml_response(self, xml_result: Union[bytes, str], target: str) -> Dict[str, Any]:
+        """NTIS XML 응답 파싱 (HIT 단위 스트리밍, 바이트/문자열 모두 가능)"""
+        # 명세에 없는 target은 기존처럼 과제검색 구조로 파싱
+        spec = NTIS_TARGETS.get(target, NTIS_TARGETS["PROJECT"])
+        try:
+            parser = getattr(self, spec.parser)
+            if spec.record_path is None:
+                return parser(parse_xml(xml_result))
+            convert = getattr(self, spec.record_parser)
+            if spec.record_type is not None:
+                record_type, parse_record = spec.record_type, convert
+
+                def convert(elem):
+                    return record_type(parse_record(elem))
+            root, results = stream_xml_records(xml_result, spec.record_path, convert)
+            return parser(root, results)
             
         except ET.ParseError as e:
             logger.error(f"NTIS XML 파싱 오류: {str(e)}")
-            logger.error(f"원본 XML: {xml_result[:500]}...")
+            logger.error(f"원본 XML: {body_preview(xml_result, 500)}...")
             return {
                 "error": True,
                 "message": f"XML 파싱 오류: {str(e)}",
-                "raw_result": xml_result[:200]
+                "raw_result": body_preview(xml_result, 200)
             }
     
+    def _parse_project_response(self, root, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """RESULT>TOTALHITS+RESULTSET>HIT 구조 파싱 (과제검색/추천, HIT는 스트리밍 중 변환됨)"""
+        total_hits = root.find('TOTALHITS')
+        if total_hits is None:
+            return {"error": True, "message": "TOTALHITS를 찾을 수 없습니다"}
+        
+        total_count = int(total_hits.text) if total_hits.text else 0
+        
+        if root.find('RESULTSET') is None:
+            return {"error": True, "message": "RESULTSET을 찾을 수 없습니다"}
+        
+        return {
+            "success": True,
+            "total_count": total_count,
+            "results": results
+        }
+
+    def _parse_project_hit(self, hit) -> Dict[str, Any]:
+        """과제 검색/추천 HIT 하나를 dict로 변환 (HIT를 한 번만 순회, _PROJECT_HIT_PATHS 참고)"""
+        found = self._PROJECT_HIT_PATHS.find_all(hit)
+        # PDF 매뉴얼 page 8-9 구조에 맞게 전체 XML 구조를 그대로 파싱
+        result = {}
+
+        # 기본 정보
+        project_number = found.get('ProjectNumber')
+        if project_number is not None:
+            result['ProjectNumber'] = project_number.text
+
+        # 과제명 (한국어/영어)
+        project_title_korean = found.get('.//ProjectTitle/Korean')
+        project_title_english = found.get('.//ProjectTitle/English')
+        project_title = {}
+        if project_title_korean is not None:
+            project_title['Korean'] = project_title_korean.text or ""
+        if project_title_english is not None:
+            project_title['English'] = project_title_english.text or ""
+        if project_title:
+            result['ProjectTitle'] = project_title
+
+        # 연구책임자
+        manager_name = found.get('.//Manager/Name')
+        if manager_name is not None:
+            result['Manager'] = {'Name': manager_name.text or ""}
+
+        # 참여연구원
+        researchers_name = found.get('.//Researchers/Name')
+        man_count = found.get('.//Researchers/ManCount')
+        woman_count = found.get('.//Researchers/WomanCount')
+        researchers = {}
+        if researchers_name is not None:
+            researchers['Name'] = researchers_name.text or ""
+        if man_count is not None:
+            researchers['ManCount'] = man_count.text or ""
+        if woman_count is not None:
+            researchers['WomanCount'] = woman_count.text or ""
+        if researchers:
+            result['Researchers'] = researchers
+
+        # 연구기관
+        research_agency_name = found.get('.//ResearchAgency/Name')
+        if research_agency_name is not None:
+            result['ResearchAgency'] = {'Name': research_agency_name.text or ""}
+
+        order_agency_name = found.get('.//OrderAgency/Name')
+        if order_agency_name is not None:
+            result['OrderAgency'] = {'Name': order_agency_name.text or ""}
+
+        # 예산 사업
+        budget_project_name = found.get('.//BudgetProject/Name')
+        if budget_project_name is not None:
+            result['BudgetProject'] = {'Name': budget_project_name.text or ""}
+
+        # 부처
+        ministry_name = found.get('.//Ministry/Name')
+        if ministry_name is not None:
+            result['Ministry'] = {'Name': ministry_name.text or ""}
+
+        # 과제 연도
+        project_year = found.get('ProjectYear')
+        if project_year is not None:
+            result['ProjectYear'] = project_year.text or ""
+
+        # 과제 기간
+        period_start = found.get('.//ProjectPeriod/Start')
+        period_end = found.get('.//ProjectPeriod/End')
+        total_start = found.get('.//ProjectPeriod/TotalStart')
+        total_end = found.get('.//ProjectPeriod/TotalEnd')
+        period = {}
+        if period_start is not None:
+            period['Start'] = period_start.text or ""
+        if period_end is not None:
+            period['End'] = period_end.text or ""
+        if total_start is not None:
+            period['TotalStart'] = total_start.text or ""
+        if total_end is not None:
+            period['TotalEnd'] = total_end.text or ""
+        if period:
+            result['ProjectPeriod'] = period
+
+        # 예산 정보
+        gov_funds = found.get('GovernmentFunds')
+        if gov_funds is not None:
+            result['GovernmentFunds'] = gov_funds.text or ""
+
+        total_funds = found.get('TotalFunds')
+        if total_funds is not None:
+            result['TotalFunds'] = total_funds.text or ""
+
+        # 연구 목표/내용/효과 (핵심!)
+        goal_full = found.get('.//Goal/Full')
+        goal_teaser = found.get('.//Goal/Teaser')
+        goal = {}
+        if goal_full is not None:
+            goal['Full'] = goal_full.text or ""
+        if goal_teaser is not None:
+            goal['Teaser'] = goal_teaser.text or ""
+        if goal:
+            result['Goal'] = goal
+
+        abstract_full = found.get('.//Abstract/Full')
+        abstract_teaser = found.get('.//Abstract/Teaser')
+        abstract = {}
+        if abstract_full is not None:
+            abstract['Full'] = abstract_full.text or ""
+        if abstract_teaser is not None:
+            abstract['Teaser'] = abstract_teaser.text or ""
+        if abstract:
+            result['Abstract'] = abstract
+
+        effect_full = found.get('.//Effect/Full')
+        effect_teaser = found.get('.//Effect/Teaser')
+        effect = {}
+        if effect_full is not None:
+            effect['Full'] = effect_full.text or ""
+        if effect_teaser is not None:
+            effect['Teaser'] = effect_teaser.text or ""
+        if effect:
+            result['Effect'] = effect
+
+        # 키워드
+        keyword_korean = found.get('.//Keyword/Korean')
+        keyword_english = found.get('.//Keyword/English')
+        keyword = {}
+        if keyword_korean is not None:
+            keyword['Korean'] = keyword_korean.text or ""
+        if keyword_english is not None:
+            keyword['English'] = keyword_english.text or ""
+        if keyword:
+            result['Keyword'] = keyword
+
+        # 하위 호환성을 위한 기존 필드명들
+        if 'ProjectNumber' in result:
+            result['pjtNo'] = result['ProjectNumber']
+            result['pjtId'] = result['ProjectNumber']  # 연관콘텐츠 검색용 pjtId 추가
+        if 'ProjectTitle' in result and 'Korean' in result['ProjectTitle']:
+            result['pjtName'] = result['ProjectTitle']['Korean']
+            result['title'] = result['ProjectTitle']['Korean']  # 연관콘텐츠 검색용 title 추가
+        if 'Manager' in result and 'Name' in result['Manager']:
+            result['researchManager'] = result['Manager']['Name']
+        if 'ResearchAgency' in result and 'Name' in result['ResearchAgency']:
+            result['instName'] = result['ResearchAgency']['Name']
+        if 'ProjectPeriod' in result:
+            if 'Start' in result['ProjectPeriod'] and 'End' in result['ProjectPeriod']:
+                start_date = result['ProjectPeriod']['Start']
+                end_date = result['ProjectPeriod']['End']
+                start_year = start_date[:4] if start_date and len(start_date) >= 4 else ""
+                end_year = end_date[:4] if end_date and len(end_date) >= 4 else ""
+                if start_year and end_year:
+                    result['pjtPeriod'] = f"{start_year}~{end_year}"
+
+        # 연구분야
+        science_class = found.get('.//ScienceClass[@type="new"][@sequence="1"]/Large')
+        if science_class is not None:
+            result['researchArea'] = science_class.text
+
+        # 총 연구비
+        total_funds = found.get('TotalFunds')
+        if total_funds is not None and total_funds.text:
+            try:
+                funds_amount = int(total_funds.text)
+                result['totalExpense'] = f"{funds_amount:,}원"
+            except:
+                result['totalExpense'] = total_funds.text
+
+        # 정부지원금
+        govt_funds = found.get('GovernmentFunds')
+        if govt_funds is not None and govt_funds.text:
+            try:
+                govt_amount = int(govt_funds.text)
+                result['govtExpense'] = f"{govt_amount:,}원"
+            except:
+                result['govtExpense'] = govt_funds.text
+
+        # 과제요약 (목표)
+        goal = found.get('.//Goal/Full')
+        if goal is not None:
+            clean_goal = re.sub(r'<[^>]+>', '', goal.text) if goal.text else ""
+            result['abstract'] = clean_goal[:500] + "..." if len(clean_goal) > 500 else clean_goal
+
+        # 키워드
+        keyword = found.get('.//Keyword/Korean')
+        if keyword is not None:
+            clean_keyword = re.sub(r'<[^>]+>', '', keyword.text) if keyword.text else ""
+            result['keyword'] = clean_keyword
+        return result
+
     def _flatten_element(self, elem) -> Dict[str, Any]:
         """XML 엘리먼트를 평면 dict로 변환.
         - 자식 텍스트는 태그명을 키로
@@ -835,15 +2633,15 @@ class NTISClient(BaseAPIClient):
                 put(tag, child.text)
         return result
 
-    def _parse_resultset_response(self, root) -> Dict[str, Any]:
-        """RESULT>RESULTSET>HIT 구조 파싱 (성과검색/연구보고서/용어사전)"""
+    def _parse_resultset_response(self, root, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """RESULT>RESULTSET>HIT 구조 파싱 (성과검색/연구보고서/용어사전, HIT는 스트리밍 중 변환됨)
+
+        RESULTSET과 TOTALHITS가 모두 없으면 오류 응답(resMsg)이므로 0건 성공으로 보지 않는다.
+        """
         total_hits = root.find('TOTALHITS')
+        if total_hits is None and root.find('RESULTSET') is None:
+            return {"error": True, "message": root.findtext('resMsg') or "RESULTSET을 찾을 수 없습니다"}
         total_count = int(total_hits.text) if total_hits is not None and total_hits.text else 0
-        resultset = root.find('RESULTSET')
-        results = []
-        if resultset is not None:
-            for hit in resultset.findall('HIT'):
-                results.append(self._flatten_element(hit))
         if total_count == 0:
             total_count = len(results)
         return {"success": True, "total_count": total_count, "results": results}
@@ -1061,8 +2859,189 @@ class NTISClient(BaseAPIClient):
         classification['section'] = section_name
         return classification
 # ScienceON 전용 구현
+class TokenManager:
+    """액세스 토큰 수명주기 관리
+
+    - 발급은 asyncio.Lock으로 한 번만 수행 (만료 직후 동시 요청이 몰려도 재발급 1회)
+    - 만료 refresh_margin초 전부터는 기존 토큰을 그대로 쓰고 백그라운드에서 갱신
+    - 갱신 시 refresh_token을 우선 사용하고, 실패하면 새로 발급
+
+    - 발급이 실패하면 지수 백오프 동안 발급을 시도하지 않고 마지막 실패 사유(last_error)로 즉시 실패
+
+    issue(refresh_token)은 {"access_token", "refresh_token"} dict 또는 실패 시
+    {"error": True, "message": 사유}를 반환하는 코루틴 함수다 (refresh_token이 None이면 신규 발급).
+    on_update(manager)는 발급 직후 호출된다.
+    """
+
+    def __init__(self, issue, ttl: float = 3600, refresh_margin: float = 300, on_update=None):
+        self._issue = issue
+        self._on_update = on_update
+        self.ttl = ttl
+        self.refresh_margin = min(refresh_margin, ttl / 2)
+        self.access_token: Optional[str] = None
+        self.refresh_token: Optional[str] = None
+        self.issued_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._backoff = FailureBackoff.from_env()
+        self.last_error: Optional[str] = None
+        self.issued = 0
+        self.refreshed = 0
+        self.failures = 0
+
+    def _age(self) -> float:
+        return time.time() - self.issued_at if self.issued_at is not None else float("inf")
+
+    def is_valid(self) -> bool:
+        return bool(self.access_token) and self._age() < self.ttl
+
+    def needs_refresh(self) -> bool:
+        return self._age() >= self.ttl - self.refresh_margin
+
+    def set(self, access_token: str, refresh_token: Optional[str], issued_at: float):
+        self.access_token = access_token
+        self.refresh_token = refresh_token
+        self.issued_at = issued_at
+
+    async def get(self) -> Optional[str]:
+        """유효한 액세스 토큰 반환 (없거나 만료됐으면 발급, 실패 시 None)"""
+        if self.is_valid():
+            if self.needs_refresh():
+                self._schedule_refresh()
+            return self.access_token
+        async with self._lock:
+            # 대기하는 동안 다른 호출이 발급했으면 그대로 사용
+            if not self.is_valid():
+                reason = self._backoff.check("token")
+                if reason:
+                    self.last_error = reason
+                    return None
+                await self._renew()
+            return self.access_token if self.is_valid() else None
+
+    async def _renew(self):
+        data = None
+        if self.refresh_token:
+            data = await self._issue(self.refresh_token)
+            if data.get("access_token"):
+                self.refreshed += 1
+            else:
+                logger.info("refresh_token 재발급 실패, 토큰을 새로 발급합니다.")
+        if not data or not data.get("access_token"):
+            data = await self._issue(None)
+            if data.get("access_token"):
+                self.issued += 1
+        if not data.get("access_token"):
+            self.failures += 1
+            self.last_error = data.get("message", "토큰 발급 실패")
+            self._backoff.failure("token", self.last_error)
+            return
+        self._backoff.success("token")
+        self.last_error = None
+        self.set(data["access_token"], data.get("refresh_token") or self.refresh_token, time.time())
+        if self._on_update:
+            self._on_update(self)
+
+    def _schedule_refresh(self):
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.ensure_future(self._background_refresh())
+
+    async def _background_refresh(self):
+        try:
+            async with self._lock:
+                if self.needs_refresh():
+                    logger.info("토큰 만료 임박, 백그라운드 갱신")
+                    await self._renew()
+        except Exception as e:
+            logger.warning(f"토큰 백그라운드 갱신 중 오류: {str(e)}")
+
+    def stats(self) -> Dict[str, Any]:
+        age = self._age()
+        return {
+            "valid": self.is_valid(),
+            "age_seconds": round(age) if age != float("inf") else None,
+            "issued": self.issued,
+            "refreshed": self.refreshed,
+            "failures": self.failures,
+            "last_error": self.last_error or "-",
+        }
+
+
+class TokenStore:
+    """발급 토큰 디스크 보관 (tokens.json, client_id별 AES-GCM 암호화)
+
+    암호화 키는 API 키에서 유도하므로 API 키 없이는 파일만으로 토큰을 복원할 수 없다.
+    프로세스 재시작 시 아직 유효한 토큰을 재사용해 첫 호출의 발급 왕복을 없앤다.
+    """
+
+    def __init__(self, path: Optional[Path], secret: str):
+        self.path = path
+        self._key = hashlib.sha256(f"kisti-mcp-token:{secret}".encode('utf-8')).digest()
+
+    @classmethod
+    def from_env(cls, secret: str) -> "TokenStore":
+        """SCIENCEON_TOKEN_CACHE=off 이면 저장하지 않음"""
+        if get_env("SCIENCEON_TOKEN_CACHE").lower() in ("0", "off", "false", "no"):
+            return cls(None, secret)
+        try:
+            return cls(get_cache_dir() / "tokens.json", secret)
+        except OSError as e:
+            logger.warning(f"토큰 저장 경로를 만들 수 없어 디스크 보관을 끕니다: {str(e)}")
+            return cls(None, secret)
+
+    @staticmethod
+    def _slot(client_id: str) -> str:
+        return hashlib.sha256(client_id.encode('utf-8')).hexdigest()[:16]
+
+    def _read_all(self) -> Dict[str, Any]:
+        if self.path is None or not self.path.exists():
+            return {}
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+            return data if isinstance(data, dict) else {}
+        except Exception as e:
+            logger.warning(f"토큰 파일을 읽을 수 없습니다: {str(e)}")
+            return {}
+
+    def load(self, client_id: str) -> Optional[Dict[str, Any]]:
+        """저장된 토큰 복호화 (없거나 키가 맞지 않으면 None)"""
+        entry = self._read_all().get(self._slot(client_id))
+        if not entry:
+            return None
+        try:
+            cipher = AES.new(self._key, AES.MODE_GCM, nonce=base64.b64decode(entry["nonce"]))
+            plain = cipher.decrypt_and_verify(base64.b64decode(entry["ct"]),
+                                              base64.b64decode(entry["tag"]))
+            return json.loads(plain)
+        except Exception:
+            logger.info("저장된 토큰을 복호화할 수 없어 무시합니다 (API 키 변경 등)")
+            return None
+
+    def save(self, client_id: str, token: Dict[str, Any]):
+        if self.path is None:
+            return
+        cipher = AES.new(self._key, AES.MODE_GCM)
+        ct, tag = cipher.encrypt_and_digest(json.dumps(token).encode('utf-8'))
+        data = self._read_all()
+        data[self._slot(client_id)] = {
+            "nonce": base64.b64encode(cipher.nonce).decode('ascii'),
+            "ct": base64.b64encode(ct).decode('ascii'),
+            "tag": base64.b64encode(tag).decode('ascii'),
+        }
+        try:
+            write_file_atomic(self.path, json.dumps(data))
+        except Exception as e:
+            logger.warning(f"토큰 파일 저장 오류: {str(e)}")
+
+
 class ScienceONClient(BaseAPIClient):
     """KISTI ScienceON API 클라이언트"""
+
+    PLATFORM = "SCIENCEON"
+    # 타임아웃 프로필 = action (SEARCH/BROWSE/CITATION/TOKEN)
+    READ_TIMEOUTS = {"TOKEN": 10.0, "BROWSE": 15.0, "CITATION": 20.0}
+    # target별 레코드 계열 (그 외 target은 CompactRecord)
+    RECORD_TYPES = {"ARTI": PaperRecord, "PATENT": PatentRecord, "REPORT": ReportRecord}
     
     def __init__(self):
         super().__init__("https://apigateway.kisti.re.kr")
@@ -1075,10 +3054,19 @@ class ScienceONClient(BaseAPIClient):
         # 필수 정보 검증
         self._validate_credentials()
 
-        self.refresh_token = None
-        # 토큰 캐싱 (TTL 1시간)
-        self._token_issued_at = None
-        self._TOKEN_TTL_SECONDS = 3600
+        # 토큰 관리 (TTL 1시간, 만료 SCIENCEON_TOKEN_REFRESH_MARGIN초 전부터 백그라운드 갱신)
+        self._tokens = TokenManager(
+            self._issue_token, ttl=3600,
+            refresh_margin=get_env_float("SCIENCEON_TOKEN_REFRESH_MARGIN", 300),
+            on_update=self._save_token)
+        # 이전 프로세스가 발급한 토큰이 아직 유효하면 재사용
+        self._token_store = TokenStore.from_env(self.api_key)
+        saved = self._token_store.load(self.client_id)
+        if saved and saved.get("access_token"):
+            self._tokens.set(saved["access_token"], saved.get("refresh_token"),
+                             float(saved.get("issued_at", 0)))
+            if self._tokens.is_valid():
+                logger.info("저장된 ScienceON 토큰을 재사용합니다.")
     
     def _validate_credentials(self):
         """인증 정보 검증"""
@@ -1125,56 +3113,70 @@ class ScienceONClient(BaseAPIClient):
             logger.error(f"토큰 URL 생성 실패: {str(e)}")
             return ""
     
-    async def get_token(self) -> bool:
-        """토큰 발급 (TTL 내에서는 캐시된 토큰 재사용)"""
-        # 유효한 토큰이 캐시돼 있으면 재발급 생략
-        if self.access_token and self._token_issued_at is not None:
-            age = (datetime.now() - self._token_issued_at).total_seconds()
-            if age < self._TOKEN_TTL_SECONDS:
-                return True
+    def _credential(self, endpoint: str) -> tuple:
+        return "SCIENCEON_CLIENT_ID", self.client_id
 
-        logger.info("토큰 발급 요청 중...")
+    def _save_token(self, tokens: TokenManager):
+        """발급된 토큰을 암호화해 디스크에 보관"""
+        self._token_store.save(self.client_id, {
+            "access_token": tokens.access_token,
+            "refresh_token": tokens.refresh_token,
+            "issued_at": tokens.issued_at,
+        })
 
-        try:
+    async def get_token(self) -> bool:
+        """유효한 토큰 확보 (TTL 내에서는 재사용, 만료 임박 시 백그라운드 갱신)"""
+        token = await self._tokens.get()
+        if token:
+            self.access_token = token
+        return token is not None
+
+    async def _issue_token(self, refresh_token: Optional[str] = None) -> Dict[str, Any]:
+        """토큰 발급 요청 (refresh_token이 있으면 재발급 요청)"""
+        if refresh_token:
+            logger.info("토큰 재발급 요청 중 (refresh_token)...")
+            url = (f"{self.base_url}/tokenrequest.do?"
+                   f"refreshToken={quote(refresh_token)}&client_id={self.client_id}")
+        else:
+            logger.info("토큰 발급 요청 중...")
             url = self._create_token_request_url()
             if not url:
-                return False
-            
+                return {"error": True, "message": "토큰 요청 URL 생성 실패 (SCIENCEON_API_KEY 확인)"}
+
+        try:
             logger.info(f"요청 URL: {url[:100]}...")
-            
-            async with httpx.AsyncClient(timeout=30.0, headers={"User-Agent": USER_AGENT}) as client:
-                response = await client.get(url)
-                
-                logger.info(f"응답 상태: {response.status_code}")
-                logger.info(f"응답 내용: {response.text}")
-                
-                if response.status_code == 200:
-                    try:
-                        data = response.json()
-                        self.access_token = data.get('access_token')
-                        self.refresh_token = data.get('refresh_token')
-                        self._token_issued_at = datetime.now()
-
-                        logger.info(f"토큰 발급 성공!")
-                        return True
-                        
-                    except json.JSONDecodeError as e:
-                        logger.error(f"JSON 파싱 실패: {str(e)}")
-                        return False
-                else:
-                    logger.error(f"토큰 발급 실패: {response.status_code}")
-                    return False
-                    
+
+            response = await self._request("GET", url, profile="TOKEN")
+
+            logger.info(f"응답 상태: {response.status_code}")
+
+            if response.status_code != 200:
+                logger.error(f"토큰 발급 실패: {response.status_code}")
+                return {"error": True, "message": f"토큰 발급 실패: HTTP {response.status_code}"}
+            try:
+                data = json.loads(response.content)
+            except json.JSONDecodeError as e:
+                logger.error(f"JSON 파싱 실패: {str(e)}")
+                return {"error": True, "message": f"토큰 응답 파싱 실패: {body_preview(response.content, 100)}"}
+            if not data.get('access_token'):
+                logger.error(f"토큰 발급 실패: {body_preview(response.content, 200)}")
+                return {"error": True, "message": f"토큰 발급 거부: {body_preview(response.content, 200)}"}
+
+            logger.info(f"토큰 발급 성공!")
+            return data
+
         except Exception as e:
             logger.error(f"토큰 발급 중 오류: {str(e)}")
-            return False
+            return {"error": True, "message": f"토큰 발급 중 오류: {str(e)}"}
     
+    @single_flight
     async def search(self, query, target: str, max_results: int = 5,
-                     query_field: str = "BI") -> Dict[str, Any]:
+                     query_field: str = "BI", skip_fields: frozenset = frozenset()) -> Dict[str, Any]:
         """검색 수행
 
         query: 검색어 문자열, 또는 이미 구성된 searchQuery dict
         query_field: 검색 필드 키 (BI=서지통합, PY=발행연도, RD=날짜 등)
+        skip_fields: 레코드에 담지 않을 metaCode (목록 보기에서 초록 등 긴 본문 생략)
         """
         # JSON 형식으로 검색 쿼리 생성
         if isinstance(query, dict):
@@ -1197,14 +3199,14 @@ class ScienceONClient(BaseAPIClient):
         
         logger.info(f"요청 URL: {url[:150]}...")
         
-        async with httpx.AsyncClient(timeout=30.0, headers={"User-Agent": USER_AGENT}) as client:
-            response = await client.get(url)
-            
-            if response.status_code == 200:
-                return self._parse_xml_response(response.text)
-            else:
-                return {"error": True, "message": f"API 요청 실패: {response.status_code}"}
+        response = await self._request("GET", url, profile="SEARCH")
+
+        if response.status_code == 200:
+            return self._parse_xml_response(response.content, target, skip_fields)
+        else:
+            return {"error": True, "message": f"API 요청 실패: {response.status_code}"}
     
+    @single_flight
     async def get_details(self, cn: str, target: str = "ARTI") -> Dict[str, Any]:
         """상세 정보 조회"""
         url = (f"{self.base_url}/openapicall.do?"
@@ -1217,13 +3219,12 @@ class ScienceONClient(BaseAPIClient):
         
         logger.info(f"상세보기 요청 URL: {url[:150]}...")
         
-        async with httpx.AsyncClient(timeout=30.0, headers={"User-Agent": USER_AGENT}) as client:
-            response = await client.get(url)
-            
-            if response.status_code == 200:
-                return self._parse_xml_response(response.text)
-            else:
-                return {"error": True, "message": f"API 요청 실패: {response.status_code}"}
+        response = await self._request("GET", url, profile="BROWSE", hedge=True)
+
+        if response.status_code == 200:
+            return self._parse_xml_response(response.content, target)
+        else:
+            return {"error": True, "message": f"API 요청 실패: {response.status_code}"}
     
     async def get_citations(self, cn: str, target: str = "PATENT") -> Dict[str, Any]:
         """인용/피인용 정보 조회"""
@@ -1237,18 +3238,24 @@ class ScienceONClient(BaseAPIClient):
         
         logger.info(f"인용정보 요청 URL: {url[:150]}...")
         
-        async with httpx.AsyncClient(timeout=30.0, headers={"User-Agent": USER_AGENT}) as client:
-            response = await client.get(url)
-            
-            if response.status_code == 200:
-                return self._parse_xml_response(response.text)
-            else:
-                return {"error": True, "message": f"API 요청 실패: {response.status_code}"}
+        response = await self._request("GET", url, profile="CITATION")
+
+        if response.status_code == 200:
+            return self._parse_xml_response(response.content, target)
+        else:
+            return {"error": True, "message": f"API 요청 실패: {response.status_code}"}
     
-    def _parse_xml_response(self, xml_result: str) -> Dict[str, Any]:
-        """XML 응답 파싱"""
+    def _parse_xml_response(self, xml_result: Union[bytes, str], target: Optional[str] = None,
+                            skip_fields: frozenset = frozenset()) -> Dict[str, Any]:
+        """XML 응답 파싱 (record 단위 스트리밍, 바이트/문자열 모두 가능)
+
+        record는 target별 CompactRecord 계열(RECORD_TYPES)로 담고, skip_fields의 metaCode는 뺀다.
+        """
+        record_type = self.RECORD_TYPES.get(target, CompactRecord)
         try:
-            root = ET.fromstring(xml_result)
+            root, papers = stream_xml_records(
+                xml_result, ".//record",
+                lambda record: record_type(self._parse_record(record, skip_fields)))
             
             # 상태 확인
             status_code = root.find('.//statusCode')
@@ -1262,18 +3269,8 @@ class ScienceONClient(BaseAPIClient):
                     "error_message": error_message.text if error_message is not None else None
                 }
             
-            # 정상 결과 파싱
+            # 정상 결과 (record는 스트리밍 중 변환됨)
             total_count = root.find('.//TotalCount')
-            records = root.findall('.//record')
-            
-            papers = []
-            for record in records:
-                paper = {}
-                for item in record.findall('item'):
-                    meta_code = item.get('metaCode')
-                    value = item.text if item.text else ""
-                    paper[meta_code] = value
-                papers.append(paper)
             
             return {
                 "success": True,
@@ -1286,13 +3283,30 @@ class ScienceONClient(BaseAPIClient):
             return {
                 "error": True,
                 "message": f"XML 파싱 오류: {str(e)}",
-                "raw_result": xml_result
+                "raw_result": body_preview(xml_result, len(xml_result))
             }
 
+    @staticmethod
+    def _parse_record(record, skip_fields: frozenset = frozenset()) -> Dict[str, Any]:
+        """record 하나의 item들을 metaCode → 값 dict로 변환 (skip_fields는 생략)"""
+        paper = {}
+        for item in record.findall('item'):
+            meta_code = item.get('metaCode')
+            if meta_code in skip_fields:
+                continue
+            value = item.text if item.text else ""
+            paper[meta_code] = value
+        return paper
+
 # DataON 전용 구현
 class DataONClient(BaseAPIClient):
     """KISTI DataON API 클라이언트"""
 
+    PLATFORM = "DATAON"
+    # 타임아웃 프로필 = 검색 target, 상세조회는 DETAIL
+    READ_TIMEOUTS = {"DETAIL": 15.0}
+    AUTH_FAIL_FAST = True
+
     def __init__(self):
         super().__init__("https://dataon.kisti.re.kr")
 
@@ -1322,6 +3336,20 @@ class DataONClient(BaseAPIClient):
         """DataON은 토큰 발급이 필요하지 않음 (API KEY 직접 사용)"""
         return True
 
+    def _credential(self, endpoint: str) -> tuple:
+        # 목록 검색(/dataset/)과 상세조회(/dataset/{svcId})는 키가 다름
+        if endpoint.rstrip("/").endswith("/dataset"):
+            return "DataON_ResearchData_API_KEY", self.research_data_api_key
+        return "DataON_ResearchDataMetadata_API_KEY", self.research_data_metadata_api_key
+
+    def _endpoint_key(self, path: str) -> str:
+        # 상세조회 경로의 svcId는 하나의 엔드포인트로 묶음
+        prefix = "/rest/api/search/dataset/"
+        if path.startswith(prefix) and path != prefix:
+            return prefix + "{svcId}"
+        return path
+
+    @single_flight
     async def search(self, query: str, target: str = "RESEARCH_DATA", max_results: int = 10,
                     from_pos: int = 0, sort_con: str = "", sort_arr: str = "desc") -> Dict[str, Any]:
         """
@@ -1363,20 +3391,22 @@ class DataONClient(BaseAPIClient):
         logger.info(f"파라미터: {params}")
 
         try:
-            async with httpx.AsyncClient(timeout=30.0, headers={"User-Agent": USER_AGENT}) as client:
-                response = await client.get(url, params=params)
+            response = await self._request("GET", url, params=params, profile=target)
 
-                logger.info(f"DataON 응답 상태코드: {response.status_code}")
-                logger.info(f"DataON 응답 내용: {response.text[:500]}...")
+            logger.info(f"DataON 응답 상태코드: {response.status_code}")
+            log_body("DataON 응답 내용", response.content)
 
-                if response.status_code == 200:
-                    return self._parse_json_response(response.text, target)
-                else:
-                    return {"error": True, "message": f"DataON API 요청 실패: {response.status_code}, 응답: {response.text[:200]}"}
+            if response.status_code == 200:
+                return self._parse_json_response(response.content, target)
+            else:
+                return {"error": True, "message": f"DataON API 요청 실패: {response.status_code}, 응답: {body_preview(response.content, 200)}"}
+        except RateLimitedError:
+            raise  # cached_fetch가 만료된 캐시로 대신 응답
         except Exception as e:
             logger.error(f"DataON API 요청 중 오류: {str(e)}")
             return {"error": True, "message": f"DataON API 요청 중 오류: {str(e)}"}
 
+    @single_flight
     async def get_details(self, svc_id: str) -> Dict[str, Any]:
         """
         DataON 연구데이터 상세 정보 조회
@@ -1400,22 +3430,23 @@ class DataONClient(BaseAPIClient):
         logger.info(f"파라미터: {params}")
 
         try:
-            async with httpx.AsyncClient(timeout=30.0, headers={"User-Agent": USER_AGENT}) as client:
-                response = await client.get(url, params=params)
+            response = await self._request("GET", url, params=params, profile="DETAIL", hedge=True)
 
-                logger.info(f"DataON 응답 상태코드: {response.status_code}")
-                logger.info(f"DataON 응답 내용: {response.text[:500]}...")
+            logger.info(f"DataON 응답 상태코드: {response.status_code}")
+            log_body("DataON 응답 내용", response.content)
 
-                if response.status_code == 200:
-                    return self._parse_json_response(response.text, "DETAIL")
-                else:
-                    return {"error": True, "message": f"DataON API 요청 실패: {response.status_code}, 응답: {response.text[:200]}"}
+            if response.status_code == 200:
+                return self._parse_json_response(response.content, "DETAIL")
+            else:
+                return {"error": True, "message": f"DataON API 요청 실패: {response.status_code}, 응답: {body_preview(response.content, 200)}"}
+        except RateLimitedError:
+            raise  # cached_detail이 만료된 캐시로 대신 응답
         except Exception as e:
             logger.error(f"DataON API 요청 중 오류: {str(e)}")
             return {"error": True, "message": f"DataON API 요청 중 오류: {str(e)}"}
 
-    def _parse_json_response(self, json_result: str, target: str) -> Dict[str, Any]:
-        """DataON JSON 응답 파싱"""
+    def _parse_json_response(self, json_result: Union[bytes, str], target: str) -> Dict[str, Any]:
+        """DataON JSON 응답 파싱 (바이트/문자열 모두 가능)"""
         try:
             data = json.loads(json_result)
 
@@ -1442,7 +3473,7 @@ class DataONClient(BaseAPIClient):
                     publishers = record.get("dataset_pblshr", [])
                     publisher_str = ", ".join(publishers) if publishers else ""
 
-                    result = {
+                    result = DatasetRecord({
                         "svcId": record.get("svc_id", ""),
                         "score": 0,  # DataON API는 score를 직접 제공하지 않음
                         "title": record.get("dataset_title_kor", ""),
@@ -1457,7 +3488,7 @@ class DataONClient(BaseAPIClient):
                         "coverage": record.get("dataset_data_loc", ""),
                         "landing_page": record.get("dataset_lndgpg", ""),
                         "doi": record.get("dataset_doi", "")
-                    }
+                    })
                     results.append(result)
 
                 return {
@@ -1492,7 +3523,7 @@ class DataONClient(BaseAPIClient):
 
                 return {
                     "success": True,
-                    "result": {
+                    "result": DatasetRecord({
                         "svcId": record.get("svc_id", ""),
                         "title": record.get("dataset_title_kor", ""),
                         "creator": creator_str,
@@ -1510,7 +3541,7 @@ class DataONClient(BaseAPIClient):
                         "contributor": contributor_str,
                         "landing_page": record.get("dataset_lndgpg", ""),
                         "platform": record.get("cltfm_kor", "")
-                    }
+                    })
                 }
             else:
                 return {"error": True, "message": f"지원되지 않는 target 타입: {target}"}
@@ -1520,7 +3551,7 @@ class DataONClient(BaseAPIClient):
             return {
                 "error": True,
                 "message": f"JSON 파싱 오류: {str(e)}",
-                "raw_result": json_result[:500]
+                "raw_result": body_preview(json_result, 500)
             }
         except Exception as e:
             logger.error(f"응답 처리 중 오류: {str(e)}")
@@ -1962,16 +3993,16 @@ class NTISFormatter(BaseResultFormatter):
             # 기본 정보 (PDF 매뉴얼 page 8-9 기준)
             project_number = project.get("ProjectNumber", "")
             project_title = project.get("ProjectTitle", {})
-            korean_title = project_title.get("Korean", "과제명 없음") if isinstance(project_title, dict) else str(project_title) if project_title else "과제명 없음"
-            english_title = project_title.get("English", "") if isinstance(project_title, dict) else ""
+            korean_title = project_title.get("Korean", "과제명 없음") if isinstance(project_title, Mapping) else str(project_title) if project_title else "과제명 없음"
+            english_title = project_title.get("English", "") if isinstance(project_title, Mapping) else ""
             
             # 연구책임자 정보
             manager = project.get("Manager", {})
-            manager_name = manager.get("Name", "연구책임자 없음") if isinstance(manager, dict) else str(manager) if manager else "연구책임자 없음"
+            manager_name = manager.get("Name", "연구책임자 없음") if isinstance(manager, Mapping) else str(manager) if manager else "연구책임자 없음"
             
             # 참여연구원 정보
             researchers = project.get("Researchers", {})
-            if isinstance(researchers, dict):
+            if isinstance(researchers, Mapping):
                 researcher_names = researchers.get("Name", "")
                 man_count = researchers.get("ManCount", "")
                 woman_count = researchers.get("WomanCount", "")
@@ -1982,22 +4013,22 @@ class NTISFormatter(BaseResultFormatter):
             
             # 연구기관 정보
             research_agency = project.get("ResearchAgency", {})
-            research_agency_name = research_agency.get("Name", "연구기관 없음") if isinstance(research_agency, dict) else str(research_agency) if research_agency else "연구기관 없음"
+            research_agency_name = research_agency.get("Name", "연구기관 없음") if isinstance(research_agency, Mapping) else str(research_agency) if research_agency else "연구기관 없음"
             
             order_agency = project.get("OrderAgency", {})
-            order_agency_name = order_agency.get("Name", "") if isinstance(order_agency, dict) else ""
+            order_agency_name = order_agency.get("Name", "") if isinstance(order_agency, Mapping) else ""
             
             # 예산 정보
             budget_project = project.get("BudgetProject", {})
-            budget_project_name = budget_project.get("Name", "") if isinstance(budget_project, dict) else ""
+            budget_project_name = budget_project.get("Name", "") if isinstance(budget_project, Mapping) else ""
             
             ministry = project.get("Ministry", {})
-            ministry_name = ministry.get("Name", "") if isinstance(ministry, dict) else ""
+            ministry_name = ministry.get("Name", "") if isinstance(ministry, Mapping) else ""
             
             # 과제 기간 정보
             project_year = project.get("ProjectYear", "")
             project_period = project.get("ProjectPeriod", {})
-            if isinstance(project_period, dict):
+            if isinstance(project_period, Mapping):
                 start_date = project_period.get("Start", "")
                 end_date = project_period.get("End", "")
                 total_start = project_period.get("TotalStart", "")
@@ -2011,21 +4042,21 @@ class NTISFormatter(BaseResultFormatter):
             
             # 연구 내용 (핵심!)
             goal = project.get("Goal", {})
-            goal_full = goal.get("Full", "") if isinstance(goal, dict) else ""
-            goal_teaser = goal.get("Teaser", "") if isinstance(goal, dict) else ""
+            goal_full = goal.get("Full", "") if isinstance(goal, Mapping) else ""
+            goal_teaser = goal.get("Teaser", "") if isinstance(goal, Mapping) else ""
             
             abstract = project.get("Abstract", {})
-            abstract_full = abstract.get("Full", "") if isinstance(abstract, dict) else ""
-            abstract_teaser = abstract.get("Teaser", "") if isinstance(abstract, dict) else ""
+            abstract_full = abstract.get("Full", "") if isinstance(abstract, Mapping) else ""
+            abstract_teaser = abstract.get("Teaser", "") if isinstance(abstract, Mapping) else ""
             
             effect = project.get("Effect", {})
-            effect_full = effect.get("Full", "") if isinstance(effect, dict) else ""
-            effect_teaser = effect.get("Teaser", "") if isinstance(effect, dict) else ""
+            effect_full = effect.get("Full", "") if isinstance(effect, Mapping) else ""
+            effect_teaser = effect.get("Teaser", "") if isinstance(effect, Mapping) else ""
             
             # 키워드
             keyword = project.get("Keyword", {})
-            korean_keyword = keyword.get("Korean", "") if isinstance(keyword, dict) else ""
-            english_keyword = keyword.get("English", "") if isinstance(keyword, dict) else ""
+            korean_keyword = keyword.get("Korean", "") if isinstance(keyword, Mapping) else ""
+            english_keyword = keyword.get("English", "") if isinstance(keyword, Mapping) else ""
             
             # 결과 포맷팅
             result_text = f"**{korean_title}**"
@@ -2287,6 +4318,9 @@ class ScienceONFormatter(BaseResultFormatter):
     # 긴 텍스트(초록·본문·정의·내용) 포함 여부. format_* 진입 시 세팅된다.
     _include_body = True
 
+    # _body()로만 출력되는 metaCode (include_body=False 목록 검색은 파싱 단계에서 생략)
+    BODY_FIELDS = frozenset({"Abstract", "AB", "Content", "Definition", "contents"})
+
     def _body(self, text: str) -> str:
         """긴 본문 텍스트 정리. _include_body=False 이면 빈 문자열(제외).
 
@@ -3191,6 +5225,56 @@ class DataONFormatter(BaseResultFormatter):
 
         return "\n".join(formatted_result)
 
+# ── 일괄 조회 ──────────────────────────────────────────────
+# 한 번에 받을 수 있는 식별자 수 상한
+BATCH_MAX_ITEMS = 50
+
+
+def prepare_batch_ids(ids: List[str]) -> List[str]:
+    """공백 제거·중복 제거 (입력 순서 유지)"""
+    return list(dict.fromkeys(i for i in (str(raw).strip() for raw in ids or ()) if i))
+
+
+async def run_bounded(items: List[Any], worker, limit: int) -> List[Any]:
+    """items마다 worker(item)를 최대 limit개까지 동시 실행 (결과는 입력 순서)"""
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def run(item):
+        async with semaphore:
+            return await worker(item)
+
+    return await asyncio.gather(*(run(item) for item in items))
+
+
+async def run_detail_batch(title: str, ids: List[str], worker) -> str:
+    """식별자 목록 일괄 조회 후 항목별 상태와 함께 하나의 응답으로 합침
+
+    worker(id)는 (status, 본문) 튜플을 반환한다. status: ok / empty / error
+    """
+    # 상한은 정리 전 입력 길이로 먼저 확인 (과도한 입력은 처리하지 않음)
+    if ids and len(ids) > BATCH_MAX_ITEMS:
+        return f"🚨 한 번에 최대 {BATCH_MAX_ITEMS}건까지 조회할 수 있습니다. (요청: {len(ids)}건)"
+    ids = prepare_batch_ids(ids)
+    if not ids:
+        return "🚨 조회할 식별자 목록이 비어 있습니다."
+
+    async def guarded(item_id: str):
+        try:
+            return await worker(item_id)
+        except Exception as e:
+            logger.error(f"{title} 일괄조회 중 오류 ({item_id}): {str(e)}")
+            return "error", f"조회 중 오류가 발생했습니다: {str(e)}"
+
+    rows = await run_bounded(ids, guarded, get_env_int("KISTI_BATCH_CONCURRENCY", 5))
+    labels = {"ok": "✅ 성공", "empty": "📭 결과 없음", "error": "🚨 실패"}
+    counts = {status: sum(1 for st, _ in rows if st == status) for status in labels}
+    lines = [f"**{title} 일괄조회** (총 {len(ids)}건: 성공 {counts['ok']} / "
+             f"결과 없음 {counts['empty']} / 실패 {counts['error']})"]
+    for n, (item_id, (status, body)) in enumerate(zip(ids, rows), 1):
+        lines.append(f"\n---\n### [{n}] {item_id} — {labels.get(status, status)}\n{body}")
+    return "\n".join(lines)
+
+
 # 서비스 클래스 (비즈니스 로직)
 class SearchService:
     """검색 서비스"""
@@ -3198,24 +5282,96 @@ class SearchService:
     def __init__(self, client: BaseAPIClient, formatter: BaseResultFormatter):
         self.client = client
         self.formatter = formatter
-    
+
+    def _token_failure_message(self) -> str:
+        """토큰 발급 실패 안내 (마지막 실패 사유 포함)"""
+        reason = self.client._tokens.last_error
+        return ("🚨 토큰 발급에 실패했습니다. 인증 정보를 확인해주세요."
+                + (f"\n사유: {reason}" if reason else ""))
+
+    async def _search(self, query, target: str, max_results: int,
+                      query_field: str = "BI", include_body: bool = True) -> Optional[Dict[str, Any]]:
+        """응답 캐시를 거친 검색 (캐시 미스 시 토큰 발급, 실패하면 None)
+
+        include_body=False면 포맷터가 버릴 긴 본문(BODY_FIELDS)을 파싱하지 않은 응답을 쓴다
+        (전체 응답과 캐시 키가 다름).
+        """
+        skip_fields = frozenset() if include_body else self.formatter.BODY_FIELDS
+        key = make_cache_key("scienceon", target, query, query_field, max_results=max_results,
+                             projection="" if include_body else "list")
+        token_failed = False
+
+        async def fetch():
+            nonlocal token_failed
+            if not await self.client.get_token():
+                token_failed = True
+                return {"error": True}  # 성공 응답이 아니므로 캐시되지 않음
+            return await self.client.search(query, target, max_results, query_field=query_field,
+                                            skip_fields=skip_fields)
+
+        result = await cached_fetch(key, target, fetch)
+        return None if token_failed else result
+
+    async def _get_details(self, cn: str, target: str) -> Optional[Dict[str, Any]]:
+        """상세 캐시를 거친 상세 조회 (캐시 미스 시 토큰 발급, 실패하면 None)"""
+        cached = await detail_store.get("scienceon", target, cn,
+                                        allow_stale=quota_near_limit("scienceon"))
+        if cached is not None:
+            return cached
+        if not await self.client.get_token():
+            return None
+        try:
+            result = await self.client.get_details(cn, target)
+        except RateLimitedError:
+            # 호출 한도 초과 → TTL이 지난 상세 캐시라도 있으면 사용 (cached_detail과 같음)
+            stale = await detail_store.get("scienceon", target, cn, allow_stale=True)
+            if stale is None:
+                raise
+            return stale
+        if result.get("success") and result.get("records"):
+            await detail_store.put("scienceon", target, cn, result)
+        return result
+
+    # 일괄 상세조회 대상 (content_type → target, 결과 유형)
+    BATCH_DETAIL_TYPES = {"paper": ("ARTI", "paper"), "patent": ("PATENT", "patent"),
+                          "report": ("REPORT", "report")}
+
+    async def get_details_batch(self, cns: List[str], content_type: str = "paper",
+                                include_body: bool = False) -> str:
+        """CN 목록 일괄 상세조회 (상세 캐시 재사용, 동시 조회 수 제한)"""
+        if content_type not in self.BATCH_DETAIL_TYPES:
+            return f"🚨 지원하지 않는 유형입니다. 사용 가능: {', '.join(self.BATCH_DETAIL_TYPES)}"
+        target, result_type = self.BATCH_DETAIL_TYPES[content_type]
+
+        async def fetch_one(cn: str):
+            result = await self._get_details(cn, target)
+            if result is None:
+                return "error", self._token_failure_message()
+            if result.get("error"):
+                return "error", result.get("error_message") or result.get("message", "알 수 없는 오류")
+            records = result.get("records")
+            if not (result.get("success") and records):
+                return "empty", f"CN번호 '{cn}'에 해당하는 정보를 찾을 수 없습니다."
+            return "ok", self.formatter.stale_notice(result) + self.formatter.format_detail_result(
+                records[0], cn, result_type, include_body=include_body)
+
+        return await run_detail_batch(f"ScienceON {content_type}", cns, fetch_one)
+
     async def search_papers(self, query: str, max_results: int = 10, include_body: bool = True) -> str:
         """논문 검색"""
         try:
-            # 토큰 발급
-            if not await self.client.get_token():
-                return "🚨 토큰 발급에 실패했습니다. 인증 정보를 확인해주세요."
-
-            # 검색 수행
-            result = await self.client.search(query, "ARTI", max_results)
+            # 검색 수행 (응답 캐시 미스일 때만 토큰 발급)
+            result = await self._search(query, "ARTI", max_results, include_body=include_body)
+            if result is None:
+                return self._token_failure_message()
 
             if result.get("error"):
-                return f"🚨 API 오류: {result.get('error_message', '알 수 없는 오류')}"
+                return f"🚨 API 오류: {result.get('error_message') or result.get('message', '알 수 없는 오류')}"
 
             if result.get("success") and result.get("papers"):
                 papers = result["papers"]
                 total_count = result.get("total_count", 0)
-                return self.formatter.format_search_results(papers[:max_results], query, total_count, "paper", include_body=include_body)
+                return self.formatter.stale_notice(result) + self.formatter.format_search_results(papers[:max_results], query, total_count, "paper", include_body=include_body)
             else:
                 return f"'{query}'에 대한 논문 검색 결과가 없습니다."
                 
@@ -3226,20 +5382,18 @@ class SearchService:
     async def get_paper_details(self, cn: str, include_body: bool = True) -> str:
         """논문 상세 정보 조회"""
         try:
-            # 토큰 발급
-            if not await self.client.get_token():
-                return "🚨 토큰 발급에 실패했습니다. 인증 정보를 확인해주세요."
-
-            # 상세 정보 조회
-            result = await self.client.get_details(cn, "ARTI")
+            # 상세 정보 조회 (상세 캐시 우선)
+            result = await self._get_details(cn, "ARTI")
+            if result is None:
+                return self._token_failure_message()
 
             if result.get("error"):
-                return f"🚨 API 오류: {result.get('error_message', '알 수 없는 오류')}"
+                return f"🚨 API 오류: {result.get('error_message') or result.get('message', '알 수 없는 오류')}"
 
             if result.get("success") and result.get("papers"):
                 papers = result["papers"]
                 if papers:
-                    return self.formatter.format_detail_result(papers[0], cn, "paper", include_body=include_body)
+                    return self.formatter.stale_notice(result) + self.formatter.format_detail_result(papers[0], cn, "paper", include_body=include_body)
                 else:
                     return f"CN번호 '{cn}'에 해당하는 논문을 찾을 수 없습니다."
             else:
@@ -3252,20 +5406,18 @@ class SearchService:
     async def search_patents(self, query: str, max_results: int = 10, include_body: bool = True) -> str:
         """특허 검색"""
         try:
-            # 토큰 발급
-            if not await self.client.get_token():
-                return "🚨 토큰 발급에 실패했습니다. 인증 정보를 확인해주세요."
-
-            # 검색 수행
-            result = await self.client.search(query, "PATENT", max_results)
+            # 검색 수행 (응답 캐시 미스일 때만 토큰 발급)
+            result = await self._search(query, "PATENT", max_results, include_body=include_body)
+            if result is None:
+                return self._token_failure_message()
 
             if result.get("error"):
-                return f"🚨 API 오류: {result.get('error_message', '알 수 없는 오류')}"
+                return f"🚨 API 오류: {result.get('error_message') or result.get('message', '알 수 없는 오류')}"
 
             if result.get("success") and result.get("papers"):  # 특허도 papers 필드로 반환
                 patents = result["papers"]
                 total_count = result.get("total_count", 0)
-                return self.formatter.format_search_results(patents[:max_results], query, total_count, "patent", include_body=include_body)
+                return self.formatter.stale_notice(result) + self.formatter.format_search_results(patents[:max_results], query, total_count, "patent", include_body=include_body)
             else:
                 return f"'{query}'에 대한 특허 검색 결과가 없습니다."
                 
@@ -3276,20 +5428,18 @@ class SearchService:
     async def search_reports(self, query: str, max_results: int = 10, include_body: bool = True) -> str:
         """보고서 검색"""
         try:
-            # 토큰 발급
-            if not await self.client.get_token():
-                return "🚨 토큰 발급에 실패했습니다. 인증 정보를 확인해주세요."
-
-            # 검색 수행
-            result = await self.client.search(query, "REPORT", max_results)
+            # 검색 수행 (응답 캐시 미스일 때만 토큰 발급)
+            result = await self._search(query, "REPORT", max_results, include_body=include_body)
+            if result is None:
+                return self._token_failure_message()
 
             if result.get("error"):
-                return f"🚨 API 오류: {result.get('error_message', '알 수 없는 오류')}"
+                return f"🚨 API 오류: {result.get('error_message') or result.get('message', '알 수 없는 오류')}"
 
             if result.get("success") and result.get("papers"):  # 보고서도 papers 필드로 반환
                 reports = result["papers"]
                 total_count = result.get("total_count", 0)
-                return self.formatter.format_search_results(reports[:max_results], query, total_count, "report", include_body=include_body)
+                return self.formatter.stale_notice(result) + self.formatter.format_search_results(reports[:max_results], query, total_count, "report", include_body=include_body)
             else:
                 return f"'{query}'에 대한 보고서 검색 결과가 없습니다."
                 
@@ -3300,20 +5450,18 @@ class SearchService:
     async def get_patent_details(self, cn: str, include_body: bool = True) -> str:
         """특허 상세 정보 조회"""
         try:
-            # 토큰 발급
-            if not await self.client.get_token():
-                return "🚨 토큰 발급에 실패했습니다. 인증 정보를 확인해주세요."
-
-            # 상세 정보 조회
-            result = await self.client.get_details(cn, "PATENT")
+            # 상세 정보 조회 (상세 캐시 우선)
+            result = await self._get_details(cn, "PATENT")
+            if result is None:
+                return self._token_failure_message()
 
             if result.get("error"):
-                return f"🚨 API 오류: {result.get('error_message', '알 수 없는 오류')}"
+                return f"🚨 API 오류: {result.get('error_message') or result.get('message', '알 수 없는 오류')}"
 
             if result.get("success") and result.get("papers"):
                 patents = result["papers"]
                 if patents:
-                    return self.formatter.format_detail_result(patents[0], cn, "patent", include_body=include_body)
+                    return self.formatter.stale_notice(result) + self.formatter.format_detail_result(patents[0], cn, "patent", include_body=include_body)
                 else:
                     return f"CN번호 '{cn}'에 해당하는 특허를 찾을 수 없습니다."
             else:
@@ -3328,13 +5476,13 @@ class SearchService:
         try:
             # 토큰 발급
             if not await self.client.get_token():
-                return "🚨 토큰 발급에 실패했습니다. 인증 정보를 확인해주세요."
+                return self._token_failure_message()
             
             # 인용 정보 조회
             result = await self.client.get_citations(cn, "PATENT")
             
             if result.get("error"):
-                return f"🚨 API 오류: {result.get('error_message', '알 수 없는 오류')}"
+                return f"🚨 API 오류: {result.get('error_message') or result.get('message', '알 수 없는 오류')}"
             
             if result.get("success") and result.get("papers"):
                 citations = result["papers"]
@@ -3349,20 +5497,18 @@ class SearchService:
     async def get_report_details(self, cn: str, include_body: bool = True) -> str:
         """보고서 상세 정보 조회"""
         try:
-            # 토큰 발급
-            if not await self.client.get_token():
-                return "🚨 토큰 발급에 실패했습니다. 인증 정보를 확인해주세요."
-
-            # 상세 정보 조회
-            result = await self.client.get_details(cn, "REPORT")
+            # 상세 정보 조회 (상세 캐시 우선)
+            result = await self._get_details(cn, "REPORT")
+            if result is None:
+                return self._token_failure_message()
 
             if result.get("error"):
-                return f"🚨 API 오류: {result.get('error_message', '알 수 없는 오류')}"
+                return f"🚨 API 오류: {result.get('error_message') or result.get('message', '알 수 없는 오류')}"
 
             if result.get("success") and result.get("papers"):
                 reports = result["papers"]
                 if reports:
-                    return self.formatter.format_detail_result(reports[0], cn, "report", include_body=include_body)
+                    return self.formatter.stale_notice(result) + self.formatter.format_detail_result(reports[0], cn, "report", include_body=include_body)
                 else:
                     return f"CN번호 '{cn}'에 해당하는 보고서를 찾을 수 없습니다."
             else:
@@ -3379,18 +5525,18 @@ class SearchService:
                               include_body: bool = True) -> str:
         """검색 공통 처리 (records alias 사용)"""
         try:
-            if not await self.client.get_token():
-                return "🚨 토큰 발급에 실패했습니다. 인증 정보를 확인해주세요."
-
-            result = await self.client.search(query, target, max_results, query_field=query_field)
+            result = await self._search(query, target, max_results, query_field=query_field,
+                                        include_body=include_body)
+            if result is None:
+                return self._token_failure_message()
 
             if result.get("error"):
-                return f"🚨 API 오류: {result.get('error_message', '알 수 없는 오류')}"
+                return f"🚨 API 오류: {result.get('error_message') or result.get('message', '알 수 없는 오류')}"
 
             if result.get("success") and result.get("records"):
                 records = result["records"]
                 total_count = result.get("total_count", 0)
-                return self.formatter.format_search_results(
+                return self.formatter.stale_notice(result) + self.formatter.format_search_results(
                     records[:max_results], display_query, total_count, result_type,
                     include_body=include_body)
             else:
@@ -3403,19 +5549,18 @@ class SearchService:
                               include_body: bool = True) -> str:
         """상세 조회 공통 처리 (records alias 사용)"""
         try:
-            if not await self.client.get_token():
-                return "🚨 토큰 발급에 실패했습니다. 인증 정보를 확인해주세요."
-
-            result = await self.client.get_details(cn, target)
+            result = await self._get_details(cn, target)
+            if result is None:
+                return self._token_failure_message()
 
             if result.get("error"):
-                return f"🚨 API 오류: {result.get('error_message', '알 수 없는 오류')}"
+                return f"🚨 API 오류: {result.get('error_message') or result.get('message', '알 수 없는 오류')}"
 
             if result.get("success") and result.get("records"):
                 records = result["records"]
                 if records:
-                    return self.formatter.format_detail_result(records[0], cn, result_type,
-                                                               include_body=include_body)
+                    return self.formatter.stale_notice(result) + self.formatter.format_detail_result(
+                        records[0], cn, result_type, include_body=include_body)
                 return f"CN번호 '{cn}'에 해당하는 정보를 찾을 수 없습니다."
             return f"CN번호 '{cn}'에 대한 상세정보를 가져올 수 없습니다."
         except Exception as e:
@@ -3459,12 +5604,162 @@ class SearchService:
                        "뉴스는 매주 월요일 기준으로 등록됩니다."), include_body=include_body)
 
 # 서비스 클래스에 NTIS 메서드 추가
+class TierMemo:
+    """NTIS 권한 단계 학습 결과 (ntis_tiers.json에 API 키별로 저장)
+
+    (target, collection)별로 실제 응답한 최상위 tier를 기억해 상위 tier 호출을 건너뛴다.
+    reprobe_seconds가 지나면 상위 tier를 다시 시도해 권한 변경을 반영한다.
+    파일 기록은 백그라운드 스레드에서 한다 (요청 처리 중 이벤트 루프에서 파일 IO 안 함).
+    """
+
+    def __init__(self, path: Optional[Path], api_key: str, reprobe_seconds: float = 86400):
+        self.path = path
+        self.reprobe_seconds = reprobe_seconds
+        # 키 원문 대신 해시로 구분 (키 교체 시 자동으로 새로 학습)
+        self.key_id = hashlib.sha256(api_key.encode('utf-8')).hexdigest()[:16]
+        self._all: Dict[str, Dict[str, Any]] = self._load()
+        self._memo: Dict[str, Dict[str, Any]] = self._all.setdefault(self.key_id, {})
+        self._dirty = False
+        self._writer: Optional[asyncio.Task] = None
+
+    @classmethod
+    def from_env(cls, api_key: str) -> "TierMemo":
+        try:
+            path = get_cache_dir() / "ntis_tiers.json"
+        except OSError as e:
+            logger.warning(f"NTIS tier 학습 파일 경로를 만들 수 없어 메모리에만 보관합니다: {str(e)}")
+            path = None
+        return cls(path, api_key, get_env_float("NTIS_TIER_REPROBE_SECONDS", 86400))
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self.path is None or not self.path.exists():
+            return {}
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+            return data if isinstance(data, dict) else {}
+        except Exception as e:
+            logger.warning(f"NTIS tier 학습 파일을 읽을 수 없습니다: {str(e)}")
+            return {}
+
+    def _save(self):
+        """변경 내용 기록 예약 (기록 중이면 끝난 뒤 최신 내용으로 한 번 더 기록)"""
+        if self.path is None:
+            return
+        self._dirty = True
+        if self._writer is None or self._writer.done():
+            self._writer = asyncio.ensure_future(self._flush())
+
+    async def _flush(self):
+        while self._dirty:
+            self._dirty = False
+            data = json.dumps(self._all, ensure_ascii=False, indent=1)
+            await asyncio.to_thread(self._write, data)
+
+    def _write(self, data: str):
+        try:
+            write_file_atomic(self.path, data)
+        except Exception as e:
+            logger.warning(f"NTIS tier 학습 파일 저장 오류: {str(e)}")
+
+    def get(self, key: str) -> Optional[str]:
+        """학습된 tier 라벨 (없거나 재탐색 시점이 지났으면 None)"""
+        entry = self._memo.get(key)
+        if not entry or time.time() - entry.get("learned_at", 0) >= self.reprobe_seconds:
+            return None
+        return entry.get("tier")
+
+    def learn(self, key: str, tier: str):
+        entry = self._memo.get(key)
+        if entry and entry.get("tier") == tier and self.get(key) is not None:
+            return
+        logger.info(f"NTIS tier 학습: {key} → {tier}")
+        self._memo[key] = {"tier": tier, "learned_at": time.time()}
+        self._save()
+
+    def forget(self, key: str):
+        if self._memo.pop(key, None) is not None:
+            self._save()
+
+    def stats(self) -> Dict[str, Any]:
+        return {k: v.get("tier") for k, v in self._memo.items()}
+
+
 class NTISSearchService:
     """NTIS 검색 서비스"""
     
     def __init__(self, client: NTISClient, formatter: NTISFormatter):
         self.client = client
         self.formatter = formatter
+        self.tier_memo = TierMemo.from_env(client.api_key)
+        # 권한 단계(tier) 시도 방식: sequential(순차 폴백, 기본) / concurrent(동시 요청)
+        # concurrent는 미학습 검색마다 업스트림 호출이 2~3건이라 일일 한도를 더 쓴다
+        self.tier_mode = get_env("NTIS_TIER_MODE", "sequential").strip().lower()
+        if self.tier_mode not in ("concurrent", "sequential"):
+            logger.warning(f"알 수 없는 NTIS_TIER_MODE '{self.tier_mode}', sequential 사용")
+            self.tier_mode = "sequential"
+
+    @staticmethod
+    def _is_rich(r: Dict[str, Any]) -> bool:
+        return not r.get("error") and bool(r.get("success")) and bool(r.get("results"))
+
+    @staticmethod
+    def _is_denied(r: Dict[str, Any]) -> bool:
+        """키 권한 밖이라 거절된 응답 (401/403, 인증키/IP 오류, 인증 백오프 중)"""
+        return bool(r.get("error")) and bool(r.get("permission_denied"))
+
+    async def _first_rich_tier(self, memo_key: str, tiers: List[tuple],
+                               max_results: int) -> Dict[str, Any]:
+        """우선순위 순 tier 목록 [(label, target, query), ...] 중 결과가 있는 첫 tier 응답 반환
+
+        결과가 없으면 마지막 tier의 응답(에러/빈 결과)을 반환한다.
+        에러 없이 응답한 최상위 tier는 그보다 상위 tier가 모두 권한 오류였을 때만
+        tier_memo에 기록해 다음 호출부터 상위 tier를 건너뛴다. 상위 tier가 일시 오류
+        (5xx, 시간 초과, 차단기/격벽 즉시 실패)였다면 하위 tier로 응답하되 학습하지 않는다.
+        속도/일일 한도 초과(RateLimitedError)는 그대로 던진다.
+        concurrent 모드는 모든 tier를 동시에 요청하되 우선순위 순으로 결과를 확인하고,
+        상위 tier가 성공하면 남은 하위 tier 요청은 취소한다.
+        """
+        learned = self.tier_memo.get(memo_key)
+        labels = [label for label, _, _ in tiers]
+        start = labels.index(learned) if learned in labels else 0
+        tiers = tiers[start:]
+
+        tasks = None
+        if self.tier_mode == "concurrent":
+            tasks = [asyncio.ensure_future(self.client.search(q, tgt, max_results))
+                     for _, tgt, q in tiers]
+        try:
+            result = None
+            # 지금까지 확인한 상위 tier가 모두 권한 오류였는지 (그래야 하위 tier를 학습)
+            learnable = True
+            for i, (label, tgt, q) in enumerate(tiers):
+                try:
+                    result = await (tasks[i] if tasks else self.client.search(q, tgt, max_results))
+                except AuthBackoffError as e:
+                    result = {"error": True, "message": str(e), "permission_denied": str(e)}
+                except RateLimitedError:
+                    raise  # 같은 자격증명이라 하위 tier도 막힘, cached_fetch가 만료된 캐시로 대신 응답
+                except APIFastFailError as e:
+                    result = {"error": True, "message": str(e)}
+                if learnable:
+                    if not result.get("error"):
+                        learnable = False
+                        self.tier_memo.learn(memo_key, label)
+                    elif self._is_denied(result):
+                        if i == 0 and start > 0:
+                            # 학습된 tier도 권한 오류 → 권한 변경, 다음 호출에서 전체 재탐색
+                            self.tier_memo.forget(memo_key)
+                    else:
+                        learnable = False
+                if self._is_rich(result):
+                    return result
+            return result
+        finally:
+            for task in tasks or ():
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    task.exception()  # 확인하지 않은 하위 tier 예외 소거
     
     async def search_projects(self, query: str, max_results: int = 10) -> str:
         """국가R&D 과제 검색 (전문기관용→전체용 자동 폴백)
@@ -3475,29 +5770,29 @@ class NTISSearchService:
             if not await self.client.get_token():
                 return "🚨 NTIS API 연결에 실패했습니다."
 
-            # 전문기관용(projectAllSearch) → 전체용(public_project) 순으로 시도
-            result = None
-            for tgt in ("PROJECT_SPECIAL", "PROJECT"):
-                r = await self.client.search(query, tgt, max_results)
-                if not r.get("error") and r.get("success") and r.get("results"):
-                    result = r
-                    break
-                # 마지막 시도의 결과(에러/빈결과)는 보존
-                result = r
+            key = make_cache_key("ntis", "PROJECT", query, max_results=max_results)
+            result = await cached_fetch(
+                key, "PROJECT", lambda: self._search_project_tiers(query, max_results))
 
             if result.get("error"):
-                return f"🚨 NTIS API 오류: {result.get('error_message', '알 수 없는 오류')}"
+                return f"🚨 NTIS API 오류: {result.get('error_message') or result.get('message', '알 수 없는 오류')}"
 
             if result.get("success") and result.get("results"):
                 projects = result["results"]
                 total_count = result.get("total_count", 0)
-                return self.formatter.format_search_results(projects[:max_results], query, total_count, "project")
+                return self.formatter.stale_notice(result) + self.formatter.format_search_results(projects[:max_results], query, total_count, "project")
             else:
                 return f"'{query}'에 대한 국가R&D 과제 검색 결과가 없습니다."
 
         except Exception as e:
             logger.error(f"NTIS 과제 검색 중 오류: {str(e)}")
             return f"국가R&D 과제 검색 중 오류가 발생했습니다: {str(e)}"
+
+    async def _search_project_tiers(self, query: str, max_results: int) -> Dict[str, Any]:
+        """전문기관용(projectAllSearch) → 전체용(public_project) 우선순위로 시도"""
+        return await self._first_rich_tier(
+            "PROJECT", [("PROJECT_SPECIAL", "PROJECT_SPECIAL", query),
+                        ("PROJECT", "PROJECT", query)], max_results)
     
     async def search_classifications(self, query: str, classification_type: str = "standard", max_results: int = 10) -> str:
         """분류 추천 (연구과제 초록 기반)"""
@@ -3513,7 +5808,7 @@ class NTISSearchService:
             result = await self.client.search((query, classification_type), "CLASSIFICATION", max_results)
             
             if result.get("error"):
-                return f"🚨 NTIS API 오류: {result.get('error_message', '알 수 없는 오류')}"
+                return f"🚨 NTIS API 오류: {result.get('error_message') or result.get('message', '알 수 없는 오류')}"
             
             if result.get("success") and result.get("classifications"):
                 classifications = result["classifications"] 
@@ -3556,7 +5851,7 @@ class NTISSearchService:
             result = await self.client.search(detailed_params, "CLASSIFICATION_DETAILED", max_results)
             
             if result.get("error"):
-                return f"🚨 NTIS API 오류: {result.get('error_message', '알 수 없는 오류')}"
+                return f"🚨 NTIS API 오류: {result.get('error_message') or result.get('message', '알 수 없는 오류')}"
             
             if result.get("success") and result.get("classifications"):
                 classifications = result["classifications"] 
@@ -3575,6 +5870,37 @@ class NTISSearchService:
             logger.error(f"NTIS 항목별 분류 추천 중 오류: {str(e)}")
             return f"항목별 분류 추천 중 오류가 발생했습니다: {str(e)}"
     
+    # 연관콘텐츠 collection과 섹션 제목 (출력 순서)
+    RELATED_COLLECTIONS = [
+        ("project", "관련 과제"),
+        ("paper", "관련 논문"),
+        ("patent", "관련 특허"),
+        ("researchreport", "관련 연구보고서"),
+    ]
+
+    async def _fetch_related_all(self, pjt_id: str, max_results: int) -> List[Dict[str, Any]]:
+        """4개 collection 연관콘텐츠 동시 조회 (RELATED_COLLECTIONS 순서)
+
+        collection별로 NTIS_RELATED_TIMEOUT(초)을 적용하고, 시간 초과/예외는 해당
+        collection의 에러 응답으로 바꿔 나머지 섹션은 정상 출력되게 한다.
+        """
+        timeout = get_env_float("NTIS_RELATED_TIMEOUT", 20.0)
+
+        async def fetch_one(collection_type: str) -> Dict[str, Any]:
+            try:
+                return await asyncio.wait_for(cached_detail(
+                    "ntis", "RELATED_CONTENT", f"{pjt_id}:{collection_type}",
+                    lambda: self.client.search((pjt_id, collection_type), "RELATED_CONTENT", max_results)),
+                    timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"연관콘텐츠 {collection_type} 조회 시간 초과 ({timeout:g}초)")
+                return {"error": True, "message": f"응답 시간 초과 ({timeout:g}초)"}
+            except Exception as e:
+                logger.error(f"연관콘텐츠 {collection_type} 조회 중 오류: {str(e)}")
+                return {"error": True, "message": str(e)}
+
+        return await asyncio.gather(*(fetch_one(c) for c, _ in self.RELATED_COLLECTIONS))
+
     async def search_recommendations(self, query: str, max_results: int = 10) -> str:
         """연관콘텐츠 추천 (과제명 기반)"""
         try:
@@ -3586,7 +5912,7 @@ class NTISSearchService:
             project_result = await self.client.search(query, "PROJECT", 5)  # 최대 5개 검색
             
             if project_result.get("error"):
-                return f"과제 검색 중 오류: {project_result.get('error_message', '알 수 없는 오류')}"
+                return f"과제 검색 중 오류: {project_result.get('error_message') or project_result.get('message', '알 수 없는 오류')}"
             
             if not project_result.get("success") or not project_result.get("results"):
                 return f"'{query}'와 관련된 R&D 과제를 찾을 수 없습니다. 정확한 과제명을 입력해주세요."
@@ -3602,25 +5928,16 @@ class NTISSearchService:
             
             logger.info(f"2단계: 과제 ID '{pjt_id}'로 연관콘텐츠 검색")
             
-            # 2단계: pjtId로 4개 collection 타입 모두 검색
-            collections = [
-                ("project", "관련 과제"),
-                ("paper", "관련 논문"), 
-                ("patent", "관련 특허"),
-                ("researchreport", "관련 연구보고서")
-            ]
+            # 2단계: pjtId로 4개 collection 타입 모두 동시 검색 (collection별 타임아웃)
+            related_results = await self._fetch_related_all(pjt_id, max_results)
             
             all_results = []
             header = f"**선택된 과제:** {project_title}\n**과제 ID:** {pjt_id}\n\n"
             
-            for collection_type, section_title in collections:
-                logger.info(f"검색 중: {collection_type} collection")
-                
-                # 각 collection별로 연관콘텐츠 검색
-                related_result = await self.client.search((pjt_id, collection_type), "RELATED_CONTENT", max_results)
-                
+            for (collection_type, section_title), related_result in zip(
+                    self.RELATED_COLLECTIONS, related_results):
                 if related_result.get("error"):
-                    header += f"* {section_title} 검색 중 오류: {related_result.get('error_message')}\n"
+                    header += f"* {section_title} 검색 중 오류: {related_result.get('message')}\n"
                     continue
                 
                 if related_result.get("success") and related_result.get("results"):
@@ -3658,25 +5975,16 @@ class NTISSearchService:
             
             logger.info(f"과제 ID '{pjt_id}'로 연관콘텐츠 검색")
             
-            # 4개 collection 타입 모두 검색
-            collections = [
-                ("project", "관련 과제"),
-                ("paper", "관련 논문"), 
-                ("patent", "관련 특허"),
-                ("researchreport", "관련 연구보고서")
-            ]
+            # 4개 collection 타입 모두 동시 검색 (collection별 타임아웃)
+            related_results = await self._fetch_related_all(pjt_id, max_results)
             
             all_results = []
             header = f"**과제 ID:** {pjt_id}\n\n"
             
-            for collection_type, section_title in collections:
-                logger.info(f"검색 중: {collection_type} collection")
-                
-                # 각 collection별로 연관콘텐츠 검색
-                related_result = await self.client.search((pjt_id, collection_type), "RELATED_CONTENT", max_results)
-                
+            for (collection_type, section_title), related_result in zip(
+                    self.RELATED_COLLECTIONS, related_results):
                 if related_result.get("error"):
-                    header += f"* {section_title} 검색 중 오류: {related_result.get('error_message')}\n"
+                    header += f"* {section_title} 검색 중 오류: {related_result.get('message')}\n"
                     continue
                 
                 if related_result.get("success") and related_result.get("results"):
@@ -3711,13 +6019,15 @@ class NTISSearchService:
         try:
             if not await self.client.get_token():
                 return "🚨 NTIS API 연결에 실패했습니다."
-            result = await self.client.search(query, target, max_results)
+            key = make_cache_key("ntis", target, query, max_results=max_results)
+            result = await cached_fetch(
+                key, target, lambda: self.client.search(query, target, max_results))
             if result.get("error"):
-                return f"🚨 NTIS API 오류: {result.get('error_message', '알 수 없는 오류')}"
+                return f"🚨 NTIS API 오류: {result.get('error_message') or result.get('message', '알 수 없는 오류')}"
             if result.get("success") and result.get("results"):
                 records = result["results"]
                 total_count = result.get("total_count", 0)
-                return self.formatter.format_search_results(
+                return self.formatter.stale_notice(result) + self.formatter.format_search_results(
                     records[:max_results], display_query, total_count, result_type)
             return empty_msg or f"'{display_query}'에 대한 검색 결과가 없습니다."
         except Exception as e:
@@ -3737,30 +6047,31 @@ class NTISSearchService:
             if not await self.client.get_token():
                 return "🚨 NTIS API 연결에 실패했습니다."
 
-            result = None
-            for level in ("all", "org", "public"):
-                # rresearch(보고서)는 public_result에 없으므로 public 단계 건너뜀
-                if collection == "rresearch" and level == "public":
-                    continue
-                r = await self.client.search(
-                    (query, collection, level), "OUTCOME", max_results)
-                if not r.get("error") and r.get("success") and r.get("results"):
-                    result = r
-                    break
-                result = r
+            key = make_cache_key("ntis", "OUTCOME", (query, collection), max_results=max_results)
+            result = await cached_fetch(
+                key, "OUTCOME", lambda: self._search_outcome_tiers(query, collection, max_results))
 
             if result.get("error"):
-                return f"🚨 NTIS API 오류: {result.get('error_message', '알 수 없는 오류')}"
+                return f"🚨 NTIS API 오류: {result.get('error_message') or result.get('message', '알 수 없는 오류')}"
             if result.get("success") and result.get("results"):
                 records = result["results"]
                 total_count = result.get("total_count", 0)
-                return self.formatter.format_search_results(
+                return self.formatter.stale_notice(result) + self.formatter.format_search_results(
                     records[:max_results], query, total_count, "outcome")
             return f"'{query}'에 대한 국가R&D 성과검색 결과가 없습니다."
         except Exception as e:
             logger.error(f"NTIS 성과검색 중 오류: {str(e)}")
             return f"NTIS 성과검색 중 오류가 발생했습니다: {str(e)}"
 
+    async def _search_outcome_tiers(self, query: str, collection: str,
+                                    max_results: int) -> Dict[str, Any]:
+        """전문기관용 → 기관용 → 전체용 우선순위로 성과검색 시도"""
+        # rresearch(보고서)는 public_result에 없으므로 public 단계 제외
+        levels = ("all", "org") if collection == "rresearch" else ("all", "org", "public")
+        return await self._first_rich_tier(
+            f"OUTCOME:{collection}",
+            [(level, "OUTCOME", (query, collection, level)) for level in levels], max_results)
+
     async def search_research_reports(self, query: str, max_results: int = 10) -> str:
         """국가R&D 연구보고서 검색"""
         return await self._ntis_search(
@@ -3807,6 +6118,21 @@ class NTISSearchService:
             pjt_id, "COMMISSION", "commission", pjt_id, 100,
             empty_msg=f"과제번호 '{pjt_id}'에 대한 위탁/공동연구 정보가 없습니다.")
 
+    async def search_commission_projects_batch(self, pjt_ids: List[str]) -> str:
+        """과제고유번호 목록 위탁/공동연구 정보 일괄조회 (응답 캐시 재사용, 동시 조회 수 제한)"""
+        async def fetch_one(pjt_id: str):
+            key = make_cache_key("ntis", "COMMISSION", pjt_id, max_results=100)
+            result = await cached_fetch(
+                key, "COMMISSION", lambda: self.client.search(pjt_id, "COMMISSION", 100))
+            if result.get("error"):
+                return "error", result.get("message", "알 수 없는 오류")
+            if not (result.get("success") and result.get("results")):
+                return "empty", f"과제번호 '{pjt_id}'에 대한 위탁/공동연구 정보가 없습니다."
+            return "ok", self.formatter.stale_notice(result) + self.formatter.format_search_results(
+                result["results"], pjt_id, result.get("total_count", 0), "commission")
+
+        return await run_detail_batch("NTIS 위탁/공동연구", pjt_ids, fetch_one)
+
     async def search_participation(self, person_name: str, researcher_no: str) -> str:
         """과제참여정보 조회 (참여연구원 성명+국가연구자번호)"""
         if not person_name or not researcher_no:
@@ -3860,14 +6186,16 @@ class DataONSearchService:
             if not await self.client.get_token():
                 return "🚨 DataON API 연결에 실패했습니다."
 
-            result = await self.client.search(
+            key = make_cache_key("dataon", "RESEARCH_DATA", query,
+                                 paging=(from_pos, sort_con, sort_arr), max_results=max_results)
+            result = await cached_fetch(key, "RESEARCH_DATA", lambda: self.client.search(
                 query=query,
                 target="RESEARCH_DATA",
                 max_results=max_results,
                 from_pos=from_pos,
                 sort_con=sort_con,
                 sort_arr=sort_arr
-            )
+            ))
 
             if result.get("error"):
                 return f"🚨 DataON API 오류: {result.get('message', '알 수 없는 오류')}"
@@ -3875,7 +6203,7 @@ class DataONSearchService:
             if result.get("success") and result.get("results"):
                 research_data_list = result["results"]
                 total_count = result.get("total_count", 0)
-                return self.formatter.format_search_results(research_data_list, query, total_count, "research_data")
+                return self.formatter.stale_notice(result) + self.formatter.format_search_results(research_data_list, query, total_count, "research_data")
             else:
                 return f"'{query}'에 대한 연구데이터 검색 결과가 없습니다."
 
@@ -3894,14 +6222,15 @@ class DataONSearchService:
             if not await self.client.get_token():
                 return "🚨 DataON API 연결에 실패했습니다."
 
-            result = await self.client.get_details(svc_id)
+            result = await cached_detail("dataon", "DATAON_DETAIL", svc_id,
+                                         lambda: self.client.get_details(svc_id))
 
             if result.get("error"):
                 return f"🚨 DataON API 오류: {result.get('message', '알 수 없는 오류')}"
 
             if result.get("success") and result.get("result"):
                 detail_info = result["result"]
-                return self.formatter.format_detail_result(detail_info, svc_id)
+                return self.formatter.stale_notice(result) + self.formatter.format_detail_result(detail_info, svc_id)
             else:
                 return f"svcId '{svc_id}'에 대한 상세 정보를 찾을 수 없습니다."
 
@@ -3909,6 +6238,92 @@ class DataONSearchService:
             logger.error(f"DataON 연구데이터 상세조회 중 오류: {str(e)}")
             return f"연구데이터 상세조회 중 오류가 발생했습니다: {str(e)}"
 
+    async def get_research_data_details_batch(self, svc_ids: List[str]) -> str:
+        """svcId 목록 일괄 상세조회 (상세 캐시 재사용, 동시 조회 수 제한)"""
+        if not await self.client.get_token():
+            return "🚨 DataON API 연결에 실패했습니다."
+
+        async def fetch_one(svc_id: str):
+            result = await cached_detail("dataon", "DATAON_DETAIL", svc_id,
+                                         lambda: self.client.get_details(svc_id))
+            if result.get("error"):
+                return "error", result.get("message", "알 수 없는 오류")
+            if not (result.get("success") and result.get("result")):
+                return "empty", f"svcId '{svc_id}'에 대한 상세 정보를 찾을 수 없습니다."
+            return "ok", self.formatter.stale_notice(result) + self.formatter.format_detail_result(
+                result["result"], svc_id)
+
+        return await run_detail_batch("DataON 연구데이터", svc_ids, fetch_one)
+
+
+class FederatedSearchService:
+    """ScienceON·NTIS·DataON 통합 검색 (동시 요청, 전체 마감시간)"""
+
+    def __init__(self, scienceon: Optional[SearchService], ntis: Optional[NTISSearchService],
+                 dataon: Optional[DataONSearchService]):
+        self.scienceon = scienceon
+        self.ntis = ntis
+        self.dataon = dataon
+
+    def _sources(self, query: str, max_results: int, include_body: bool) -> List[tuple]:
+        """(섹션 제목, 코루틴 팩토리) 목록 - 인증 정보가 없는 플랫폼은 None"""
+        return [
+            ("ScienceON 논문",
+             (lambda: self.scienceon.search_papers(query, max_results, include_body))
+             if self.scienceon else None),
+            ("NTIS 국가R&D 성과(논문)",
+             (lambda: self.ntis.search_outcomes(query, "paper", max_results))
+             if self.ntis else None),
+            ("DataON 연구데이터",
+             (lambda: self.dataon.search_research_data(query, max_results))
+             if self.dataon else None),
+        ]
+
+    async def search(self, query: str, max_results: int = 5, include_body: bool = False,
+                     deadline: float = 15.0) -> str:
+        """모든 플랫폼에 동시에 검색하고 deadline(초) 안에 도착한 결과만 모아 반환"""
+        started = time.perf_counter()
+        elapsed: Dict[str, float] = {}
+
+        async def timed(title: str, factory) -> str:
+            try:
+                return await factory()
+            finally:
+                elapsed[title] = time.perf_counter() - started
+
+        sources = self._sources(query, max_results, include_body)
+        tasks = {title: asyncio.ensure_future(timed(title, factory))
+                 for title, factory in sources if factory}
+        pending = set()
+        if tasks:
+            _, pending = await asyncio.wait(tasks.values(), timeout=deadline)
+            for task in pending:
+                task.cancel()
+
+        sections = []
+        timing = []
+        for title, factory in sources:
+            task = tasks.get(title)
+            if task is None:
+                body = "🚨 인증 정보가 설정되지 않아 검색하지 않았습니다."
+                timing.append(f"{title}: 건너뜀")
+            elif task in pending:
+                body = f"⏱️ 마감시간({deadline:g}초) 안에 응답이 오지 않았습니다."
+                timing.append(f"{title}: 시간 초과")
+            elif task.exception() is not None:
+                body = f"🚨 검색 중 오류가 발생했습니다: {str(task.exception())}"
+                timing.append(f"{title}: 오류 ({elapsed[title]:.2f}초)")
+            else:
+                body = task.result()
+                timing.append(f"{title}: {elapsed[title]:.2f}초")
+            sections.append(f"# {title}\n{body}")
+
+        total = time.perf_counter() - started
+        header = (f"**'{query}' KISTI 통합 검색** (총 {total:.2f}초)\n"
+                  + "\n".join(f"  - {t}" for t in timing))
+        return header + "\n\n" + "\n\n".join(sections)
+
+
 # 전역 서비스 인스턴스
 try:
     scienceon_client = ScienceONClient()
@@ -3935,6 +6350,10 @@ except Exception as e:
     logger.error(f"DataON 서비스 초기화 실패: {str(e)}")
     dataon_search_service = None
 
+# 통합 검색 서비스 (사용 가능한 플랫폼만 대상)
+federated_search_service = FederatedSearchService(search_service, ntis_search_service,
+                                                  dataon_search_service)
+
 # MCP 함수들
 @mcp.tool()
 async def search_scienceon_papers(
@@ -4092,6 +6511,29 @@ async def search_scienceon_report_details(
 
     return await search_service.get_report_details(cn, include_body)
 
+@mcp.tool()
+async def search_scienceon_details_batch(
+    cns: List[str],
+    content_type: str = "paper",
+    include_body: bool = False
+) -> str:
+    """
+    KISTI ScienceON에서 여러 CN번호의 상세 정보를 한 번에 조회합니다.
+    검색 결과 상위 여러 건의 상세정보가 필요할 때 상세보기 도구를 반복 호출하는 대신 사용하세요.
+
+    Args:
+        cns: CN번호 목록 (최대 50개, 논문/특허/보고서 검색 결과에서 얻은 CN)
+        content_type: 유형 - "paper"(논문, 기본), "patent"(특허), "report"(보고서)
+        include_body: 초록 등 긴 본문 포함 여부 (기본값: False)
+
+    Returns:
+        CN별 조회 상태(성공/결과 없음/실패)와 상세 정보
+    """
+    if search_service is None:
+        return _SCIENCEON_CRED_MSG
+
+    return await search_service.get_details_batch(cns, content_type, include_body)
+
 _SCIENCEON_CRED_MSG = ("🚨 API 인증 정보가 설정되지 않았습니다.\n"
                        "MCP 클라이언트 설정(JSON)의 env 항목에 필요한 환경변수를 추가해주세요.\n"
                        "필요한 변수: SCIENCEON_API_KEY, SCIENCEON_CLIENT_ID, SCIENCEON_MAC_ADDRESS")
@@ -4520,6 +6962,21 @@ async def search_ntis_commission_projects(pjt_id: str) -> str:
         return _NTIS_CRED_MSG
     return await ntis_search_service.search_commission_projects(pjt_id)
 
+@mcp.tool()
+async def search_ntis_commission_projects_batch(pjt_ids: List[str]) -> str:
+    """
+    NTIS에서 여러 국가R&D 과제의 위탁/공동연구 과제 정보를 한 번에 조회합니다.
+
+    Args:
+        pjt_ids: 주관과제 고유번호 목록 (최대 50개)
+
+    Returns:
+        과제번호별 조회 상태(성공/결과 없음/실패)와 위탁/공동연구 과제 정보
+    """
+    if ntis_search_service is None:
+        return _NTIS_CRED_MSG
+    return await ntis_search_service.search_commission_projects_batch(pjt_ids)
+
 @mcp.tool()
 async def search_ntis_participation(person_name: str, researcher_no: str) -> str:
     """
@@ -4581,6 +7038,10 @@ async def search_ntis_researcher_info(
         return _NTIS_CRED_MSG
     return await ntis_search_service.search_researcher_info(name, researcher_no, birth_date)
 
+_DATAON_CRED_MSG = ("🚨 DataON API 인증 정보가 설정되지 않았습니다.\n"
+                    "MCP 클라이언트 설정(JSON)의 env 항목에 필요한 환경변수를 추가해주세요.\n"
+                    "필요한 변수: DataON_ResearchData_API_KEY, DataON_ResearchDataMetadata_API_KEY")
+
 @mcp.tool()
 async def search_dataon_research_data(
     query: str,
@@ -4608,9 +7069,7 @@ async def search_dataon_research_data(
         - search_dataon_research_data("기후변화", 20, 0, "date", "desc")
     """
     if dataon_search_service is None:
-        return ("🚨 DataON API 인증 정보가 설정되지 않았습니다.\n"
-               "MCP 클라이언트 설정(JSON)의 env 항목에 필요한 환경변수를 추가해주세요.\n"
-               "필요한 변수: DataON_ResearchData_API_KEY, DataON_ResearchDataMetadata_API_KEY")
+        return _DATAON_CRED_MSG
 
     return await dataon_search_service.search_research_data(query, max_results, from_pos, sort_con, sort_arr)
 
@@ -4637,12 +7096,97 @@ async def search_dataon_research_data_details(
         - search_dataon_research_data_details("KISTI-OAK-1234567890")
     """
     if dataon_search_service is None:
-        return ("🚨 DataON API 인증 정보가 설정되지 않았습니다.\n"
-               "MCP 클라이언트 설정(JSON)의 env 항목에 필요한 환경변수를 추가해주세요.\n"
-               "필요한 변수: DataON_ResearchData_API_KEY, DataON_ResearchDataMetadata_API_KEY")
+        return _DATAON_CRED_MSG
 
     return await dataon_search_service.get_research_data_details(svc_id)
 
+@mcp.tool()
+async def search_dataon_research_data_details_batch(
+    svc_ids: List[str]
+) -> str:
+    """
+    KISTI DataON에서 여러 연구데이터(svcId)의 상세 정보를 한 번에 조회합니다.
+    ⚠️ 참고: DataON OpenAPI는 2026년 3월부터 기관사용자만 신규 신청/이용기간 연장이 가능합니다. 기존 발급 키는 승인된 이용 기간 내에서 정상 동작합니다.
+
+    Args:
+        svc_ids: 연구데이터 고유 식별번호 목록 (최대 50개, 검색 결과에서 얻은 svcId)
+
+    Returns:
+        svcId별 조회 상태(성공/결과 없음/실패)와 상세 메타데이터
+    """
+    if dataon_search_service is None:
+        return _DATAON_CRED_MSG
+
+    return await dataon_search_service.get_research_data_details_batch(svc_ids)
+
+# 통합 검색 도구
+@mcp.tool()
+async def search_kisti_federated(
+    query: str,
+    max_results: int = 5,
+    include_body: bool = False,
+    deadline_seconds: float = 0
+) -> str:
+    """
+    하나의 키워드로 ScienceON 논문, NTIS 국가R&D 성과(논문), DataON 연구데이터를 동시에 검색합니다.
+    세 도구를 차례로 호출하는 대신 한 번에 주제 전반을 훑을 때 사용합니다.
+    마감시간 안에 도착한 플랫폼 결과만 반환하며, 플랫폼별 소요 시간을 함께 표시합니다.
+
+    Args:
+        query: 검색할 키워드
+        max_results: 플랫폼별 최대 결과 수 (기본값: 5)
+        include_body: 초록 등 긴 본문 포함 여부 (기본값: False)
+        deadline_seconds: 전체 마감시간(초). 0이면 KISTI_FEDERATED_DEADLINE (기본 15초)
+
+    Returns:
+        플랫폼별 소요 시간 요약과 플랫폼별 검색 결과 섹션
+    """
+    deadline = deadline_seconds if deadline_seconds > 0 else get_env_float("KISTI_FEDERATED_DEADLINE", 15.0)
+    return await federated_search_service.search(query, max_results, include_body, deadline)
+
+# 진단 도구
+def _format_stats(title: str, stats: Dict[str, Any]) -> str:
+    lines = [f"## {title}"]
+    for k, v in stats.items():
+        lines.append(f"  - {k}: {v}")
+    return "\n".join(lines)
+
+@mcp.tool()
+async def get_kisti_mcp_diagnostics() -> str:
+    """
+    KISTI-MCP 서버 내부 상태(캐시 적중률, 회로 차단기 상태, 재시도·인증 백오프 등)를 조회합니다. 운영·튜닝용 진단 도구입니다.
+
+    Returns:
+        응답/상세 캐시 카운터, 엔드포인트별 회로 차단기 상태, 재시도 예산, 토큰·인증 백오프, 요청 병합 수 등
+    """
+    sections = [_format_stats("응답 캐시", response_cache.stats()),
+                _format_stats("상세 캐시", await detail_store.stats())]
+    sections.append(_format_stats("재시도 예산", retry_budget.stats()))
+    sections.append(_format_stats("헤지 요청", {**BaseAPIClient._hedge_stats,
+                                               "budget_available": hedge_budget.stats()["available"],
+                                               "budget_denied": hedge_budget.stats()["denied"]}))
+    limiters = {l.label: l.describe() for l in BaseAPIClient._rate_limiters.values()}
+    sections.append(_format_stats("호출 속도/일일 한도", limiters or {"-": "아직 호출 없음"}))
+    breakers = {b.name: b.describe() for b in BaseAPIClient._breakers.values()}
+    sections.append(_format_stats("회로 차단기", breakers or {"-": "아직 호출 없음"}))
+    if search_service is not None:
+        sections.append(_format_stats("ScienceON 토큰", search_service.client._tokens.stats()))
+    if ntis_search_service is not None:
+        sections.append(_format_stats("NTIS 권한 단계 학습", ntis_search_service.tier_memo.stats()))
+    for service in (search_service, ntis_search_service, dataon_search_service):
+        if service is not None:
+            sections.append(_format_stats(f"동시 호출 격벽 ({service.client.PLATFORM})",
+                                          service.client._bulkhead.stats()))
+            sections.append(_format_stats(f"응답 시간/타임아웃 ({service.client.PLATFORM})",
+                                          service.client.describe_timeouts()
+                                          or {"-": "아직 호출 없음"}))
+            sections.append(_format_stats(f"요청 병합 ({service.client.PLATFORM})",
+                                          service.client._inflight.stats()))
+            if service.client.AUTH_FAIL_FAST:
+                sections.append(_format_stats(f"인증 실패 백오프 ({service.client.PLATFORM})",
+                                              service.client._auth_backoff.stats()))
+    return "**KISTI-MCP 진단 정보**\n\n" + "\n\n".join(sections)
+
 def main():
     """메인 엔트리포인트"""
     active_services = []
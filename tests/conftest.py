@@ -0,0 +1,74 @@
+"""
+테스트 공통 설정: kisti_mcp 임포트 전에 캐시 디렉터리를 격리하고 더미 자격증명을 넣는다
+(모듈 수준 클라이언트가 생성되도록, 실제 API는 호출하지 않음)
+
+    uv run --with pytest pytest
+"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+os.environ["KISTI_MCP_CACHE_DIR"] = tempfile.mkdtemp(prefix="kisti-mcp-test-")
+os.environ.setdefault("KISTI_DETAIL_CACHE", "off")
+for key, value in {
+    "SCIENCEON_API_KEY": "0123456789abcdef",
+    "SCIENCEON_CLIENT_ID": "test",
+    "SCIENCEON_MAC_ADDRESS": "00-00-00-00-00-00",
+    "NTIS_API_KEY": "test",
+    "DataON_ResearchData_API_KEY": "test",
+    "DataON_ResearchDataMetadata_API_KEY": "test",
+}.items():
+    os.environ.setdefault(key, value)
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+import asyncio  # noqa: E402
+
+import httpx  # noqa: E402
+import pytest  # noqa: E402
+
+import kisti_mcp  # noqa: E402
+
+
+@pytest.fixture
+def upstream(monkeypatch, tmp_path):
+    """업스트림 HTTP를 handler(request) -> httpx.Response로 대신하고 호출 상태를 테스트마다 초기화
+
+    속도 제한·일일 한도 환경변수는 install() 전에 monkeypatch.setenv로 지정한다
+    (제한기는 첫 호출 때 환경변수로 만들어짐).
+    """
+    monkeypatch.setattr(kisti_mcp, "response_cache", kisti_mcp.ResponseCache())
+    monkeypatch.setattr(kisti_mcp, "quota_ledger", kisti_mcp.QuotaLedger(None))
+    monkeypatch.setattr(kisti_mcp.BaseAPIClient, "_rate_limiters", {})
+    monkeypatch.setattr(kisti_mcp.BaseAPIClient, "_breakers", {})
+    monkeypatch.setattr(kisti_mcp.BaseAPIClient, "_http_pools", {})
+    clients = [kisti_mcp.scienceon_client, kisti_mcp.ntis_client, kisti_mcp.dataon_client]
+    for client in clients:
+        monkeypatch.setattr(client, "_auth_backoff", kisti_mcp.FailureBackoff.from_env())
+    monkeypatch.setattr(kisti_mcp.ntis_search_service, "tier_memo",
+                        kisti_mcp.TierMemo(None, kisti_mcp.ntis_client.api_key))
+    calls = []
+
+    def install(handler):
+        def record(request):
+            calls.append(request)
+            return handler(request)
+        for client in clients:
+            kisti_mcp.BaseAPIClient._http_pools[client.base_url] = httpx.AsyncClient(
+                transport=httpx.MockTransport(record))
+        return calls
+
+    return install
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def expire_responses():
+    """응답 캐시 항목을 모두 만료시킴 (stale_ttl 안이라 만료된 캐시로는 남음)"""
+    cache = kisti_mcp.response_cache
+    for key, (_, size, value, stored_at) in list(cache._entries.items()):
+        cache._entries[key] = (0.0, size, value, stored_at)
@@ -0,0 +1,45 @@
+"""
+격벽(Bulkhead)이 거부한 요청은 일일 호출량·속도 제한 토큰을 쓰지 않는지 확인
+"""
+import asyncio
+import json
+
+import httpx
+
+from conftest import run
+
+import kisti_mcp
+
+DATAON_EMPTY = json.dumps({"response": {"total count": 0}, "records": []}).encode()
+
+
+def test_shed_request_refunds_quota(upstream, monkeypatch):
+    monkeypatch.setenv("DATAON_RATE_PER_SEC", "0.001")
+    monkeypatch.setenv("DATAON_RATE_BURST", "2")
+    client = kisti_mcp.dataon_client
+    monkeypatch.setattr(client, "_bulkhead", kisti_mcp.Bulkhead("DATAON", max_inflight=1, max_queue=0))
+
+    async def scenario():
+        release = asyncio.Event()
+
+        async def handler(request):
+            await release.wait()
+            return httpx.Response(200, content=DATAON_EMPTY)
+
+        calls = upstream(handler)
+        first = asyncio.ensure_future(client.search("기후변화"))
+        while not calls:
+            await asyncio.sleep(0)
+        shed = await client.search("해양")
+        release.set()
+        await first
+        return calls, shed
+
+    calls, shed = run(scenario())
+    limiter = next(iter(kisti_mcp.BaseAPIClient._rate_limiters.values()))
+
+    assert len(calls) == 1
+    assert "동시 요청이 너무 많습니다" in shed["message"]
+    assert client._bulkhead.rejected == 1
+    assert limiter.ledger.used(limiter.key) == 1
+    assert limiter._tokens > 0.99  # 거부된 요청의 토큰은 반환됨 (버스트 2 중 1개만 사용)
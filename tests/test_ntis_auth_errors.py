@@ -0,0 +1,49 @@
+"""
+NTIS 인증 오류 응답이 사용자에게 사유와 함께 전달되는지 확인
+
+NTIS는 인증키/허용 IP 오류를 HTTP 200 본문(resMsg)으로 돌려준다. 인증 실패 백오프 중에는
+호출 없이 AuthBackoffError가 나므로, 그 사유도 화면에 그대로 보여야 한다.
+"""
+import httpx
+
+from conftest import run
+
+import kisti_mcp
+
+AUTH_ERROR_BODY = ('<?xml version="1.0" encoding="UTF-8"?><RESULT><resCode>E001</resCode>'
+                   '<resMsg>유효한 인증키가 아닙니다</resMsg></RESULT>').encode()
+
+
+def test_backoff_reason_is_shown(upstream):
+    calls = upstream(lambda request: httpx.Response(200, content=AUTH_ERROR_BODY))
+    service = kisti_mcp.ntis_search_service
+
+    run(service.search_projects("인공지능", 3))
+    called = len(calls)
+    projects = run(service.search_projects("인공지능", 3))
+
+    assert len(calls) == called  # 백오프 중이라 호출하지 않음
+    assert "인증 오류로 호출을 건너뜁니다: 유효한 인증키가 아닙니다" in projects
+    assert "알 수 없는 오류" not in projects
+
+
+def test_auth_error_body_is_not_cached_as_empty_result(upstream):
+    upstream(lambda request: httpx.Response(200, content=AUTH_ERROR_BODY))
+    service = kisti_mcp.ntis_search_service
+
+    batch = run(service.search_commission_projects_batch(["1711000001"]))
+    outcomes = run(service.search_outcomes("인공지능", 3))
+
+    assert "유효한 인증키가 아닙니다" in batch
+    assert "유효한 인증키가 아닙니다" in outcomes
+    assert not kisti_mcp.response_cache._entries
+
+
+def test_resultset_error_body_is_an_error():
+    client = kisti_mcp.ntis_client
+    error = client._parse_xml_response(
+        '<RESULT><resCode>E999</resCode><resMsg>요청 변수 오류</resMsg></RESULT>'.encode(), "OUTCOME")
+    empty = client._parse_xml_response(b"<RESULT><TOTALHITS>0</TOTALHITS><RESULTSET/></RESULT>", "OUTCOME")
+
+    assert error == {"error": True, "message": "요청 변수 오류"}
+    assert empty == {"success": True, "total_count": 0, "results": []}
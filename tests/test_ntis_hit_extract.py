@@ -0,0 +1,303 @@
+"""
+NTIS 과제 HIT 추출 동등성 테스트
+
+ElementPathTable로 한 번에 꺼내는 NTISClient._parse_project_hit가
+필드마다 hit.find()를 부르던 이전 구현과 같은 dict(키 순서 포함)를 만드는지
+무작위 HIT로 비교한다. 이전 구현은 아래 reference_parse_project_hit에 그대로 보존한다.
+"""
+import random
+import re
+import xml.etree.ElementTree as ET
+
+import pytest
+
+import kisti_mcp
+
+FIELDS = ["ProjectNumber", "ProjectYear", "GovernmentFunds", "TotalFunds"]
+NESTED = {
+    "ProjectTitle": ["Korean", "English"],
+    "Manager": ["Name"],
+    "Researchers": ["Name", "ManCount", "WomanCount"],
+    "ResearchAgency": ["Name"],
+    "OrderAgency": ["Name"],
+    "BudgetProject": ["Name"],
+    "Ministry": ["Name"],
+    "ProjectPeriod": ["Start", "End", "TotalStart", "TotalEnd"],
+    "Goal": ["Full", "Teaser"],
+    "Abstract": ["Full", "Teaser"],
+    "Effect": ["Full", "Teaser"],
+    "Keyword": ["Korean", "English"],
+}
+
+
+def reference_parse_project_hit(hit) -> dict:
+    """ElementPathTable 도입 전 NTISClient._parse_project_hit (필드마다 hit.find)"""
+    # PDF 매뉴얼 page 8-9 구조에 맞게 전체 XML 구조를 그대로 파싱
+    result = {}
+
+    # 기본 정보
+    project_number = hit.find('ProjectNumber')
+    if project_number is not None:
+        result['ProjectNumber'] = project_number.text
+
+    # 과제명 (한국어/영어)
+    project_title_korean = hit.find('.//ProjectTitle/Korean')
+    project_title_english = hit.find('.//ProjectTitle/English')
+    project_title = {}
+    if project_title_korean is not None:
+        project_title['Korean'] = project_title_korean.text or ""
+    if project_title_english is not None:
+        project_title['English'] = project_title_english.text or ""
+    if project_title:
+        result['ProjectTitle'] = project_title
+
+    # 연구책임자
+    manager_name = hit.find('.//Manager/Name')
+    if manager_name is not None:
+        result['Manager'] = {'Name': manager_name.text or ""}
+
+    # 참여연구원
+    researchers_name = hit.find('.//Researchers/Name')
+    man_count = hit.find('.//Researchers/ManCount')
+    woman_count = hit.find('.//Researchers/WomanCount')
+    researchers = {}
+    if researchers_name is not None:
+        researchers['Name'] = researchers_name.text or ""
+    if man_count is not None:
+        researchers['ManCount'] = man_count.text or ""
+    if woman_count is not None:
+        researchers['WomanCount'] = woman_count.text or ""
+    if researchers:
+        result['Researchers'] = researchers
+
+    # 연구기관
+    research_agency_name = hit.find('.//ResearchAgency/Name')
+    if research_agency_name is not None:
+        result['ResearchAgency'] = {'Name': research_agency_name.text or ""}
+
+    order_agency_name = hit.find('.//OrderAgency/Name')
+    if order_agency_name is not None:
+        result['OrderAgency'] = {'Name': order_agency_name.text or ""}
+
+    # 예산 사업
+    budget_project_name = hit.find('.//BudgetProject/Name')
+    if budget_project_name is not None:
+        result['BudgetProject'] = {'Name': budget_project_name.text or ""}
+
+    # 부처
+    ministry_name = hit.find('.//Ministry/Name')
+    if ministry_name is not None:
+        result['Ministry'] = {'Name': ministry_name.text or ""}
+
+    # 과제 연도
+    project_year = hit.find('ProjectYear')
+    if project_year is not None:
+        result['ProjectYear'] = project_year.text or ""
+
+    # 과제 기간
+    period_start = hit.find('.//ProjectPeriod/Start')
+    period_end = hit.find('.//ProjectPeriod/End')
+    total_start = hit.find('.//ProjectPeriod/TotalStart')
+    total_end = hit.find('.//ProjectPeriod/TotalEnd')
+    period = {}
+    if period_start is not None:
+        period['Start'] = period_start.text or ""
+    if period_end is not None:
+        period['End'] = period_end.text or ""
+    if total_start is not None:
+        period['TotalStart'] = total_start.text or ""
+    if total_end is not None:
+        period['TotalEnd'] = total_end.text or ""
+    if period:
+        result['ProjectPeriod'] = period
+
+    # 예산 정보
+    gov_funds = hit.find('GovernmentFunds')
+    if gov_funds is not None:
+        result['GovernmentFunds'] = gov_funds.text or ""
+
+    total_funds = hit.find('TotalFunds')
+    if total_funds is not None:
+        result['TotalFunds'] = total_funds.text or ""
+
+    # 연구 목표/내용/효과 (핵심!)
+    goal_full = hit.find('.//Goal/Full')
+    goal_teaser = hit.find('.//Goal/Teaser')
+    goal = {}
+    if goal_full is not None:
+        goal['Full'] = goal_full.text or ""
+    if goal_teaser is not None:
+        goal['Teaser'] = goal_teaser.text or ""
+    if goal:
+        result['Goal'] = goal
+
+    abstract_full = hit.find('.//Abstract/Full')
+    abstract_teaser = hit.find('.//Abstract/Teaser')
+    abstract = {}
+    if abstract_full is not None:
+        abstract['Full'] = abstract_full.text or ""
+    if abstract_teaser is not None:
+        abstract['Teaser'] = abstract_teaser.text or ""
+    if abstract:
+        result['Abstract'] = abstract
+
+    effect_full = hit.find('.//Effect/Full')
+    effect_teaser = hit.find('.//Effect/Teaser')
+    effect = {}
+    if effect_full is not None:
+        effect['Full'] = effect_full.text or ""
+    if effect_teaser is not None:
+        effect['Teaser'] = effect_teaser.text or ""
+    if effect:
+        result['Effect'] = effect
+
+    # 키워드
+    keyword_korean = hit.find('.//Keyword/Korean')
+    keyword_english = hit.find('.//Keyword/English')
+    keyword = {}
+    if keyword_korean is not None:
+        keyword['Korean'] = keyword_korean.text or ""
+    if keyword_english is not None:
+        keyword['English'] = keyword_english.text or ""
+    if keyword:
+        result['Keyword'] = keyword
+
+    # 하위 호환성을 위한 기존 필드명들
+    if 'ProjectNumber' in result:
+        result['pjtNo'] = result['ProjectNumber']
+        result['pjtId'] = result['ProjectNumber']  # 연관콘텐츠 검색용 pjtId 추가
+    if 'ProjectTitle' in result and 'Korean' in result['ProjectTitle']:
+        result['pjtName'] = result['ProjectTitle']['Korean']
+        result['title'] = result['ProjectTitle']['Korean']  # 연관콘텐츠 검색용 title 추가
+    if 'Manager' in result and 'Name' in result['Manager']:
+        result['researchManager'] = result['Manager']['Name']
+    if 'ResearchAgency' in result and 'Name' in result['ResearchAgency']:
+        result['instName'] = result['ResearchAgency']['Name']
+    if 'ProjectPeriod' in result:
+        if 'Start' in result['ProjectPeriod'] and 'End' in result['ProjectPeriod']:
+            start_date = result['ProjectPeriod']['Start']
+            end_date = result['ProjectPeriod']['End']
+            start_year = start_date[:4] if start_date and len(start_date) >= 4 else ""
+            end_year = end_date[:4] if end_date and len(end_date) >= 4 else ""
+            if start_year and end_year:
+                result['pjtPeriod'] = f"{start_year}~{end_year}"
+
+    # 연구분야
+    science_class = hit.find('.//ScienceClass[@type="new"][@sequence="1"]/Large')
+    if science_class is not None:
+        result['researchArea'] = science_class.text
+
+    # 총 연구비
+    total_funds = hit.find('TotalFunds')
+    if total_funds is not None and total_funds.text:
+        try:
+            funds_amount = int(total_funds.text)
+            result['totalExpense'] = f"{funds_amount:,}원"
+        except ValueError:
+            result['totalExpense'] = total_funds.text
+
+    # 정부지원금
+    govt_funds = hit.find('GovernmentFunds')
+    if govt_funds is not None and govt_funds.text:
+        try:
+            govt_amount = int(govt_funds.text)
+            result['govtExpense'] = f"{govt_amount:,}원"
+        except ValueError:
+            result['govtExpense'] = govt_funds.text
+
+    # 과제요약 (목표)
+    goal = hit.find('.//Goal/Full')
+    if goal is not None:
+        clean_goal = re.sub(r'<[^>]+>', '', goal.text) if goal.text else ""
+        result['abstract'] = clean_goal[:500] + "..." if len(clean_goal) > 500 else clean_goal
+
+    # 키워드
+    keyword = hit.find('.//Keyword/Korean')
+    if keyword is not None:
+        clean_keyword = re.sub(r'<[^>]+>', '', keyword.text) if keyword.text else ""
+        result['keyword'] = clean_keyword
+    return result
+
+
+def random_text(rng: random.Random):
+    return rng.choice([None, "", "123", "2021", "20210101", "12a", "<b>굵게</b> 본문",
+                       "가나다" * rng.randint(1, 200)])
+
+
+def add_child(rng: random.Random, parent, tag: str):
+    elem = ET.SubElement(parent, tag)
+    text = random_text(rng)
+    if text is not None:
+        elem.text = text
+    return elem
+
+
+def random_hit(rng: random.Random):
+    """필드 누락·중복·순서 뒤섞임·같은 태그의 깊은 중첩을 섞은 HIT"""
+    hit = ET.Element("HIT")
+    tags = FIELDS + list(NESTED) + ["ScienceClass"] * 3 + ["Extra"]
+    rng.shuffle(tags)
+    for tag in tags:
+        if rng.random() < 0.2:
+            continue
+        if tag in FIELDS:
+            add_child(rng, hit, tag)
+            if rng.random() < 0.1:
+                add_child(rng, hit, tag)
+        elif tag == "ScienceClass":
+            science_class = ET.SubElement(hit, "ScienceClass", type=rng.choice(["new", "old"]),
+                                          sequence=rng.choice(["1", "2"]))
+            if rng.random() < 0.8:
+                add_child(rng, science_class, "Large")
+        elif tag == "Extra":
+            # 하위 요소 안의 같은 이름 태그: './/' 경로는 잡고 직계 자식 경로는 무시해야 함
+            extra = ET.SubElement(hit, "Extra")
+            wrapper = ET.SubElement(extra, rng.choice(list(NESTED)))
+            for child in NESTED[wrapper.tag]:
+                add_child(rng, wrapper, child)
+            add_child(rng, extra, "ProjectNumber")
+        else:
+            nested = ET.SubElement(hit, tag)
+            for child in NESTED[tag]:
+                if rng.random() < 0.85:
+                    add_child(rng, nested, child)
+    return hit
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_parse_project_hit_matches_find_reference(seed):
+    rng = random.Random(seed)
+    for _ in range(1000):
+        hit = random_hit(rng)
+        expected = reference_parse_project_hit(hit)
+        actual = kisti_mcp.ntis_client._parse_project_hit(hit)
+        assert actual == expected, ET.tostring(hit, encoding="unicode")
+        assert list(actual) == list(expected)
+
+
+def test_path_table_matches_find():
+    paths = kisti_mcp.NTISClient._PROJECT_HIT_PATHS.paths
+    rng = random.Random(100)
+    for _ in range(1000):
+        hit = random_hit(rng)
+        found = kisti_mcp.NTISClient._PROJECT_HIT_PATHS.find_all(hit)
+        for path in paths:
+            assert found.get(path) is hit.find(path), path
+
+
+def test_parse_project_hit_from_response():
+    body = ("<RESULT><TOTALHITS>1</TOTALHITS><RESULTSET><HIT>"
+            "<ProjectNumber>1711000001</ProjectNumber>"
+            "<ProjectTitle><Korean>과제 &amp; 연구</Korean></ProjectTitle>"
+            "<TotalFunds>1200000</TotalFunds>"
+            '<ScienceClass type="new" sequence="1"><Large>정보/통신</Large></ScienceClass>'
+            "</HIT></RESULTSET></RESULT>").encode()
+    parsed = kisti_mcp.ntis_client._parse_xml_response(body, "PROJECT")
+    hit = ET.fromstring(body).find("RESULTSET/HIT")
+    assert parsed["success"] and parsed["total_count"] == 1
+    assert dict(parsed["results"][0]) == reference_parse_project_hit(hit)
+
+
+def test_unsupported_path_is_rejected():
+    with pytest.raises(ValueError):
+        kisti_mcp.ElementPathTable(["Parent/Child"])
@@ -0,0 +1,28 @@
+"""
+QuotaLedger 종료 시 flush가 진행 중인 비동기 저장과 겹치지 않는지 확인
+"""
+
+from conftest import run
+
+import kisti_mcp
+
+
+def test_flush_waits_for_inflight_writer(tmp_path):
+    path = tmp_path / "quota.sqlite3"
+
+    async def scenario():
+        ledger = kisti_mcp.QuotaLedger(path, flush_interval=0)
+        ledger.add("k", "NTIS")  # flush_interval 0 → 비동기 저장 시작
+        writer = ledger._writer
+        for _ in range(4):
+            ledger.add("k", "NTIS")  # 저장 중 추가분은 _pending에 남음
+        await ledger.flush()
+        return ledger, writer
+
+    ledger, writer = run(scenario())
+
+    assert writer.done()
+    assert ledger._writer.done()
+    assert not ledger._pending and not ledger._flushing
+    assert ledger.used("k") == 5
+    assert kisti_mcp.QuotaLedger(path).used("k") == 5
@@ -0,0 +1,96 @@
+"""
+호출 속도 제한(RateLimitedError)에 걸렸을 때 만료된 캐시로 대신 응답하는지 확인
+
+제한기를 버스트 1, 극히 낮은 속도로 만들어 첫 호출로 캐시를 채운 뒤 캐시를 만료시키면
+두 번째 호출은 제한기에서 막히고, 서비스 계층은 만료된 캐시를 안내와 함께 보여줘야 한다.
+"""
+import json
+import time
+
+import httpx
+import pytest
+
+from conftest import expire_responses, run
+
+import kisti_mcp
+
+
+def dataon_page(records: int) -> bytes:
+    rows = [{"svc_id": f"SVC{i:08d}", "dataset_title_kor": f"합성 연구데이터 {i}"} for i in range(records)]
+    return json.dumps({"response": {"total count": records}, "records": rows}, ensure_ascii=False).encode()
+
+
+def dataon_detail_body(svc_id: str) -> bytes:
+    record = {"svc_id": svc_id, "dataset_title_kor": "합성 연구데이터 상세"}
+    return json.dumps({"response": {}, "records": record}, ensure_ascii=False).encode()
+
+
+def ntis_project_page(hits: int) -> bytes:
+    body = "".join(f"<HIT><ProjectNumber>{1711000000 + i}</ProjectNumber>"
+                   f"<ProjectTitle><Korean>과제 {i}</Korean></ProjectTitle></HIT>" for i in range(hits))
+    return (f'<?xml version="1.0" encoding="UTF-8"?><RESULT><TOTALHITS>{hits}</TOTALHITS>'
+            f'<RESULTSET>{body}</RESULTSET></RESULT>').encode()
+
+
+@pytest.fixture
+def exhausted_after_one(monkeypatch):
+    for platform in ("NTIS", "DATAON", "SCIENCEON"):
+        monkeypatch.setenv(f"{platform}_RATE_PER_SEC", "0.001")
+        monkeypatch.setenv(f"{platform}_RATE_BURST", "1")
+    monkeypatch.setenv("KISTI_RATE_MAX_WAIT", "0.1")
+
+
+def test_dataon_search_serves_stale_when_rate_limited(upstream, exhausted_after_one):
+    calls = upstream(lambda request: httpx.Response(200, content=dataon_page(3)))
+    service = kisti_mcp.dataon_search_service
+
+    fresh = run(service.search_research_data("기후변화", 3))
+    expire_responses()
+    stale = run(service.search_research_data("기후변화", 3))
+
+    assert len(calls) == 1
+    assert "⚠️ 호출 한도" not in fresh
+    assert "⚠️ 호출 한도" in stale
+    assert "합성 연구데이터 0" in stale
+
+
+def test_ntis_projects_serves_stale_when_rate_limited(upstream, exhausted_after_one):
+    calls = upstream(lambda request: httpx.Response(200, content=ntis_project_page(3)))
+    service = kisti_mcp.ntis_search_service
+
+    fresh = run(service.search_projects("인공지능", 3))
+    expire_responses()
+    stale = run(service.search_projects("인공지능", 3))
+
+    assert len(calls) == 1
+    assert "⚠️ 호출 한도" not in fresh
+    assert "⚠️ 호출 한도" in stale
+    assert "과제 0" in stale
+
+
+def test_dataon_details_serves_stale_when_rate_limited(upstream, exhausted_after_one, monkeypatch, tmp_path):
+    store = kisti_mcp.DetailStore(tmp_path / "detail.sqlite3", ttls={"DATAON_DETAIL": 0.05})
+    monkeypatch.setattr(kisti_mcp, "detail_store", store)
+    calls = upstream(lambda request: httpx.Response(200, content=dataon_detail_body("SVC00000001")))
+    service = kisti_mcp.dataon_search_service
+
+    fresh = run(service.get_research_data_details("SVC00000001"))
+    time.sleep(0.1)
+    stale = run(service.get_research_data_details("SVC00000001"))
+    run(store.close())
+
+    assert len(calls) == 1
+    assert "⚠️ 호출 한도" not in fresh
+    assert "⚠️ 호출 한도" in stale
+    assert "합성 연구데이터 상세" in stale
+
+
+def test_rate_limited_without_cache_reports_error(upstream, exhausted_after_one):
+    calls = upstream(lambda request: httpx.Response(200, content=dataon_page(3)))
+    service = kisti_mcp.dataon_search_service
+
+    run(service.search_research_data("기후변화", 3))
+    other = run(service.search_research_data("해양", 3))
+
+    assert len(calls) == 1
+    assert "호출 속도 제한" in other
@@ -0,0 +1,48 @@
+"""
+ScienceON 검색이 응답 캐시 적중 시 토큰을 발급받지 않는지 확인
+"""
+import httpx
+
+from conftest import run
+
+import kisti_mcp
+
+SCIENCEON_PAGE = ('<?xml version="1.0" encoding="UTF-8"?><MetaData><resultSummary>'
+                  '<statusCode>200</statusCode></resultSummary><recordList><TotalCount>1</TotalCount>'
+                  '<record rownum="1"><item metaCode="CN">CN00000001</item>'
+                  '<item metaCode="Title"><![CDATA[합성 논문 제목]]></item></record>'
+                  '</recordList></MetaData>').encode()
+
+
+def test_cache_hit_skips_token(upstream, monkeypatch):
+    calls = upstream(lambda request: httpx.Response(200, content=SCIENCEON_PAGE))
+    issued = []
+
+    async def get_token():
+        issued.append(1)
+        return True
+
+    monkeypatch.setattr(kisti_mcp.scienceon_client, "get_token", get_token)
+    service = kisti_mcp.search_service
+
+    fresh = run(service.search_papers("인공지능", 1))
+    cached = run(service.search_papers("인공지능", 1))
+
+    assert len(issued) == 1
+    assert len(calls) == 1
+    assert "합성 논문 제목" in fresh and "합성 논문 제목" in cached
+
+
+def test_token_failure_on_miss(upstream, monkeypatch):
+    calls = upstream(lambda request: httpx.Response(200, content=SCIENCEON_PAGE))
+
+    async def get_token():
+        return False
+
+    monkeypatch.setattr(kisti_mcp.scienceon_client, "get_token", get_token)
+
+    text = run(kisti_mcp.search_service.search_papers("인공지능", 1))
+
+    assert not calls
+    assert "토큰 발급에 실패했습니다" in text
+    assert not kisti_mcp.response_cache._entries